@@ -1,9 +1,20 @@
-from flask import Flask
+import atexit
+from flask import Flask, Response, jsonify
 from flask_cors import CORS
 from config import Config
-from rabbitmq import init_rabbitmq, close_connections
+from rabbitmq import init_rabbitmq, close_connections, get_publisher_stats
+from message import result_dispatcher
+from storage import blob_store
+from metrics import stage_histograms, PrometheusExporter
 from worker import worker_pool
 
+def shutdown():
+    """RabbitMQ 연결과 작업자 풀, 결과 발행/저장소 정리 스레드 종료 (프로세스 종료 시 호출)"""
+    close_connections()
+    worker_pool.stop()
+    result_dispatcher.shutdown()
+    blob_store.stop_cleanup()
+
 def create_app():
     app = Flask(__name__)
     
@@ -15,15 +26,16 @@ def create_app():
     # 작업자 풀 시작
     worker_pool.start()
     
+    # 클레임 체크 저장소의 만료 데이터 정리 (이 노드가 저장하지 않아도 남은 업로드가 쌓이지 않도록)
+    blob_store.start_cleanup()
+    
     # RabbitMQ 초기화
     init_success = init_rabbitmq()
     if not init_success:
         app.logger.error("RabbitMQ 초기화 실패")
     
-    @app.teardown_appcontext
-    def cleanup(exception=None):
-        close_connections()
-        worker_pool.stop()
+    # 요청마다 호출되는 teardown_appcontext가 아니라 프로세스 종료 시 한 번만 정리
+    atexit.register(shutdown)
 
     @app.after_request
     def add_headers(response):
@@ -39,6 +51,25 @@ def create_app():
         
         return response
 
+    # Prometheus 지표 (작업자 풀, 파서 단계별 시간, 결과 발행 상태)
+    metrics_exporter = PrometheusExporter(
+        worker_pool,
+        stage_histograms=stage_histograms,
+        result_dispatcher=result_dispatcher,
+        publisher_stats=get_publisher_stats
+    )
+    
+    @app.route('/metrics', methods=['GET'])
+    def metrics():
+        return Response(metrics_exporter.render(), mimetype=PrometheusExporter.CONTENT_TYPE)
+
+    # 분석 작업 취소 (대기 중이면 바로 취소, 실행 중이면 다음 단계/배치 경계에서 중단)
+    @app.route('/jobs/<project_id>/cancel', methods=['POST'])
+    def cancel_job(project_id):
+        if not worker_pool.cancel(project_id):
+            return jsonify({"projectId": project_id, "cancelled": False}), 404
+        return jsonify({"projectId": project_id, "cancelled": True}), 202
+
     # OPTIONS 요청에 대한 처리 추가
     @app.route('/', defaults={'path': ''}, methods=['OPTIONS'])
     @app.route('/<path:path>', methods=['OPTIONS'])
@@ -0,0 +1,96 @@
+"""FileCollector 디렉토리 수집 벤치마크 (rglob 후 필터링 vs scandir 가지치기 순차/병렬)
+
+큰 node_modules와 .git, build, .gradle 트리를 가진 합성 프로젝트를 만들고,
+이전 방식(rglob('*')로 모든 파일을 방문한 뒤 경로로 제외)과 현재 방식을 비교한다.
+각 방식의 수집 결과(경로, 내용, 순서)가 같은지도 확인한다.
+
+사용법 (analyzer-parser 디렉토리에서):
+    python -m benchmarks.bench_file_collector --node-modules 20000 --sources 500 --workers 1 4 8
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from parser.file_collector import FileCollector
+
+
+def write_file(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding='utf-8')
+
+
+def make_project(root, sources, node_modules, packages=200):
+    """소스 파일 sources개와 제외 디렉토리 아래 파일 약 node_modules개를 가진 프로젝트"""
+    root = Path(root)
+    write_file(root / "README.md", "# bench\n")
+    write_file(root / "build.gradle", "plugins { id 'org.springframework.boot' version '3.2.0' }\n")
+    write_file(root / "src/main/resources/application.yml", "server:\n  port: 8080\n")
+    for i in range(sources):
+        write_file(
+            root / f"src/main/java/com/example/bench/module{i % 20}/Component{i}.java",
+            f"package com.example.bench.module{i % 20};\n\npublic class Component{i} {{\n}}\n"
+        )
+    # 패키지마다 중첩 디렉토리를 두어 넓고 깊은 node_modules 구성
+    per_package = max(1, node_modules // packages)
+    for p in range(packages):
+        for j in range(per_package):
+            write_file(root / f"frontend/node_modules/pkg{p}/lib/sub{j % 5}/file{j}.js", "module.exports = {};\n")
+    for name in (".git/objects/ab", "build/classes/java/main", ".gradle/caches/8.5"):
+        for j in range(max(1, node_modules // 20)):
+            write_file(root / name / f"entry{j}.bin", "x\n")
+
+
+def legacy_collect(collector, source_dir):
+    """이전 구현: rglob으로 모든 경로를 방문한 뒤 경로 부분으로 제외"""
+    source = Path(source_dir)
+    collected = []
+    for path in source.rglob('*'):
+        if path.is_file() and collector.is_target_file(path.relative_to(source)):
+            if path.stat().st_size > collector.max_file_size_kb * 1024:
+                continue
+            content = path.read_text(encoding='utf-8', errors='ignore')
+            collected.append(collector.build_file_info(path.relative_to(source), content))
+    return collected
+
+
+def measure(func, repeat):
+    """최솟값 기준 실행 시간과 마지막 결과"""
+    best, result = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sources", type=int, default=500, help="수집 대상 Java 파일 수")
+    parser.add_argument("--node-modules", type=int, default=20000, help="제외 디렉토리 아래 파일 수")
+    parser.add_argument("--workers", type=int, nargs='+', default=[1, 4, 8], help="scandir 수집 스레드 수")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        make_project(tmp_dir, args.sources, args.node_modules)
+        total = sum(len(files) for _, _, files in os.walk(tmp_dir))
+        print(f"files on disk={total}, sources={args.sources}")
+
+        collector = FileCollector()
+        legacy_time, legacy = measure(lambda: legacy_collect(collector, tmp_dir), args.repeat)
+        print(f"{'mode':>12} {'seconds':>8} {'speedup':>8} {'files':>6} {'same':>5}")
+        print(f"{'rglob':>12} {legacy_time:>8.3f} {'1x':>8} {len(legacy):>6} {'-':>5}")
+
+        for workers in args.workers:
+            collector = FileCollector(max_workers=workers)
+            elapsed, (collected, _) = measure(lambda: collector.collect_files(tmp_dir), args.repeat)
+            same = collected == legacy
+            print(f"{f'scandir x{workers}':>12} {elapsed:>8.3f} {legacy_time / elapsed:>7.1f}x "
+                  f"{len(collected):>6} {str(same):>5}")
+
+
+if __name__ == "__main__":
+    main()
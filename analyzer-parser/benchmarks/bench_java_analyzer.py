@@ -0,0 +1,95 @@
+"""JavaAnalyzer.analyze_all 병렬 분석 확장성 벤치마크
+
+사용법 (analyzer-parser 디렉토리에서):
+    python -m benchmarks.bench_java_analyzer --files 2000 --max-workers 8
+"""
+import argparse
+import os
+import time
+
+from parser.analyzers.java_analyzer import JavaAnalyzer
+
+
+def make_java_source(index, methods=20):
+    """분석 비용이 실제 서비스 클래스와 비슷한 합성 Java 소스 생성"""
+    lines = [
+        "package com.example.bench;",
+        "",
+        "/**",
+        f" * Service number {index}",
+        " */",
+        "@Service",
+        f"public class BenchService{index} implements BenchApi {{",
+        "    @Autowired",
+        "    private BenchRepository benchRepository;",
+        "",
+    ]
+    for m in range(methods):
+        lines += [
+            f"    /** Handles operation {m} */",
+            "    @Transactional",
+            f"    public List<String> operation{m}(String name, int count) throws IllegalStateException {{",
+            "        // TODO: review branch",
+            "        if (name == null) { throw new IllegalStateException(\"name\"); }",
+            "        for (int i = 0; i < count; i++) {",
+            "            while (count > 0) { count--; }",
+            "        }",
+            "        try { benchRepository.save(name); } catch (Exception e) { return null; }",
+            "        return benchRepository.findAll().stream().map(String::valueOf).toList();",
+            "    }",
+            "",
+        ]
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def make_java_files(count):
+    return [
+        {
+            'path': f"src/main/java/com/example/bench/BenchService{i}.java",
+            'package': "src/main/java/com/example/bench",
+            'content': make_java_source(i)
+        }
+        for i in range(count)
+    ]
+
+
+def run(java_files, workers, batch_bytes, repeat):
+    analyzer = JavaAnalyzer(max_workers=workers, batch_bytes=batch_bytes, min_parallel_files=1)
+    try:
+        # 프로세스 풀 생성 비용은 측정에서 제외
+        analyzer.analyze_all(java_files[:workers])
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            analyzer.analyze_all(java_files)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+    finally:
+        analyzer.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-kb", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    java_files = make_java_files(args.files)
+    total_mb = sum(len(f['content']) for f in java_files) / (1024 * 1024)
+    print(f"files={args.files} size={total_mb:.1f}MB batch={args.batch_kb}KB cpus={os.cpu_count()}")
+
+    worker_counts = sorted({1, *[w for w in (2, 4, 8, 16, 32) if w < args.max_workers], args.max_workers})
+    baseline = None
+    print(f"{'workers':>8} {'seconds':>10} {'files/s':>10} {'speedup':>8}")
+    for workers in worker_counts:
+        elapsed = run(java_files, workers, args.batch_kb * 1024, args.repeat)
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {elapsed:>10.3f} {args.files / elapsed:>10.0f} {baseline / elapsed:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Java 파일 하나당 추출 비용 벤치마크 (정규식 다중 스캔 vs 단일 토큰 스캔)
+
+이전 방식은 추출기마다 파일 전체를 정규식으로 다시 훑었고(파일당 10회 이상),
+현재 방식은 JavaLexer로 한 번 토큰화한 뒤 모든 추출기가 토큰 스트림을 읽는다.
+
+사용법 (analyzer-parser 디렉토리에서):
+    python -m benchmarks.bench_java_lexer --methods 5 20 80 --repeat 200
+"""
+import argparse
+import re
+import time
+
+from benchmarks.bench_java_analyzer import make_java_source
+from parser.analyzers.business_analyzer import BusinessAnalyzer
+from parser.analyzers.java_analyzer import JavaAnalyzer
+from parser.project_index import ProjectIndex
+
+
+# 이전 방식의 스캔 (비교용으로 패턴만 그대로 옮김)
+LEGACY_PATTERNS = [
+    (r'(public|private|protected)?\s*(class|interface|enum|@interface)\s+(\w+)(?:\s+extends\s+(\w+))?(?:\s+implements\s+([\w\s,]+))?', 0),
+    (r'(public|private|protected)?\s+(?:static\s+)?(?:final\s+)?([\w<>\[\]]+)\s+(\w+)\s*(?:=\s*[^;]+)?;', 0),
+    (r'(public|private|protected)?\s+(?:static\s+)?(?:final\s+)?([\w<>\[\]]+)\s+(\w+)\s*\((.*?)\)\s*(?:throws\s+[\w,\s]+)?\s*(\{|\;)', 0),
+    (r'@(\w+)(?:\([^)]*\))?', 0),
+    (r'\b(public|private|protected)\s+[\w<>\[\]]+\s+\w+\s*\([^)]*\)\s*(\{|throws)', 0),
+    (r'\b(if|else if|case)\b', 0),
+    (r'\b(for|while|do)\b', 0),
+    (r'\btry\b', 0),
+    (r'/\*\*\s*(.*?)\s*\*/', re.DOTALL),
+    (r'(?://|/\*|^\s*\*)\s*(TODO|FIXME):\s*(.*?)(?:\*/|\n)', re.MULTILINE),
+    (r'@Autowired\s+private', 0),
+    (r'@Autowired\s+(?:public|protected|private)\s+void\s+set', 0),
+    (r'@Profile\(["\']([^"\']+)["\']\)', 0),
+    (r'@Value\(["\'](\$\{[^"\']+\})["\']', 0),
+]
+LEGACY_COMPILED = [re.compile(pattern, flags) for pattern, flags in LEGACY_PATTERNS]
+
+
+def legacy_scan(content):
+    """이전 추출기들이 파일마다 수행하던 정규식 스캔"""
+    for pattern in LEGACY_COMPILED:
+        for _ in pattern.finditer(content):
+            pass
+    content.lower()
+
+
+def token_scan(analyzer, business_analyzer, file_info):
+    """현재 방식: 단일 토큰화 + 토큰 기반 추출 + Spring 특성 분석"""
+    result = analyzer.analyze_file(file_info)
+    business_analyzer.analyze_spring_features(ProjectIndex([result]))
+
+
+def measure(func, repeat):
+    best = None
+    for _ in range(3):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        elapsed = (time.perf_counter() - started) / repeat
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--methods", type=int, nargs='+', default=[5, 20, 80], help="파일당 메서드 수")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    
+    analyzer = JavaAnalyzer()
+    business_analyzer = BusinessAnalyzer()
+    
+    print(f"legacy passes/file={len(LEGACY_COMPILED) + 1}, token passes/file=1")
+    print(f"{'methods':>8} {'bytes':>8} {'legacy ms':>10} {'token ms':>10} {'speedup':>8}")
+    for methods in args.methods:
+        content = make_java_source(0, methods=methods)
+        file_info = {
+            'path': "src/main/java/com/example/bench/BenchService0.java",
+            'package': "src/main/java/com/example/bench",
+            'content': content
+        }
+        legacy = measure(lambda: legacy_scan(content), args.repeat)
+        token = measure(lambda: token_scan(analyzer, business_analyzer, file_info), args.repeat)
+        print(f"{methods:>8} {len(content):>8} {legacy * 1000:>10.3f} {token * 1000:>10.3f} {legacy / token:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
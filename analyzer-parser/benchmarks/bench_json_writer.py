@@ -0,0 +1,109 @@
+"""FullData 저장 벤치마크 (json.dump(indent=2) vs 스트리밍 작성기 들여쓰기/압축 모드)
+
+모드마다 새 프로세스에서 같은 합성 프로젝트를 만든 뒤 저장하고,
+저장 시간·처리량과 저장 중 늘어난 최대 RSS(ru_maxrss 증가분)를 비교한다.
+
+사용법 (analyzer-parser 디렉토리에서):
+    python -m benchmarks.bench_json_writer --files 20000 --file-kb 8
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from parser.models.full import FullData
+
+MODES = ("legacy", "stream", "compact")
+
+
+def make_full_data(files, file_kb):
+    """파일 files개, 파일당 약 file_kb KB 내용을 가진 합성 분석 결과"""
+    full_data = FullData("bench-project")
+    line = "    public String operation(String name) { return repository.find(name); }  // 한글 주석\n"
+    body = line * max(1, (file_kb * 1024) // len(line.encode('utf-8')))
+    files_info = [
+        {
+            'path': f"src/main/java/com/example/bench/Component{i}.java",
+            'package': "src/main/java/com/example/bench",
+            'content': f"package com.example.bench;\n\npublic class Component{i} {{\n{body}}}\n",
+            'file_type': 'service',
+            'class_info': {'name': f"Component{i}"},
+            'complexity': {'lines': 100, 'methods': 10, 'cyclomatic': 5},
+            'javadocs': [{'content': "Handles operation", 'position': 10}],
+            'todos': [{'type': 'TODO', 'content': "review", 'line': 3}]
+        }
+        for i in range(files)
+    ]
+    full_data.add_source_files(files_info, lambda f: full_data.make_source_file(
+        path=f['path'], package=f['package'], content=f['content'], file_type=f['file_type'],
+        class_name=f['class_info']['name'], complexity=f['complexity'],
+        javadocs=f['javadocs'], todos=f['todos']
+    ))
+    for i in range(min(files, 2000)):
+        full_data.add_endpoint("GET", f"/api/component/{i}", f"get{i}", response_type="String")
+        full_data.relationships.append({'source': f"Component{i}", 'target': f"Component{i + 1}", 'type': 'autowires'})
+    return full_data
+
+
+def max_rss_mb():
+    """현재 프로세스의 최대 RSS (MB, 리눅스 ru_maxrss는 KB 단위)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_mode(mode, files, file_kb, repeat):
+    """한 가지 저장 방식 측정 (새 프로세스 안에서 실행, 디스크 편차를 줄이려 최솟값 사용)"""
+    full_data = make_full_data(files, file_kb)
+    baseline = max_rss_mb()
+    best = None
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "analysis.json")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            if mode == "legacy":
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(full_data.to_dict(), f, indent=2, ensure_ascii=False)
+            else:
+                full_data.save_to_file(path, compact=(mode == "compact"))
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        size = os.path.getsize(path)
+    return {
+        'mode': mode,
+        'seconds': best,
+        'mb': size / 1024 / 1024,
+        'rss_delta_mb': max_rss_mb() - baseline
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=20000, help="소스 파일 수")
+    parser.add_argument("--file-kb", type=int, default=8, help="파일당 내용 크기 (KB)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.files, args.file_kb, args.repeat)))
+        return
+
+    print(f"files={args.files}, file_kb={args.file_kb}")
+    print(f"{'mode':>8} {'seconds':>8} {'MB':>8} {'MB/s':>8} {'peak RSS +MB':>13}")
+    for mode in MODES:
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_json_writer",
+             "--files", str(args.files), "--file-kb", str(args.file_kb),
+             "--repeat", str(args.repeat), "--mode", mode],
+            check=True, capture_output=True, text=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(f"{mode:>8} {result['seconds']:>8.2f} {result['mb']:>8.1f} "
+              f"{result['mb'] / result['seconds']:>8.1f} {result['rss_delta_mb']:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""RelationshipAnalyzer @Autowired 의존성 분석 벤치마크 (클래스 쌍별 정규식 vs 주입 지점 식별자 색인)
+
+이전 방식은 클래스마다 모든 클래스 이름으로 re.search(r'@Autowired[^;]*' + 이름)를 실행했고(N² 회),
+현재 방식은 class_info['injections']의 타입 식별자를 클래스 맵에서 해시 조회한다.
+
+사용법 (analyzer-parser 디렉토리에서):
+    python -m benchmarks.bench_relationship_analyzer --classes 250 500 1000 5000
+"""
+import argparse
+import random
+import re
+import time
+
+from parser.analyzers.java_analyzer import JavaAnalyzer
+from parser.analyzers.relationship_analyzer import RelationshipAnalyzer
+from parser.project_index import ProjectIndex
+
+
+def make_java_source(index, dependencies):
+    """필드/생성자/Lombok 주입을 섞어 쓰는 합성 서비스 클래스"""
+    style = index % 3
+    lines = ["package com.example.bench;", "", "@Service"]
+    if style == 2:
+        lines.append("@RequiredArgsConstructor")
+    lines.append(f"public class Component{index} {{")
+    for dependency in dependencies:
+        if style == 0:
+            lines += ["    @Autowired", f"    private Component{dependency} component{dependency};"]
+        else:
+            lines.append(f"    private final Component{dependency} component{dependency};")
+    if style == 1:
+        params = ", ".join(f"Component{d} component{d}" for d in dependencies)
+        lines += ["", "    @Autowired", f"    public Component{index}({params}) {{"]
+        lines += [f"        this.component{d} = component{d};" for d in dependencies]
+        lines.append("    }")
+    lines += [
+        "",
+        "    public String describe(String name) {",
+        "        return name + \"-\" + this.getClass().getSimpleName();",
+        "    }",
+        "}",
+    ]
+    return "\n".join(lines)
+
+
+def make_project(count, fan_out=3, seed=7):
+    """클래스마다 fan_out개의 다른 클래스를 주입받는 프로젝트 색인"""
+    rng = random.Random(seed)
+    analyzer = JavaAnalyzer()
+    files = []
+    for i in range(count):
+        dependencies = rng.sample([j for j in range(count) if j != i], min(fan_out, count - 1))
+        files.append(analyzer.analyze_file({
+            'path': f"src/main/java/com/example/bench/Component{i}.java",
+            'package': "src/main/java/com/example/bench",
+            'content': make_java_source(i, dependencies)
+        }))
+    return ProjectIndex(files)
+
+
+def legacy_autowired(project_index):
+    """이전 구현: 클래스 쌍마다 컴파일되지 않은 정규식 검색"""
+    class_map = project_index.class_map()
+    relationships = []
+    for source_class, source_info in class_map.items():
+        content = source_info['content']
+        for target_class in class_map.keys():
+            if re.search(r'@Autowired[^;]*' + target_class, content):
+                relationships.append((source_class, target_class))
+    return relationships
+
+
+def indexed_autowired(analyzer, project_index):
+    """현재 구현: 주입 지점 식별자 색인 + 해시 조회"""
+    class_map = project_index.class_map()
+    relationships = []
+    for source_class, source_info in class_map.items():
+        analyzer.analyze_autowired_dependencies(relationships, source_class, source_info, class_map)
+    return [(rel['source'], rel['target']) for rel in relationships]
+
+
+def measure(func):
+    started = time.perf_counter()
+    result = func()
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--classes", type=int, nargs='+', default=[250, 500, 1000, 5000], help="프로젝트 클래스 수")
+    parser.add_argument("--fan-out", type=int, default=3, help="클래스당 주입받는 의존성 수")
+    parser.add_argument("--legacy-limit", type=int, default=1000, help="이 클래스 수를 넘으면 이전 구현은 측정하지 않음")
+    args = parser.parse_args()
+
+    analyzer = RelationshipAnalyzer()
+    print(f"{'classes':>8} {'legacy s':>10} {'indexed s':>10} {'speedup':>9} {'legacy':>8} {'indexed':>8}")
+    for count in args.classes:
+        project_index = make_project(count, args.fan_out)
+        indexed_time, indexed = measure(lambda: indexed_autowired(analyzer, project_index))
+        if count > args.legacy_limit:
+            print(f"{count:>8} {'-':>10} {indexed_time:>10.4f} {'-':>9} {'-':>8} {len(indexed):>8}")
+            continue
+        legacy_time, legacy = measure(lambda: legacy_autowired(project_index))
+        # 이전 구현의 개수에는 Component1 → Component12 같은 부분 문자열 오탐이 포함됨
+        print(f"{count:>8} {legacy_time:>10.4f} {indexed_time:>10.4f} {legacy_time / indexed_time:>8.0f}x "
+              f"{len(legacy):>8} {len(indexed):>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""작업 대기열 정책 시뮬레이션 (fifo vs sjf vs weighted, 에이징 포함)
+
+작은 학생 프로젝트가 대부분이고 가끔 큰 모노레포가 섞여 들어오는 부하를 가상 시계로 시뮬레이션한다.
+WorkerPool이 쓰는 TaskQueue를 그대로 사용하고, 작업 처리 시간은 예상 비용에 비례한다고 본다.
+정책별로 완료 시간(도착 → 완료)의 평균/p95와 큰 작업의 최대 대기 시간을 비교한다.
+
+사용법 (analyzer-parser 디렉토리에서):
+    python -m benchmarks.bench_scheduling --jobs 5000 --workers 4 --load 0.9
+"""
+import argparse
+import heapq
+import random
+import statistics
+
+from worker.scheduling import TaskQueue, estimate_cost
+from worker.worker_pool import Task
+
+MB = 1024 * 1024
+
+
+def make_jobs(count, large_ratio, seed):
+    """(이름, 비용, 가중치, 큰 작업 여부) 목록 - 작은 작업 약 50KB, 큰 작업 약 500MB"""
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        large = rng.random() < large_ratio
+        if large:
+            size = int(rng.uniform(300, 700) * MB)
+            java_files = rng.randint(5000, 20000)
+        else:
+            size = int(rng.lognormvariate(10.8, 0.6))  # 중앙값 약 50KB
+            java_files = rng.randint(3, 40)
+        # weighted 정책 비교용: 일부 작업은 메시지 priority를 높게 지정
+        weight = 4.0 if rng.random() < 0.1 else 1.0
+        jobs.append((f"job-{i}", estimate_cost(size, java_files, 16 * 1024), weight, large))
+    return jobs
+
+
+def simulate(jobs, workers, throughput, load, policy, aging_rate, seed):
+    """가상 시계 기반 이산 사건 시뮬레이션, 작업별 (완료 시간, 대기 시간, 큰 작업 여부) 반환
+
+    throughput(바이트/초)으로 처리 시간을 정하고, 평균 사용률이 load가 되도록 도착 간격을 정한다.
+    """
+    rng = random.Random(seed)
+    mean_service = statistics.mean(cost for _, cost, _, _ in jobs) / throughput
+    mean_interval = mean_service / (workers * load)
+
+    now = [0.0]
+    task_queue = TaskQueue(policy=policy, aging_rate=aging_rate, clock=lambda: now[0])
+    arrivals = []
+    t = 0.0
+    for name, cost, weight, large in jobs:
+        t += rng.expovariate(1 / mean_interval)
+        arrivals.append((t, Task(name, None, cost=cost, weight=weight), large))
+
+    running = []  # (완료 시각, 순번) 최소 힙
+    free = workers
+    arrived_at, started_at, is_large = {}, {}, {}
+    results = []
+    index, sequence = 0, 0
+    while index < len(arrivals) or running or task_queue.qsize():
+        # 다음 사건(도착 또는 완료) 시각으로 이동
+        next_arrival = arrivals[index][0] if index < len(arrivals) else float('inf')
+        next_finish = running[0][0] if running else float('inf')
+        now[0] = min(next_arrival, next_finish)
+
+        while running and running[0][0] <= now[0]:
+            _, _, task = heapq.heappop(running)
+            free += 1
+            results.append((now[0] - arrived_at[task.task_id],
+                            started_at[task.task_id] - arrived_at[task.task_id], is_large[task.task_id]))
+        while index < len(arrivals) and arrivals[index][0] <= now[0]:
+            arrival, task, large = arrivals[index]
+            arrived_at[task.task_id], is_large[task.task_id] = arrival, large
+            task_queue.put(task)
+            index += 1
+        while free and task_queue.qsize():
+            task = task_queue.get()
+            started_at[task.task_id] = now[0]
+            free -= 1
+            sequence += 1
+            heapq.heappush(running, (now[0] + task.cost / throughput, sequence, task))
+    return results
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--large-ratio", type=float, default=0.01, help="큰 작업 비율")
+    parser.add_argument("--throughput-mb", type=float, default=20, help="작업자 하나의 처리량 (MB/s)")
+    parser.add_argument("--load", type=float, default=0.9, help="평균 작업자 사용률")
+    parser.add_argument("--aging-mb", type=float, nargs='+', default=[0, 1, 5], help="에이징 (MB/s)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    jobs = make_jobs(args.jobs, args.large_ratio, args.seed)
+    throughput = args.throughput_mb * MB
+    print(f"jobs={args.jobs} workers={args.workers} large={args.large_ratio:.1%} load={args.load}")
+    print(f"{'policy':>10} {'aging':>6} {'mean s':>8} {'p95 s':>8} {'small p95':>10} "
+          f"{'large mean':>11} {'large max wait':>15}")
+    configs = [("fifo", 0)] + [(policy, aging) for policy in ("sjf", "weighted") for aging in args.aging_mb]
+    for policy, aging in configs:
+        results = simulate(jobs, args.workers, throughput, args.load, policy, aging * MB, args.seed)
+        completion = [done for done, _, _ in results]
+        small = [done for done, _, large in results if not large]
+        large = [(done, wait) for done, wait, is_large in results if is_large]
+        large_mean = statistics.mean(done for done, _ in large) if large else 0
+        large_wait = max(wait for _, wait in large) if large else 0
+        print(f"{policy:>10} {aging:>6g} {statistics.mean(completion):>8.2f} {percentile(completion, 95):>8.2f} "
+              f"{percentile(small, 95):>10.2f} {large_mean:>11.1f} {large_wait:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
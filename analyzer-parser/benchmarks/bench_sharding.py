@@ -0,0 +1,129 @@
+"""샤드 분석(ShardCoordinator/ShardWorker) 검증 및 오버헤드 측정 (LocalBroker 사용)
+
+합성 Spring Boot 프로젝트를 한 번은 그대로, 한 번은 프로세스 내부 브로커를 거쳐 샤드 작업자 여러 개로
+나누어 분석한 뒤 결과 JSON이 같은지 확인한다. --lose/--fail 비율만큼 샤드의 첫 시도를 잃어버리거나
+실패로 응답하게 하여 샤드 단위 재시도도 함께 확인한다.
+작업자가 모두 한 프로세스에 있으므로 시간은 직렬화/전달 오버헤드를 보는 용도다 (노드 간 속도 향상이 아님).
+
+사용법 (analyzer-parser 디렉토리에서):
+    python -m benchmarks.bench_sharding --tier medium --workers 4 --shard-kb 256 --lose 0.2 --fail 0.2
+"""
+import argparse
+import json
+import logging
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from benchmarks.spring_project import SpringProjectGenerator, add_spec_arguments, spec_from_args
+from parser.analyzers.java_analyzer import JavaAnalyzer
+from parser.process import ParserProcess
+from parser.sharding import ShardCoordinator, ShardWorker
+from rabbitmq.local_broker import LocalBroker
+
+TASK_KEY = "analysis.shard"
+RESULT_KEY = "analysis.shard.result"
+
+
+class FaultInjector:
+    """샤드 메시지의 첫 시도 일부를 잃어버리거나(ACK만 하고 응답 없음) 실패 결과로 응답"""
+
+    def __init__(self, worker, publish, lose, fail, seed):
+        self.worker = worker
+        self.publish = publish
+        self.lose = lose
+        self.fail = fail
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.lost = 0
+        self.failed = 0
+
+    def on_message(self, body, properties=None, on_complete=None):
+        task = json.loads(body)
+        if task['attempt'] == 1:
+            with self.lock:
+                roll = self.rng.random()
+                if roll < self.lose:
+                    self.lost += 1
+                    on_complete()
+                    return True
+                if roll < self.lose + self.fail:
+                    self.failed += 1
+                    self.publish(task['replyTo'], json.dumps({
+                        "jobId": task['jobId'], "shard": task['shard'], "attempt": task['attempt'],
+                        "success": False, "error": "주입된 오류"
+                    }))
+                    on_complete()
+                    return True
+        return self.worker.on_message(body, properties, on_complete)
+
+
+def analyze(parser_process, source_dir, output_dir):
+    """분석 실행 후 (소요 시간, 생성 시각을 뺀 결과 JSON) 반환"""
+    started = time.perf_counter()
+    result = parser_process.process_project(source_dir, output_dir)
+    elapsed = time.perf_counter() - started
+    if not result['success']:
+        raise RuntimeError(result['error'])
+    with open(result['analysis_file'], encoding='utf-8') as f:
+        data = json.load(f)
+    data['projectSummary'].pop('generated', None)
+    return elapsed, data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_spec_arguments(parser)
+    parser.add_argument("--workers", type=int, default=4, help="샤드 작업자(노드) 수")
+    parser.add_argument("--shard-kb", type=int, default=256)
+    parser.add_argument("--shard-timeout", type=float, default=2.0, help="샤드 시도 하나의 제한 시간 (초)")
+    parser.add_argument("--max-attempts", type=int, default=3)
+    parser.add_argument("--lose", type=float, default=0.0, help="첫 시도를 잃어버릴 샤드 비율")
+    parser.add_argument("--fail", type=float, default=0.0, help="첫 시도를 실패로 응답할 샤드 비율")
+    parser.add_argument("--fault-seed", type=int, default=7)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    broker = LocalBroker()
+    coordinator = ShardCoordinator(
+        "bench-node", TASK_KEY, RESULT_KEY, shard_bytes=args.shard_kb * 1024, min_files=1,
+        timeout=args.shard_timeout, max_attempts=args.max_attempts, publish=broker.publish
+    )
+    broker.bind("shard.queue", TASK_KEY)
+    broker.bind("shard.result.bench-node", coordinator.reply_to)
+    broker.consume("shard.result.bench-node", coordinator.on_result, prefetch_count=100)
+    injectors = []
+    for i in range(args.workers):
+        worker = ShardWorker(JavaAnalyzer(), publish=broker.publish)
+        injector = FaultInjector(worker, broker.publish, args.lose, args.fail, args.fault_seed + i)
+        injectors.append(injector)
+        broker.consume("shard.queue", injector.on_message)
+
+    generator = SpringProjectGenerator(spec_from_args(args))
+    with tempfile.TemporaryDirectory() as tmp:
+        source_dir = generator.write(Path(tmp) / "bench-project")
+        local_dir, sharded_dir = Path(tmp) / "local", Path(tmp) / "sharded"
+        local_dir.mkdir()
+        sharded_dir.mkdir()
+
+        local_time, local_data = analyze(ParserProcess(), source_dir, local_dir)
+        sharded_time, sharded_data = analyze(ParserProcess(shard_coordinator=coordinator), source_dir, sharded_dir)
+
+    broker.stop()
+    java_files = sum(1 for path in generator.generate() if path.endswith('.java'))
+    print(json.dumps({
+        'javaFiles': java_files,
+        'workers': args.workers,
+        'localSeconds': round(local_time, 3),
+        'shardedSeconds': round(sharded_time, 3),
+        'lostFirstAttempts': sum(injector.lost for injector in injectors),
+        'failedFirstAttempts': sum(injector.failed for injector in injectors),
+        'broker': broker.get_stats(),
+        'identical': local_data == sharded_data
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
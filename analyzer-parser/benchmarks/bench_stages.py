@@ -0,0 +1,185 @@
+"""ParserProcess.process_project 단계별 벤치마크 (합성 Spring Boot 프로젝트, 규모 단계별)
+
+process_project와 같은 순서로 각 단계를 따로 실행하며 시간을 재고,
+결과는 실행 간 비교할 수 있도록 JSON으로 출력한다 (--compare로 이전 결과와 비교).
+
+사용법 (analyzer-parser 디렉토리에서):
+    python -m benchmarks.bench_stages --tiers small medium large --output stages.json
+    python -m benchmarks.bench_stages --tiers medium --compare stages.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+
+from benchmarks.spring_project import TIERS, SpringProjectGenerator
+from parser.ast_store import AstStore
+from parser.process import ParserProcess
+
+STAGES = (
+    "collect", "structure", "build", "config", "java",
+    "relationships", "business", "endpoints", "generation", "save",
+)
+
+
+def run_stages(parser_process, source_dir, output_dir):
+    """process_project의 단계를 순서대로 실행하며 단계별 소요 시간(초) 반환"""
+    timings = {}
+    state = {}
+
+    def stage(name, func):
+        started = time.perf_counter()
+        result = func()
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - started
+        return result
+
+    p = parser_process
+    project_index = stage("collect", lambda: p.file_collector.collect_index(source_dir))
+    structure_info = stage("structure", lambda: p.structure_analyzer.analyze(project_index))
+    project_info = stage("build", lambda: p.build_analyzer.analyze(project_index.of_type('build')))
+    config_info = stage("config", lambda: p.config_analyzer.analyze(project_index.of_type('config')))
+
+    def analyze_java():
+        analyzed = p.java_analyzer.analyze_all(project_index.java_files(), {})
+        project_index.update(analyzed)
+        return analyzed
+    analyzed_java_files = stage("java", analyze_java)
+    all_files = project_index.other_files()
+    all_files.extend(analyzed_java_files)
+
+    ast_store = AstStore()
+    relationships = stage("relationships", lambda: p.relationship_analyzer.analyze(project_index))
+
+    def analyze_business():
+        state['business_objects'] = p.business_analyzer.find_business_objects(project_index, ast_store)
+        state['business_logic'] = p.business_analyzer.extract_logic(project_index)
+        state['data_flows'] = p.business_analyzer.analyze_flows(project_index, relationships, ast_store)
+        state['spring_features'] = p.business_analyzer.analyze_spring_features(project_index)
+    stage("business", analyze_business)
+    endpoints = stage("endpoints", lambda: p.endpoint_analyzer.analyze(project_index, ast_store))
+
+    def generate():
+        full_data = p.data_generator.create_full_data(
+            Path(source_dir).name, project_info, structure_info, project_index.readme_content,
+            config_info, all_files, relationships, state['business_objects'],
+            endpoints, state['business_logic'], state['data_flows'], state['spring_features']
+        )
+        summary_data = p.summary_generator.generate(
+            Path(source_dir).name, project_info, structure_info,
+            endpoints, state['business_objects'], analyzed_java_files
+        )
+        return full_data, summary_data
+    full_data, summary_data = stage("generation", generate)
+
+    def save():
+        full_data.save_to_file(Path(output_dir) / "analysis.json", compact=p.compact_json)
+        summary_data.save_to_file(Path(output_dir) / "summary.json", compact=p.compact_json)
+    stage("save", save)
+
+    timings["total"] = sum(timings.values())
+    return timings, {'files': len(all_files), 'java_files': len(analyzed_java_files), 'endpoints': len(endpoints)}
+
+
+def bench_tier(tier, repeat):
+    """규모 단계 하나를 repeat번 실행하여 단계별 최솟값/중앙값 집계"""
+    spec = TIERS[tier]
+    runs = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source_dir = Path(tmp_dir) / "bench-project"
+        output_dir = Path(tmp_dir) / "output"
+        output_dir.mkdir()
+        SpringProjectGenerator(spec).write(source_dir)
+        size = sum(f.stat().st_size for f in source_dir.rglob('*') if f.is_file())
+
+        for _ in range(repeat):
+            # 파일 캐시 없이 매번 새 ParserProcess로 측정 (단계 간 상태 공유 없음)
+            timings, counts = run_stages(ParserProcess(), source_dir, output_dir)
+            runs.append(timings)
+
+    return {
+        'tier': tier,
+        'spec': asdict(spec),
+        'project_bytes': size,
+        'counts': counts,
+        'repeat': repeat,
+        'stages': {
+            name: {
+                'min': min(run[name] for run in runs),
+                'median': statistics.median(run[name] for run in runs)
+            }
+            for name in STAGES + ("total",)
+        }
+    }
+
+
+def environment():
+    """결과 비교에 필요한 실행 환경 정보"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count()
+    }
+
+
+def print_table(report, baseline=None):
+    """단계별 최솟값(ms) 표 출력 (baseline이 있으면 이전 결과 대비 비율 포함)"""
+    previous = {tier['tier']: tier for tier in (baseline or {}).get('tiers', [])}
+    for tier in report['tiers']:
+        counts = tier['counts']
+        print(f"\n[{tier['tier']}] files={counts['files']} java={counts['java_files']} "
+              f"endpoints={counts['endpoints']} size={tier['project_bytes'] / 1024:.0f}KB", file=sys.stderr)
+        print(f"{'stage':>14} {'min ms':>10} {'median ms':>10}" + (f" {'vs base':>8}" if baseline else ""),
+              file=sys.stderr)
+        for name in STAGES + ("total",):
+            stats = tier['stages'][name]
+            line = f"{name:>14} {stats['min'] * 1000:>10.1f} {stats['median'] * 1000:>10.1f}"
+            base = previous.get(tier['tier'], {}).get('stages', {}).get(name)
+            if base and base['min'] > 0:
+                line += f" {stats['min'] / base['min']:>7.2f}x"
+            print(line, file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tiers", nargs='+', choices=sorted(TIERS), default=["small", "medium"])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (없으면 표준 출력)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    args = parser.parse_args()
+
+    report = {
+        'environment': environment(),
+        'tiers': [bench_tier(tier, args.repeat) for tier in args.tiers]
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_table(report, baseline)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
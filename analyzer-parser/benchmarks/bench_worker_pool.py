@@ -0,0 +1,85 @@
+"""WorkerPool 작업 시작 지연(대기열 추가 → 실행 시작) 마이크로벤치마크
+
+사용법 (analyzer-parser 디렉토리에서):
+    python -m benchmarks.bench_worker_pool --tasks 2000 --workers 4 --work-ms 1
+"""
+import argparse
+import statistics
+import threading
+import time
+
+from worker.worker_pool import WorkerPool
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run(tasks, workers, work_ms, interval_ms):
+    """작업마다 (실행 시작 시각 - 슬롯이 비어 있던 시각) 지연을 측정
+
+    대기열에 쌓여 작업자를 기다린 시간은 풀 구현과 무관하므로,
+    제출 시각과 직전 작업 완료 시각 중 늦은 쪽을 기준으로 삼는다.
+    """
+    pool = WorkerPool(max_workers=workers, queue_size=tasks)
+    lock = threading.Lock()
+    free_slots = [0.0] * workers  # 각 슬롯이 비는 시각 (최소 힙 대신 단순 목록)
+    latencies = []
+    done = threading.Event()
+    finished = [0]
+
+    def job(enqueued_at):
+        started = time.perf_counter()
+        with lock:
+            # 가장 먼저 빈 슬롯을 이 작업이 사용했다고 본다
+            slot = min(range(workers), key=free_slots.__getitem__)
+            ready_at = max(enqueued_at, free_slots[slot])
+            latencies.append(started - ready_at)
+        if work_ms:
+            time.sleep(work_ms / 1000)
+        with lock:
+            free_slots[slot] = time.perf_counter()
+
+    def on_done(task_id, result, error):
+        with lock:
+            finished[0] += 1
+            if finished[0] == tasks:
+                done.set()
+
+    pool.start()
+    try:
+        started = time.perf_counter()
+        for i in range(tasks):
+            pool.submit(f"bench-{i}", job, time.perf_counter(), callback=on_done)
+            if interval_ms:
+                time.sleep(interval_ms / 1000)
+        done.wait()
+        elapsed = time.perf_counter() - started
+    finally:
+        pool.stop()
+
+    return latencies, elapsed, pool.get_stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--work-ms", type=float, default=1.0, help="작업 하나의 실행 시간")
+    parser.add_argument("--interval-ms", type=float, default=0.0, help="제출 간격 (0이면 한꺼번에 제출)")
+    args = parser.parse_args()
+
+    latencies, elapsed, stats = run(args.tasks, args.workers, args.work_ms, args.interval_ms)
+    ms = [value * 1000 for value in latencies]
+    print(f"tasks={args.tasks} workers={args.workers} work={args.work_ms}ms interval={args.interval_ms}ms")
+    print(f"enqueue-to-start latency (ms): mean={statistics.mean(ms):.3f} "
+          f"p50={percentile(ms, 50):.3f} p95={percentile(ms, 95):.3f} "
+          f"p99={percentile(ms, 99):.3f} max={max(ms):.3f}")
+    print(f"throughput: {args.tasks / elapsed:.0f} tasks/s "
+          f"(completed={stats['completed']}, failed={stats['failed']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,420 @@
+"""벤치마크용 합성 Spring Boot 프로젝트 생성기
+
+도메인(entity) 하나마다 Repository/Service/Controller/DTO가 서로 주입·참조하는 실제와 비슷한 구조를 만들고,
+컨트롤러/서비스/리포지토리/엔티티/DTO/설정 파일 수와 파일 크기를 각각 지정할 수 있다.
+
+사용법 (analyzer-parser 디렉토리에서):
+    python -m benchmarks.spring_project /tmp/bench-project --tier medium
+    python -m benchmarks.spring_project /tmp/bench-project --controllers 40 --services 60 --file-kb 8 --zip
+"""
+import argparse
+import io
+import json
+import random
+import zipfile
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+
+BASE_PACKAGE = "com.example.bench"
+
+
+@dataclass
+class ProjectSpec:
+    """생성할 프로젝트 규모 (file_kb는 Java 파일 하나의 대략적인 최소 크기)"""
+    controllers: int = 10
+    services: int = 15
+    repositories: int = 10
+    entities: int = 10
+    dtos: int = 20
+    config_files: int = 3
+    methods: int = 6
+    file_kb: int = 2
+    seed: int = 7
+
+
+# 벤치마크 규모 단계
+TIERS = {
+    'small': ProjectSpec(controllers=5, services=8, repositories=5, entities=5, dtos=10, config_files=2),
+    'medium': ProjectSpec(controllers=40, services=60, repositories=40, entities=40, dtos=80, config_files=6),
+    'large': ProjectSpec(controllers=200, services=300, repositories=200, entities=200, dtos=400,
+                         config_files=12, methods=8, file_kb=4),
+}
+
+
+class SpringProjectGenerator:
+    """ProjectSpec으로 {상대 경로: 내용} 형태의 프로젝트 파일 생성"""
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+
+    def generate(self):
+        """프로젝트 파일 사전 생성"""
+        spec = self.spec
+        files = {
+            "README.md": "# Bench Project\n\n합성 Spring Boot 프로젝트 (벤치마크용)\n",
+            "build.gradle": self.build_gradle(),
+            "settings.gradle.kts": 'rootProject.name = "bench-project"\n',
+        }
+        files.update(self.config_files(spec.config_files))
+        for i in range(spec.entities):
+            files[self.java_path("domain", self.entity(i))] = self.entity_source(i)
+        for i in range(spec.repositories):
+            files[self.java_path("repository", self.repository(i))] = self.repository_source(i)
+        for i in range(spec.dtos):
+            files[self.java_path("dto", self.dto(i))] = self.dto_source(i)
+        for i in range(spec.services):
+            files[self.java_path("service", self.service(i))] = self.service_source(i)
+        for i in range(spec.controllers):
+            files[self.java_path("controller", self.controller(i))] = self.controller_source(i)
+        files[self.java_path("", "BenchApplication")] = self.application_source()
+        return files
+
+    def write(self, root):
+        """디렉토리에 프로젝트 파일 쓰기"""
+        root = Path(root)
+        for relative_path, content in self.generate().items():
+            path = root / relative_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding='utf-8')
+        return root
+
+    def to_zip(self, folder="bench-project"):
+        """업로드 메시지와 같은 형태의 ZIP 바이트 생성 (최상위 폴더 하나 아래에 프로젝트)"""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+            for relative_path, content in self.generate().items():
+                zip_file.writestr(f"{folder}/{relative_path}", content)
+        return buffer.getvalue()
+
+    # 이름 규칙 (개수가 서로 달라도 참조 대상은 항상 존재하도록 나머지 연산 사용)
+    def entity(self, i):
+        return f"Item{i}"
+
+    def repository(self, i):
+        return f"{self.entity(i % max(1, self.spec.entities))}Repository{i}"
+
+    def dto(self, i):
+        return f"{self.entity(i % max(1, self.spec.entities))}Dto{i}"
+
+    def service(self, i):
+        return f"{self.entity(i % max(1, self.spec.entities))}Service{i}"
+
+    def controller(self, i):
+        return f"{self.entity(i % max(1, self.spec.entities))}Controller{i}"
+
+    def java_path(self, layer, name):
+        package = BASE_PACKAGE.replace('.', '/') + (f"/{layer}" if layer else "")
+        return f"src/main/java/{package}/{name}.java"
+
+    def header(self, layer, imports):
+        lines = [f"package {BASE_PACKAGE}.{layer};", ""]
+        lines += [f"import {name};" for name in imports]
+        lines += [f"import {BASE_PACKAGE}.{other}.*;" for other in ("domain", "dto", "repository", "service")
+                  if other != layer]
+        return lines + [""]
+
+    def pad(self, lines):
+        """파일이 file_kb보다 작으면 Javadoc이 달린 보조 메서드를 덧붙임 (마지막 줄은 닫는 괄호)"""
+        target = self.spec.file_kb * 1024
+        size = sum(len(line) + 1 for line in lines)
+        helper = 0
+        body = lines[:-1]
+        while size < target:
+            block = [
+                "",
+                f"    /** 보조 계산 {helper} - 입력 값을 정규화한다 */",
+                f"    private int normalize{helper}(int value) {{",
+                "        // TODO: 경계값 검토",
+                "        if (value < 0) {",
+                "            return -value;",
+                "        }",
+                "        int result = 0;",
+                "        for (int i = 0; i < value; i++) {",
+                "            result += i % 3 == 0 ? i : 1;",
+                "        }",
+                "        return result;",
+                "    }",
+            ]
+            body += block
+            size += sum(len(line) + 1 for line in block)
+            helper += 1
+        return "\n".join(body + [lines[-1]]) + "\n"
+
+    def build_gradle(self):
+        return "\n".join([
+            "plugins {",
+            "    id 'java'",
+            "    id 'org.springframework.boot' version '3.2.0'",
+            "    id 'io.spring.dependency-management' version '1.1.4'",
+            "}",
+            "",
+            "group = 'com.example'",
+            "version = '0.0.1-SNAPSHOT'",
+            "",
+            "java {",
+            "    toolchain {",
+            "        languageVersion = JavaLanguageVersion.of(17)",
+            "    }",
+            "}",
+            "",
+            "dependencies {",
+            "    implementation 'org.springframework.boot:spring-boot-starter-web'",
+            "    implementation 'org.springframework.boot:spring-boot-starter-data-jpa'",
+            "    implementation 'org.springframework.boot:spring-boot-starter-validation'",
+            "    compileOnly 'org.projectlombok:lombok'",
+            "    runtimeOnly 'com.h2database:h2'",
+            "    testImplementation 'org.springframework.boot:spring-boot-starter-test'",
+            "}",
+            "",
+        ])
+
+    def config_files(self, count):
+        files = {}
+        if count <= 0:
+            return files
+        files["src/main/resources/application.yml"] = "\n".join([
+            "server:",
+            "  port: 8080",
+            "spring:",
+            "  datasource:",
+            "    url: jdbc:h2:mem:bench",
+            "  jpa:",
+            "    hibernate:",
+            "      ddl-auto: update",
+            "bench:",
+            "  feature-enabled: true",
+            "",
+        ])
+        for i in range(1, count):
+            files[f"src/main/resources/application-profile{i}.properties"] = "\n".join([
+                f"server.port={8080 + i}",
+                f"spring.datasource.url=jdbc:h2:mem:bench{i}",
+                f"bench.profile-name=profile{i}",
+                "logging.level.root=INFO",
+                "",
+            ])
+        return files
+
+    def application_source(self):
+        return "\n".join([
+            f"package {BASE_PACKAGE};",
+            "",
+            "import org.springframework.boot.SpringApplication;",
+            "import org.springframework.boot.autoconfigure.SpringBootApplication;",
+            "",
+            "@SpringBootApplication",
+            "public class BenchApplication {",
+            "    public static void main(String[] args) {",
+            "        SpringApplication.run(BenchApplication.class, args);",
+            "    }",
+            "}",
+            "",
+        ])
+
+    def entity_source(self, i):
+        lines = self.header("domain", ["jakarta.persistence.*", "java.util.List", "lombok.Getter"])
+        lines += [
+            f"/** {self.entity(i)} 도메인 엔티티 */",
+            "@Entity",
+            "@Getter",
+            f"public class {self.entity(i)} {{",
+            "    @Id",
+            "    @GeneratedValue(strategy = GenerationType.IDENTITY)",
+            "    private Long id;",
+            "",
+            "    @Column(nullable = false)",
+            "    private String name;",
+            "",
+            "    private int quantity;",
+        ]
+        if self.spec.entities > 1:
+            parent = self.entity((i + 1) % self.spec.entities)
+            lines += [
+                "",
+                "    @ManyToOne(fetch = FetchType.LAZY)",
+                f"    private {parent} parent;",
+                "",
+                "    @OneToMany(mappedBy = \"parent\")",
+                f"    private List<{self.entity((i - 1) % self.spec.entities)}> children;",
+            ]
+        lines.append("}")
+        return self.pad(lines)
+
+    def repository_source(self, i):
+        entity = self.entity(i % max(1, self.spec.entities))
+        lines = self.header("repository", ["org.springframework.data.jpa.repository.JpaRepository",
+                                           "org.springframework.stereotype.Repository", "java.util.List"])
+        lines += [
+            "@Repository",
+            f"public interface {self.repository(i)} extends JpaRepository<{entity}, Long> {{",
+            f"    List<{entity}> findByName(String name);",
+            "",
+            f"    List<{entity}> findByQuantityGreaterThan(int quantity);",
+            "}",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def dto_source(self, i):
+        lines = self.header("dto", ["jakarta.validation.constraints.NotBlank"])
+        if i % 2:
+            lines += [f"public record {self.dto(i)}(@NotBlank String name, int quantity) {{", "}"]
+            return "\n".join(lines) + "\n"
+        lines += [
+            f"public class {self.dto(i)} {{",
+            "    @NotBlank",
+            "    private String name;",
+            "    private int quantity;",
+            "",
+            "    public String getName() { return name; }",
+            "",
+            "    public int getQuantity() { return quantity; }",
+            "}",
+        ]
+        return self.pad(lines)
+
+    def service_source(self, i):
+        entity = self.entity(i % max(1, self.spec.entities))
+        repositories = self.pick(self.spec.repositories, 2, self.repository)
+        dto = self.dto(i % self.spec.dtos) if self.spec.dtos else entity
+        lombok = i % 2 == 0
+        imports = ["org.springframework.stereotype.Service",
+                   "org.springframework.transaction.annotation.Transactional", "java.util.List"]
+        if lombok:
+            imports.append("lombok.RequiredArgsConstructor")
+        lines = self.header("service", imports)
+        lines += [f"/** {entity} 업무 처리 서비스 */", "@Service"]
+        if lombok:
+            lines.append("@RequiredArgsConstructor")
+        lines.append(f"public class {self.service(i)} {{")
+        for repository in repositories:
+            field = repository[0].lower() + repository[1:]
+            if lombok:
+                lines.append(f"    private final {repository} {field};")
+            else:
+                lines += ["    @Autowired", f"    private {repository} {field};"]
+        repository_field = (repositories[0][0].lower() + repositories[0][1:]) if repositories else "null"
+        for m in range(self.spec.methods):
+            if m % 3 == 0:
+                lines += [
+                    "",
+                    f"    /** {entity} 목록 조회 {m} */",
+                    "    @Transactional(readOnly = true)",
+                    f"    public List<{entity}> find{m}(String name) {{",
+                    "        if (name == null || name.isBlank()) {",
+                    "            throw new IllegalArgumentException(\"name\");",
+                    "        }",
+                    f"        return {repository_field}.findByName(name);",
+                    "    }",
+                ]
+            elif m % 3 == 1:
+                lines += [
+                    "",
+                    "    @Transactional",
+                    f"    public {entity} save{m}({dto} request) {{",
+                    f"        {entity} entity = new {entity}();",
+                    "        try {",
+                    f"            return {repository_field}.save(entity);",
+                    "        } catch (RuntimeException e) {",
+                    "            throw new IllegalStateException(\"save failed\", e);",
+                    "        }",
+                    "    }",
+                ]
+            else:
+                lines += [
+                    "",
+                    f"    public int count{m}(int limit) {{",
+                    "        int total = 0;",
+                    "        for (int i = 0; i < limit; i++) {",
+                    "            while (total < i) { total++; }",
+                    "        }",
+                    "        return total;",
+                    "    }",
+                ]
+        lines.append("}")
+        return self.pad(lines)
+
+    def controller_source(self, i):
+        entity = self.entity(i % max(1, self.spec.entities))
+        services = self.pick(self.spec.services, 2, self.service)
+        dto = self.dto(i % self.spec.dtos) if self.spec.dtos else entity
+        lines = self.header("controller", ["org.springframework.web.bind.annotation.*", "java.util.List"])
+        lines += [
+            f"/** {entity} API */",
+            "@RestController",
+            f"@RequestMapping(\"/api/{entity.lower()}/{i}\")",
+            f"public class {self.controller(i)} {{",
+        ]
+        for service in services:
+            lines += ["    @Autowired", f"    private {service} {service[0].lower() + service[1:]};"]
+        service_field = (services[0][0].lower() + services[0][1:]) if services else "null"
+        for m in range(self.spec.methods):
+            if m % 3 == 0:
+                lines += [
+                    "",
+                    f"    @GetMapping(\"/search{m}\")",
+                    f"    public List<{entity}> search{m}(@RequestParam String name) {{",
+                    f"        return {service_field}.find{m}(name);",
+                    "    }",
+                ]
+            elif m % 3 == 1:
+                lines += [
+                    "",
+                    f"    @PostMapping(\"/items{m}\")",
+                    f"    public {entity} create{m}(@RequestBody {dto} request) {{",
+                    f"        return {service_field}.save{m}(request);",
+                    "    }",
+                ]
+            else:
+                lines += [
+                    "",
+                    f"    @DeleteMapping(\"/items{m}/{{id}}\")",
+                    f"    public void delete{m}(@PathVariable Long id) {{",
+                    "        // TODO: 삭제 구현",
+                    "    }",
+                ]
+        lines.append("}")
+        return self.pad(lines)
+
+    def pick(self, count, k, name):
+        """0..count-1 중 k개(이하)를 골라 이름 목록 반환"""
+        if count <= 0:
+            return []
+        return [name(j) for j in self.rng.sample(range(count), min(k, count))]
+
+
+def spec_from_args(args):
+    """--tier 기본값에 개별 옵션을 덮어쓴 ProjectSpec"""
+    values = asdict(TIERS[args.tier])
+    for spec_field in fields(ProjectSpec):
+        value = getattr(args, spec_field.name, None)
+        if value is not None:
+            values[spec_field.name] = value
+    return ProjectSpec(**values)
+
+
+def add_spec_arguments(parser):
+    """ProjectSpec 항목별 명령행 옵션 추가"""
+    parser.add_argument("--tier", choices=sorted(TIERS), default="small")
+    for spec_field in fields(ProjectSpec):
+        parser.add_argument(f"--{spec_field.name.replace('_', '-')}", type=int, dest=spec_field.name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("output", help="생성할 프로젝트 디렉토리 (--zip이면 ZIP 파일 경로)")
+    parser.add_argument("--zip", action="store_true", help="디렉토리 대신 업로드 형태의 ZIP 파일로 저장")
+    add_spec_arguments(parser)
+    args = parser.parse_args()
+
+    spec = spec_from_args(args)
+    generator = SpringProjectGenerator(spec)
+    if args.zip:
+        Path(args.output).write_bytes(generator.to_zip())
+    else:
+        generator.write(args.output)
+    print(json.dumps({'output': args.output, 'spec': asdict(spec)}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+from .result_cache import ResultCache
+from .file_cache import FileAnalysisCache
+from config import Config
+
+# 분석 결과 캐시 인스턴스 생성
+result_cache = ResultCache(
+    Config.CACHE_DIR / 'results',
+    max_size_mb=Config.RESULT_CACHE_MAX_MB,
+    version_tag=Config.ANALYZER_VERSION,
+    enabled=Config.RESULT_CACHE_ENABLED
+)
+
+# 파일 단위 Java 분석 캐시 인스턴스 생성
+file_analysis_cache = FileAnalysisCache(
+    Config.CACHE_DIR / 'files',
+    max_size_mb=Config.FILE_CACHE_MAX_MB,
+    enabled=Config.FILE_CACHE_ENABLED
+)
+
+__all__ = ['result_cache', 'file_analysis_cache']
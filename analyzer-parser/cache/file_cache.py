@@ -0,0 +1,115 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import uuid
+from pathlib import Path
+
+logger = logging.getLogger("analyzer.cache.file")
+
+class FileAnalysisCache:
+    """Java 파일 내용 해시를 키로 하는 파일 단위 분석 결과 캐시 (LRU 방식으로 크기 제한)
+
+    키에 추출기 버전이 포함되므로 버전이 바뀐 뒤의 옛 항목은 더 이상 조회되지 않고 LRU 순서에서 먼저 제거된다.
+    """
+
+    # 제거할 때는 최대 크기의 이 비율까지 줄여 저장할 때마다 전체 항목을 훑지 않도록 함
+    EVICT_TARGET_RATIO = 0.9
+
+    def __init__(self, cache_dir, max_size_mb=256, enabled=True):
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.enabled = enabled
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._size_bytes = None  # 처음 저장할 때 디렉토리를 훑어 계산한 뒤 저장/제거마다 갱신
+
+    def make_key(self, content, version_tag):
+        """파일 내용과 추출기 버전으로 캐시 키 생성"""
+        digest = hashlib.sha256()
+        digest.update(str(version_tag).encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(content.encode('utf-8', errors='surrogatepass'))
+        return digest.hexdigest()
+
+    def _entry_path(self, key):
+        # 한 디렉토리에 파일이 너무 많아지지 않도록 앞 두 글자로 분산
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key):
+        """캐시된 분석 결과 조회 (없으면 None)"""
+        if not self.enabled:
+            return None
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+            # LRU 순서 갱신을 위해 접근 시간 기록
+            os.utime(entry_path)
+        except (OSError, ValueError):
+            return None
+        return value
+
+    def put(self, key, value):
+        """분석 결과 저장"""
+        if not self.enabled:
+            return False
+
+        entry_path = self._entry_path(key)
+        tmp_path = entry_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        try:
+            entry_path.parent.mkdir(exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(value, f, ensure_ascii=False)
+            size = tmp_path.stat().st_size
+            os.replace(tmp_path, entry_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"파일 분석 캐시 저장 실패: {str(e)}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return False
+
+        with self._lock:
+            if self._size_bytes is None:
+                self._size_bytes = sum(size for _, _, size in self._scan_entries())
+            else:
+                self._size_bytes += size
+            over_limit = self._size_bytes > self.max_size_bytes
+        if over_limit:
+            self.evict()
+        return True
+
+    def evict(self):
+        """최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 삭제"""
+        with self._lock:
+            entries = self._scan_entries()
+            total_size = sum(size for _, _, size in entries)
+            target_size = self.max_size_bytes * self.EVICT_TARGET_RATIO
+            evicted = 0
+            if total_size > self.max_size_bytes:
+                for _, entry_path, size in sorted(entries):
+                    if total_size <= target_size:
+                        break
+                    try:
+                        entry_path.unlink()
+                    except OSError:
+                        continue
+                    total_size -= size
+                    evicted += 1
+                logger.info(f"파일 분석 캐시 {evicted}개 항목 제거 (현재 {total_size} bytes)")
+            self._size_bytes = total_size
+            return evicted
+
+    def _scan_entries(self):
+        """(마지막 접근 시간, 항목 경로, 크기) 목록 반환 (기록 중인 임시 파일 제외)"""
+        entries = []
+        for entry_path in self.cache_dir.glob('*/*.json'):
+            try:
+                stat = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, entry_path, stat.st_size))
+        return entries
@@ -0,0 +1,182 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+
+logger = logging.getLogger("analyzer.cache.result")
+
+class ResultCache:
+    """업로드 ZIP 지문을 키로 하는 분석 결과 캐시 (LRU 방식으로 크기 제한)"""
+
+    META_FILE = 'meta.json'
+    ANALYSIS_FILE = 'analysis.json'
+    SUMMARY_FILE = 'summary.json'
+
+    def __init__(self, cache_dir, max_size_mb=1024, version_tag="1", enabled=True):
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.version_tag = str(version_tag)
+        self.enabled = enabled
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        # 통계 정보
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0
+        }
+
+    def make_key(self, file_data, variant=None):
+        """디코딩된 ZIP 바이트와 분석기 버전(및 출력 방식 구분값)으로 캐시 키 생성"""
+        digest = hashlib.sha256()
+        digest.update(self.version_tag.encode('utf-8'))
+        digest.update(b'\0')
+        if variant:
+            # variant가 없으면 기존 키와 같게 유지
+            digest.update(variant.encode('utf-8'))
+            digest.update(b'\0')
+        digest.update(file_data)
+        return digest.hexdigest()
+
+    def get(self, key, output_dir):
+        """캐시된 분석 결과를 output_dir로 복사하여 반환 (없으면 None)
+
+        결과 발행 전에 evict()가 항목을 지워도 영향이 없도록 캐시 항목 대신 복사본 경로를 돌려준다.
+        """
+        if not self.enabled:
+            return None
+
+        entry_dir = self.cache_dir / key
+        meta_path = entry_dir / self.META_FILE
+        analysis_path = Path(output_dir) / f"cached-{key[:12]}-analysis.json"
+        summary_path = Path(output_dir) / f"cached-{key[:12]}-summary.json"
+        try:
+            # 같은 프로세스의 evict()와 겹치지 않도록 잠근 채 복사 (다른 프로세스가 먼저 지우면 적중 실패로 처리)
+            with self._lock:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                shutil.copyfile(entry_dir / self.ANALYSIS_FILE, analysis_path)
+                shutil.copyfile(entry_dir / self.SUMMARY_FILE, summary_path)
+                # LRU 순서 갱신을 위해 접근 시간 기록
+                os.utime(meta_path)
+        except (OSError, ValueError):
+            with self._lock:
+                self.stats["misses"] += 1
+            for path in (analysis_path, summary_path):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            return None
+
+        with self._lock:
+            self.stats["hits"] += 1
+
+        logger.info(f"분석 결과 캐시 적중: {key[:12]}")
+        return {
+            'success': True,
+            'analysis_file': str(analysis_path),
+            'summary_file': str(summary_path),
+            'files_processed': meta.get('files_processed', 0),
+            'output': meta.get('output'),
+            'cached': True
+        }
+
+    def put(self, key, analysis_result):
+        """분석 결과 파일을 캐시에 저장"""
+        if not self.enabled:
+            return False
+
+        entry_dir = self.cache_dir / key
+        if entry_dir.exists():
+            return True
+
+        # 임시 디렉토리에 먼저 기록한 뒤 rename 하여 다른 작업자가 불완전한 항목을 보지 않도록 함
+        tmp_dir = self.cache_dir / f".tmp-{uuid.uuid4().hex}"
+        try:
+            tmp_dir.mkdir()
+            shutil.copyfile(analysis_result['analysis_file'], tmp_dir / self.ANALYSIS_FILE)
+            shutil.copyfile(analysis_result['summary_file'], tmp_dir / self.SUMMARY_FILE)
+
+            size = sum(p.stat().st_size for p in tmp_dir.iterdir())
+            meta = {
+                'files_processed': analysis_result.get('files_processed', 0),
+                'output': analysis_result.get('output'),
+                'version': self.version_tag,
+                'size': size,
+                'created': time.time()
+            }
+            with open(tmp_dir / self.META_FILE, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+
+            os.rename(tmp_dir, entry_dir)
+        except OSError as e:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            if entry_dir.exists():
+                # 동시에 같은 결과를 저장한 다른 작업이 먼저 완료된 경우
+                return True
+            logger.error(f"분석 결과 캐시 저장 실패: {str(e)}")
+            return False
+
+        with self._lock:
+            self.stats["stores"] += 1
+
+        logger.info(f"분석 결과 캐시 저장: {key[:12]} ({size} bytes)")
+        self.evict()
+        return True
+
+    def evict(self):
+        """최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 삭제"""
+        with self._lock:
+            entries = self._scan_entries()
+            total_size = sum(size for _, _, size in entries)
+            if total_size <= self.max_size_bytes:
+                return 0
+
+            evicted = 0
+            for _, entry_dir, size in sorted(entries):
+                if total_size <= self.max_size_bytes:
+                    break
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                total_size -= size
+                evicted += 1
+
+            self.stats["evictions"] += evicted
+            logger.info(f"분석 결과 캐시 {evicted}개 항목 제거 (현재 {total_size} bytes)")
+            return evicted
+
+    def _scan_entries(self):
+        """(마지막 접근 시간, 항목 경로, 크기) 목록 반환"""
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.is_dir() or entry.name.startswith('.'):
+                    continue
+                meta_path = Path(entry.path) / self.META_FILE
+                try:
+                    last_access = meta_path.stat().st_mtime
+                    with open(meta_path, 'r', encoding='utf-8') as f:
+                        size = json.load(f).get('size', 0)
+                except (OSError, ValueError):
+                    # 메타 정보가 없는 항목은 가장 먼저 제거 대상
+                    last_access, size = 0, 0
+                entries.append((last_access, Path(entry.path), size))
+        return entries
+
+    def get_stats(self):
+        """캐시 통계 반환"""
+        with self._lock:
+            stats = dict(self.stats)
+            entries = self._scan_entries()
+        lookups = stats["hits"] + stats["misses"]
+        stats["entries"] = len(entries)
+        stats["size_bytes"] = sum(size for _, _, size in entries)
+        stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else 0
+        return stats
@@ -1,4 +1,5 @@
 import os
+import socket
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
@@ -26,6 +27,14 @@ class Config:
     ROUTING_ANALYSIS_UPLOAD = os.getenv("ROUTING_ANALYSIS_UPLOAD", "analysis.upload")
     ROUTING_RESULT_COMPLETED = os.getenv("ROUTING_RESULT_COMPLETED", "result.completed")
     ROUTING_RESULT_ERROR = os.getenv("ROUTING_RESULT_ERROR", "result.error")
+    ROUTING_SHARD_TASK = os.getenv("ROUTING_SHARD_TASK", "analysis.shard")
+    ROUTING_SHARD_RESULT = os.getenv("ROUTING_SHARD_RESULT", "analysis.shard.result")  # 뒤에 .<SHARD_NODE_ID>가 붙음
+
+    # 결과 발행 설정 (버퍼가 가득 차면 작업자가 최대 PUBLISHER_BUFFER_TIMEOUT초 대기)
+    PUBLISHER_BUFFER_SIZE = int(os.getenv("PUBLISHER_BUFFER_SIZE", 1000))
+    PUBLISHER_BATCH_SIZE = int(os.getenv("PUBLISHER_BATCH_SIZE", 100))
+    PUBLISHER_BUFFER_TIMEOUT = float(os.getenv("PUBLISHER_BUFFER_TIMEOUT", 30))
+    PUBLISH_CONFIRM_TIMEOUT = float(os.getenv("PUBLISH_CONFIRM_TIMEOUT", 60))
 
     # 가상환경 루트 디렉토리 경로 추출 (Scripts 상위 폴더)
     VENV_PATH = Path(sys.executable).parent.parent.resolve()  # ← 핵심 수정
@@ -42,6 +51,59 @@ class Config:
 
     # 기존 설정에 다음 추가
     WORKER_POOL_SIZE = int(os.getenv("WORKER_POOL_SIZE", 4))
+    WORKER_BACKEND = os.getenv("WORKER_BACKEND", "thread")  # thread 또는 process
+    WORKER_MAX_TASKS_PER_CHILD = int(os.getenv("WORKER_MAX_TASKS_PER_CHILD", 0))  # 0이면 자식 프로세스 재사용 무제한
+    CONSUMER_PREFETCH_BUFFER = int(os.getenv("CONSUMER_PREFETCH_BUFFER", 1))  # prefetch = 작업자 수 + 여유분
+    # 같은 프로젝트 중복 업로드 처리 (off: 모두 실행, wait: 대기 중이면 대체/실행 중이면 보류, cancel: wait + 실행 중인 이전 결과 폐기)
+    WORKER_COALESCE = os.getenv("WORKER_COALESCE", "off")
+    # 작업 실행 기한 (초, 0이면 제한 없음 - 메시지 헤더 timeoutSeconds로 작업마다 덮어쓸 수 있음)
+    JOB_TIMEOUT_SECONDS = float(os.getenv("JOB_TIMEOUT_SECONDS", 1800))
+
+    # 작업 대기열 정책 (fifo, sjf: 예상 비용이 작은 작업 먼저, weighted: 비용 / 메시지 priority 순)
+    # 비용은 ZIP의 압축 해제 크기 + Java 파일 수 * WORKER_QUEUE_JAVA_FILE_KB, 기다린 초마다 AGING만큼 줄어듦
+    WORKER_QUEUE_POLICY = os.getenv("WORKER_QUEUE_POLICY", "fifo")
+    WORKER_QUEUE_AGING_MB_PER_SEC = float(os.getenv("WORKER_QUEUE_AGING_MB_PER_SEC", 5))
+    WORKER_QUEUE_JAVA_FILE_KB = int(os.getenv("WORKER_QUEUE_JAVA_FILE_KB", 16))
+    WORKER_QUEUE_UNKNOWN_COST_MB = float(os.getenv("WORKER_QUEUE_UNKNOWN_COST_MB", 10))  # 클레임 체크 참조 업로드
+
+    # 분석 결과 캐시 설정 (분석 로직이 바뀌면 ANALYZER_VERSION을 올려 기존 캐시 무효화)
+    ANALYZER_VERSION = os.getenv("ANALYZER_VERSION", "6")
+    RESULT_CACHE_ENABLED = os.getenv("RESULT_CACHE_ENABLED", "True").lower() in ("true", "1", "t")
+    RESULT_CACHE_MAX_MB = int(os.getenv("RESULT_CACHE_MAX_MB", 1024))
+    FILE_CACHE_ENABLED = os.getenv("FILE_CACHE_ENABLED", "True").lower() in ("true", "1", "t")
+    FILE_CACHE_MAX_MB = int(os.getenv("FILE_CACHE_MAX_MB", 256))
+    RESULT_JSON_COMPACT = os.getenv("RESULT_JSON_COMPACT", "False").lower() in ("true", "1", "t")  # 결과 JSON 들여쓰기 생략
+    RESULT_INCLUDE_TIMINGS = os.getenv("RESULT_INCLUDE_TIMINGS", "True").lower() in ("true", "1", "t")  # 결과 메시지에 단계별 소요 시간 포함
+    # 결과 JSON 소스 파일 내용 저장 방식 (full, dedup, slim - 메시지의 outputProfile 헤더/필드가 우선)
+    OUTPUT_PROFILE = os.getenv("OUTPUT_PROFILE", "full")
+    OUTPUT_SLIM_FILE_TYPES = [t.strip() for t in os.getenv("OUTPUT_SLIM_FILE_TYPES", "resource,build").split(",") if t.strip()]
+
+    # 프로젝트 내부 Java 파일 병렬 분석 (1이면 순차 분석, 배치는 내용 크기 합계 기준)
+    JAVA_ANALYZER_WORKERS = int(os.getenv("JAVA_ANALYZER_WORKERS", 1))
+    JAVA_ANALYZER_BATCH_KB = int(os.getenv("JAVA_ANALYZER_BATCH_KB", 1024))
+
+    # 큰 프로젝트 샤드 분석 (Java 파일이 SHARD_MIN_JAVA_FILES개 이상이면 SHARD_KB 단위로 나누어 여러 노드에서 분석)
+    # 조정 작업이 결과 큐를 소비하는 부모 프로세스에서 실행되어야 하므로 WORKER_BACKEND=thread에서만 동작
+    SHARD_ENABLED = os.getenv("SHARD_ENABLED", "False").lower() in ("true", "1", "t")
+    SHARD_NODE_ID = os.getenv("SHARD_NODE_ID", socket.gethostname())
+    SHARD_QUEUE = os.getenv("SHARD_QUEUE", "analysis.shard.queue")
+    SHARD_RESULT_QUEUE = os.getenv("SHARD_RESULT_QUEUE", "analysis.shard.result.queue")  # 뒤에 .<SHARD_NODE_ID>가 붙음
+    SHARD_MIN_JAVA_FILES = int(os.getenv("SHARD_MIN_JAVA_FILES", 5000))
+    SHARD_KB = int(os.getenv("SHARD_KB", 4096))
+    SHARD_TIMEOUT_SECONDS = float(os.getenv("SHARD_TIMEOUT_SECONDS", 300))  # 샤드 시도 하나의 제한 시간
+    SHARD_MAX_ATTEMPTS = int(os.getenv("SHARD_MAX_ATTEMPTS", 3))  # 모두 실패하면 조정 노드에서 직접 분석
+    SHARD_WORKERS = int(os.getenv("SHARD_WORKERS", 1))  # 다른 노드의 샤드를 처리하는 스레드 수
+
+    # ZIP 수집 방식 (extract: 디스크에 압축 해제 후 수집, archive: 압축 해제 없이 ZIP 내부에서 수집)
+    ZIP_COLLECT_MODE = os.getenv("ZIP_COLLECT_MODE", "extract")
+    FILE_COLLECTOR_WORKERS = int(os.getenv("FILE_COLLECTOR_WORKERS", 1))  # 디렉토리 스캔/파일 읽기 스레드 수 (1이면 순차)
+
+    # 클레임 체크 설정 (큰 업로드/결과는 공유 저장소에 두고 메시지에는 참조만 전달)
+    CLAIM_CHECK_BACKEND = os.getenv("CLAIM_CHECK_BACKEND", "local")
+    CLAIM_CHECK_DIR = Path(os.getenv("CLAIM_CHECK_DIR", str(TEMP_DIR / 'blobs')))
+    CLAIM_CHECK_THRESHOLD_BYTES = int(os.getenv("CLAIM_CHECK_THRESHOLD_BYTES", 0))  # 0이면 결과는 항상 본문에 포함
+    CLAIM_CHECK_TTL_SECONDS = int(os.getenv("CLAIM_CHECK_TTL_SECONDS", 86400))
+    CLAIM_CHECK_CLEANUP_INTERVAL_SECONDS = int(os.getenv("CLAIM_CHECK_CLEANUP_INTERVAL_SECONDS", 600))  # 만료 데이터 정리 주기
 
 
 class DevelopmentConfig(Config):
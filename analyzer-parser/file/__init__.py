@@ -1,6 +1,7 @@
 from .service import FileService
 from config import Config
+from storage import blob_store
 
-file_service = FileService(Config.TEMP_DIR)
+file_service = FileService(Config.TEMP_DIR, collect_mode=Config.ZIP_COLLECT_MODE, blob_store=blob_store)
 
 __all__ = ['file_service']
\ No newline at end of file
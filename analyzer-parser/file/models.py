@@ -6,4 +6,5 @@ class ExtractionResult:
     project_id: str
     project_dir: str = None
     output_dir: str = None
-    error: str = None
\ No newline at end of file
+    error: str = None
+    archive_data: bytes = None  # 압축 해제 없이 분석할 경우의 ZIP 원본
\ No newline at end of file
@@ -59,6 +59,15 @@ class FileOperations:
         self.logger.info(f"압축 해제 완료: {source_dir}")
         return source_dir
     
+    def remove_project(self, project_id):
+        """프로젝트 작업 디렉토리 전체 삭제 (없으면 False)"""
+        project_dir = self.projects_dir / project_id
+        if not project_dir.is_dir():
+            return False
+        shutil.rmtree(project_dir, ignore_errors=True)
+        self.logger.info(f"프로젝트 작업 디렉토리 삭제됨: {project_dir}")
+        return True
+    
     def cleanup_old_projects(self, days_to_keep=7):
         """오래된 프로젝트 정리 (일정 기간 이상 지난 프로젝트 삭제)"""
         try:
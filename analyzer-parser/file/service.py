@@ -1,21 +1,72 @@
+import io
 import logging
+import zipfile
 from file.operations import FileOperations
 from file.models import ExtractionResult
 
 class FileService:
     """파일 처리를 담당하는 서비스 클래스"""
     
-    def __init__(self, temp_dir):
+    def __init__(self, temp_dir, collect_mode="extract", blob_store=None):
         self.file_ops = FileOperations(temp_dir)
+        self.collect_mode = collect_mode  # extract: 디스크에 압축 해제, archive: ZIP 내부에서 직접 수집
+        self.blob_store = blob_store
         self.logger = logging.getLogger("analyzer.file.service")
     
-    def extract_project(self, project_id, file_data):
+    def load_upload(self, file_ref):
+        """클레임 체크 참조로 공유 저장소에서 업로드 ZIP 읽기"""
+        if not self.blob_store:
+            raise RuntimeError("클레임 체크 저장소가 설정되지 않았습니다")
+        file_data = self.blob_store.get(file_ref)
+        self.logger.info(f"공유 저장소에서 업로드 읽기: {file_ref} ({len(file_data)} bytes)")
+        return file_data
+    
+    def delete_upload(self, file_ref):
+        """결과 발행이 끝난 업로드를 공유 저장소에서 삭제 (실패해도 TTL 정리에 맡김)"""
+        if not self.blob_store:
+            return False
+        try:
+            deleted = self.blob_store.delete(file_ref)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"공유 저장소 업로드 삭제 실패 {file_ref}: {str(e)}")
+            return False
+        if deleted:
+            self.logger.info(f"공유 저장소에서 업로드 삭제: {file_ref}")
+        return deleted
+    
+    def inspect_upload(self, file_data):
+        """ZIP 중앙 디렉토리만 읽어 (압축 해제 크기 합계, .java 멤버 수) 반환 (ZIP이 아니면 None)"""
+        try:
+            with zipfile.ZipFile(io.BytesIO(file_data)) as zip_ref:
+                members = zip_ref.infolist()
+        except (zipfile.BadZipFile, ValueError) as e:
+            self.logger.warning(f"업로드 크기 확인 실패: {str(e)}")
+            return None
+        
+        java_files = sum(1 for member in members if member.filename.endswith('.java'))
+        return sum(member.file_size for member in members), java_files
+    
+    def extract_project(self, project_id, file_data=None, file_ref=None):
         try:
             self.logger.info(f"프로젝트 처리 시작: {project_id}")
             
+            # 업로드가 참조로 전달된 경우 저장소에서 읽기
+            if file_data is None and file_ref:
+                file_data = self.load_upload(file_ref)
+            
             # 프로젝트 디렉토리 구조 생성
             project_paths = self.file_ops.create_project_structure(project_id)
             
+            # 압축 파일 내부 수집 모드 - 저장/압축 해제 없이 원본을 파서에 전달
+            if self.collect_mode == "archive":
+                return ExtractionResult(
+                    success=True,
+                    project_id=project_id,
+                    project_dir=str(project_paths['source_dir']),
+                    output_dir=str(project_paths['output_dir']),
+                    archive_data=file_data
+                )
+            
             # ZIP 파일 저장
             zip_path = self.file_ops.save_zip_file(project_paths, project_id, file_data)
             
@@ -38,6 +89,17 @@ class FileService:
                 error=str(e)
             )
     
+    def create_output_dir(self, project_id):
+        """압축 해제 없이 결과 파일만 둘 프로젝트 출력 디렉토리 생성 (캐시 적중 시 사용)"""
+        return self.file_ops.create_project_structure(project_id)['output_dir']
+    
+    def cleanup_project(self, project_id):
+        """취소되거나 시간 제한을 넘긴 작업의 작업 디렉토리 정리"""
+        try:
+            self.file_ops.remove_project(project_id)
+        except Exception as e:
+            self.logger.error(f"프로젝트 {project_id} 작업 디렉토리 정리 실패: {str(e)}")
+    
     def cleanup_old_projects(self, days=7):
         """오래된 프로젝트 파일 정리"""
         self.file_ops.cleanup_old_projects(days_to_keep=days)
\ No newline at end of file
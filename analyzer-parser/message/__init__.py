@@ -1,11 +1,25 @@
 # message/__init__.py
 from file import file_service
 from parser import parser_service
+from cache import result_cache
+from storage import blob_store
+from metrics import stage_histograms
+from config import Config
 from .callback import MessageProcessor
 from .dispatcher import ReulstDispatcher
 
 # 서비스 인스턴스 생성
-result_dispatcher = ReulstDispatcher()
-message_processor = MessageProcessor(file_service, parser_service, result_dispatcher)
+result_dispatcher = ReulstDispatcher(
+    blob_store, Config.CLAIM_CHECK_THRESHOLD_BYTES,
+    include_timings=Config.RESULT_INCLUDE_TIMINGS
+)
+message_processor = MessageProcessor(
+    file_service, parser_service, result_dispatcher, result_cache,
+    output_profile=Config.OUTPUT_PROFILE,
+    slim_file_types=Config.OUTPUT_SLIM_FILE_TYPES,
+    stage_histograms=stage_histograms,
+    java_file_cost=Config.WORKER_QUEUE_JAVA_FILE_KB * 1024,
+    job_timeout=Config.JOB_TIMEOUT_SECONDS or None
+)
 
-__all__ = ['message_processor']
\ No newline at end of file
+__all__ = ['message_processor', 'result_dispatcher']
\ No newline at end of file
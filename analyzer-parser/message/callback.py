@@ -1,72 +1,148 @@
 # message/processor.py
 import logging
 from .util import MessageUtils
+from .jobs import AnalysisJob, run_analysis_job
 from worker import worker_pool
+from worker.scheduling import estimate_cost
+from parser.models.output_profile import OutputProfile
 
 class MessageProcessor:
     """메시지 처리를 담당하는 서비스 클래스"""
     
-    def __init__(self, file_service, parser_service, result_dispatcher):
+    def __init__(self, file_service, parser_service, result_dispatcher, result_cache=None,
+                 output_profile=OutputProfile.FULL, slim_file_types=(), stage_histograms=None,
+                 java_file_cost=16 * 1024, job_timeout=None):
         self.file_service = file_service
         self.parser_service = parser_service
         self.result_dispatcher = result_dispatcher
+        self.result_cache = result_cache
+        self.analysis_job = AnalysisJob(file_service, parser_service, result_cache)
+        # 메시지에 outputProfile/omitContentTypes가 없을 때 사용할 기본 출력 프로필
+        self.output_profile = output_profile
+        self.slim_file_types = tuple(slim_file_types)
+        self.stage_histograms = stage_histograms
+        self.java_file_cost = java_file_cost  # 대기열 비용 추정 시 Java 파일 하나에 더하는 바이트
+        self.job_timeout = job_timeout  # 메시지에 timeoutSeconds가 없을 때의 작업 실행 기한 (초, None이면 제한 없음)
         self.logger = logging.getLogger("analyzer.messaging.processor")
     
-    def on_message(self, body):
+    def on_message(self, body, properties=None, on_complete=None):
         """
-        메시지 처리의 진입점
+        메시지 처리의 진입점 (properties.content_type으로 메시지 형식 판별)
+        
+        True를 반환하면 작업이 제출된 것이며, 결과 발행까지 끝난 뒤 on_complete(delivered)가 호출된다.
+        결과 발행이 브로커에서 확인되지 않으면 delivered=False로 호출되어 메시지가 다시 전달된다.
         """
         project_id = None
         try:
             self.logger.info("메시지 처리 시작")
             
             # 1. 메시지 검증
-            project_id, file_data = MessageUtils.validate_message(body)
-            if not project_id:
+            upload = MessageUtils.validate_message(body, properties)
+            if not upload:
                 return False
+            project_id = upload.project_id
+            output_profile = OutputProfile.from_metadata(
+                upload.metadata, self.output_profile, self.slim_file_types
+            )
             
-            # 작업자 풀에 작업 제출
+            # 작업자 풀에 작업 제출 (완료되면 _on_job_done에서 결과 발행)
             worker_pool.submit(
                 project_id,
-                self._process_message,
+                self._get_job_function(),
                 project_id,
-                file_data
+                upload.file_data,
+                upload.file_ref,
+                output_profile,
+                callback=lambda task_id, result, error: self._on_job_done(
+                    task_id, result, error, on_complete, upload.file_ref
+                ),
+                cost=self._estimate_cost(upload),
+                weight=self._get_weight(upload),
+                cancel_token=worker_pool.create_cancel_token(self._get_timeout(upload))
             )
             
-            # 메시지는 성공적으로 받았으므로 True 반환
+            # 작업이 제출되었으므로 True 반환 (ACK는 on_complete에서)
             return True
             
         except Exception as e:
             self.logger.error(f"메시지 처리 중 예외 발생: {str(e)}", exc_info=True)
             if project_id:
-                self.result_dispatcher.publish_error(project_id, f"처리 오류: {str(e)}")
+                # 소비자 이벤트 루프 스레드이므로 발행 확인을 기다리지 않음
+                self.result_dispatcher.publish_error_async(project_id, f"처리 오류: {str(e)}")
             return False
     
-    def _process_message(self, project_id, file_data):
-        """작업자 풀에서 실행될 실제 처리 로직"""
+    def _estimate_cost(self, upload):
+        """대기열 정책용 예상 비용 (참조로 전달되었거나 ZIP이 아니면 None)"""
+        if not upload.file_data:
+            return None
+        inspected = self.file_service.inspect_upload(upload.file_data)
+        if not inspected:
+            return None
+        return estimate_cost(*inspected, self.java_file_cost)
+    
+    def _get_weight(self, upload):
+        """메시지 priority(양수, 기본 1)를 weighted 정책의 가중치로 사용"""
+        value = upload.metadata.get('priority')
+        if isinstance(value, bytes):
+            value = value.decode('utf-8', errors='replace')
         try:
-            # 2. 프로젝트 추출
-            extraction_result = self.file_service.extract_project(project_id, file_data)
-            if not extraction_result.success:
-                self.result_dispatcher.publish_error(project_id, extraction_result.error)
-                return False
-            
-            # 3. 프로젝트 분석
-            analysis_result = self.parser_service.analyze_project(
-                project_id, 
-                extraction_result.project_dir, 
-                extraction_result.output_dir
-            )
-            
-            # 4. 결과 발행
-            if analysis_result['success']:
-                self.result_dispatcher.publish_success(project_id, analysis_result)
-                return True
+            weight = float(value) if value is not None else 1.0
+        except (TypeError, ValueError):
+            return 1.0
+        return weight if weight > 0 else 1.0
+    
+    def _get_timeout(self, upload):
+        """메시지 timeoutSeconds(양수, 0이면 제한 없음)로 기본 작업 기한을 덮어씀"""
+        value = upload.metadata.get('timeoutSeconds')
+        if value is None:
+            return self.job_timeout
+        if isinstance(value, bytes):
+            value = value.decode('utf-8', errors='replace')
+        try:
+            timeout = float(value)
+        except (TypeError, ValueError):
+            self.logger.warning(f"잘못된 timeoutSeconds 값 무시: {value!r}")
+            return self.job_timeout
+        return timeout if timeout > 0 else None
+    
+    def _get_job_function(self):
+        """작업자 풀 백엔드에 맞는 분석 함수 선택"""
+        # 프로세스 백엔드는 자식 프로세스로 전달 가능한 모듈 함수를 사용
+        if worker_pool.backend == "process":
+            return run_analysis_job
+        return self.analysis_job.run
+    
+    def _on_job_done(self, project_id, result, error, on_complete=None, file_ref=None):
+        """작업 완료 시 (부모 프로세스에서) 결과 발행 후 메시지 처리 완료 알림
+        
+        업로드가 공유 저장소 참조(file_ref)로 전달되었으면 결과가 전달된 뒤 저장소에서 삭제한다.
+        """
+        delivered = False
+        try:
+            if error:
+                delivered = self.result_dispatcher.publish_error(project_id, f"처리 오류: {error}")
+            elif result.get('superseded'):
+                # 같은 프로젝트의 새 업로드가 결과를 대신 발행하므로 메시지만 정리
+                self.logger.info(f"프로젝트 {project_id} 이전 업로드는 새 업로드로 대체되어 결과를 발행하지 않음")
+                delivered = True
+            elif result['success']:
+                # 단계별 소요 시간은 백엔드와 관계없이 부모 프로세스에서 집계 (캐시 적중 결과에는 없음)
+                if self.stage_histograms and result.get('timings'):
+                    self.stage_histograms.observe(result['timings'])
+                delivered = self.result_dispatcher.publish_success(project_id, result)
             else:
-                self.result_dispatcher.publish_error(project_id, analysis_result['error'])
-                return False
-                
+                # 시간 제한 초과/취소는 errorCode로 구분되는 구조화된 오류로 발행
+                delivered = self.result_dispatcher.publish_error(
+                    project_id, result['error'], result.get('error_code'), result.get('error_details')
+                )
         except Exception as e:
-            self.logger.error(f"작업 처리 중 예외 발생: {str(e)}", exc_info=True)
-            self.result_dispatcher.publish_error(project_id, f"처리 오류: {str(e)}")
-            return False
\ No newline at end of file
+            self.logger.error(f"결과 발행 중 예외 발생: {str(e)}", exc_info=True)
+        finally:
+            # 결과가 브로커에 전달된 경우에만 ACK, 아니면 업로드를 다시 받도록 NACK (requeue)
+            if not delivered:
+                self.logger.warning(f"프로젝트 {project_id} 결과가 전달되지 않아 업로드 메시지를 다시 받습니다")
+            elif file_ref:
+                # 메시지를 다시 받지 않으므로 참조된 업로드는 더 이상 필요 없음
+                self.file_service.delete_upload(file_ref)
+            if on_complete:
+                on_complete(delivered)
@@ -1,14 +1,30 @@
 # message/publisher.py
+import concurrent.futures
 import logging
+import threading
 from config import Config
 from message.serializer import MessageSerializer
 
 class ReulstDispatcher:
     """분석 결과 발행을 담당하는 클래스"""
     
-    def __init__(self):
+    def __init__(self, blob_store=None, claim_check_threshold=0, include_timings=False):
         self.logger = logging.getLogger("analyzer.message.publisher")
         self._publisher = None
+        self.blob_store = blob_store
+        self.claim_check_threshold = claim_check_threshold
+        self.include_timings = include_timings  # 결과 메시지에 단계별 소요 시간 포함 여부
+        
+        # 통계 정보 (브로커 확인 결과별 발행 수)
+        self.stats = {
+            "delivered": 0,
+            "failed": 0,
+            "timeout": 0
+        }
+        self.stats_lock = threading.Lock()
+        # 소비자 이벤트 루프 스레드에서 요청된 발행을 대신 기다리는 스레드 (처음 사용할 때 생성)
+        self._executor = None
+        self._executor_lock = threading.Lock()
     
     def _get_publisher(self):        
         if not self._publisher:
@@ -17,20 +33,82 @@ class ReulstDispatcher:
         return self._publisher
     
     def publish_success(self, project_id, analysis_result):
-        """성공 결과 발행"""
-        publisher = self._get_publisher()
+        """성공 결과 발행 (브로커가 확인했으면 True - 호출한 쪽이 업로드 ACK 여부를 정함)"""
         message = MessageSerializer.create_result_message(
             project_id, 
             analysis_result['analysis_file'], 
             analysis_result['summary_file'], 
-            analysis_result['files_processed']
+            analysis_result['files_processed'],
+            output_report=analysis_result.get('output'),
+            blob_store=self.blob_store,
+            claim_check_threshold=self.claim_check_threshold,
+            timings=analysis_result.get('timings') if self.include_timings else None
         )
-        publisher(Config.ROUTING_RESULT_COMPLETED, message)
-        self.logger.info(f"프로젝트 {project_id} 분석 결과 전송 완료")
-    
-    def publish_error(self, project_id, error_message):
-        """오류 결과 발행"""
-        publisher = self._get_publisher()
-        message = MessageSerializer.create_error_message(project_id, error_message)
-        publisher(Config.ROUTING_RESULT_ERROR, message)
-        self.logger.info(f"프로젝트 {project_id} 오류 결과 전송 완료")
\ No newline at end of file
+        return self._publish(project_id, Config.ROUTING_RESULT_COMPLETED, message, "분석 결과")
+    
+    def publish_error(self, project_id, error_message, error_code=None, details=None):
+        """오류 결과 발행 (시간 제한 초과/취소는 error_code로 구분, 브로커가 확인했으면 True)"""
+        message = MessageSerializer.create_error_message(project_id, error_message, error_code, details)
+        return self._publish(project_id, Config.ROUTING_RESULT_ERROR, message, "오류 결과")
+    
+    def publish_error_async(self, project_id, error_message, error_code=None, details=None):
+        """오류 결과를 별도 스레드에서 발행하고 확인 결과 Future 반환
+        
+        발행기의 확인은 소비자와 같은 이벤트 루프에서 처리되므로, 그 스레드(on_message)에서는
+        publish_error로 확인을 기다리면 안 되고 이 메서드를 사용한다.
+        """
+        return self._get_executor().submit(self.publish_error, project_id, error_message, error_code, details)
+    
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="result-dispatcher"
+                )
+            return self._executor
+    
+    def shutdown(self):
+        """비동기 발행 스레드 종료 (확인을 기다리는 발행은 끝나지 않아도 기다리지 않음)"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+    
+    def _publish(self, project_id, routing_key, message, label):
+        """발행 후 확인 결과 반환 (발행기 오류도 전달 실패로 보고 예외를 올리지 않음)"""
+        try:
+            future = self._get_publisher()(routing_key, message)
+        except Exception as e:
+            self.logger.error(f"프로젝트 {project_id} {label} 발행 오류: {str(e)}")
+            self._count("failed")
+            return False
+        return self._wait_for_confirm(project_id, future, label)
+    
+    def _wait_for_confirm(self, project_id, future, label):
+        """브로커가 발행을 확인할 때까지 대기 (확인되어야 전달된 것으로 간주)"""
+        try:
+            delivered = future.result(timeout=Config.PUBLISH_CONFIRM_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            self.logger.error(f"프로젝트 {project_id} {label} 발행 확인 시간 초과")
+            self._count("timeout")
+            return False
+        except Exception as e:
+            self.logger.error(f"프로젝트 {project_id} {label} 발행 실패: {str(e)}")
+            self._count("failed")
+            return False
+        
+        self._count("delivered" if delivered else "failed")
+        if delivered:
+            self.logger.info(f"프로젝트 {project_id} {label} 전송 완료")
+        else:
+            self.logger.error(f"프로젝트 {project_id} {label} 전송 실패")
+        return delivered
+    
+    def _count(self, outcome):
+        with self.stats_lock:
+            self.stats[outcome] += 1
+    
+    def get_stats(self):
+        """결과 발행 통계 반환"""
+        with self.stats_lock:
+            return dict(self.stats)
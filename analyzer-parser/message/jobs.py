@@ -0,0 +1,78 @@
+# message/jobs.py
+import logging
+from worker.cancellation import JobCancelled
+
+logger = logging.getLogger("analyzer.messaging.jobs")
+
+class AnalysisJob:
+    """업로드 하나를 분석하여 결과를 반환하는 작업 (결과 발행은 호출한 쪽에서 담당)"""
+    
+    def __init__(self, file_service, parser_service, result_cache=None):
+        self.file_service = file_service
+        self.parser_service = parser_service
+        self.result_cache = result_cache
+    
+    def run(self, project_id, file_data, file_ref=None, output_profile=None, cancel_token=None):
+        """분석 실행 후 결과 딕셔너리 반환 (실패 시 success=False, error 포함)
+        
+        cancel_token으로 취소되거나 기한을 넘기면 작업 디렉토리를 정리하고 error_code(CANCELLED, TIMEOUT)를 포함해 반환
+        """
+        try:
+            # 클레임 체크 참조로 전달된 업로드는 공유 저장소에서 읽기
+            if file_data is None and file_ref:
+                file_data = self.file_service.load_upload(file_ref)
+            
+            # 캐시 확인 - 동일한 ZIP을 같은 출력 프로필로 이미 분석했다면 추출/파싱 없이 바로 반환
+            cache_key = None
+            if self.result_cache:
+                variant = output_profile.cache_variant() if output_profile else None
+                cache_key = self.result_cache.make_key(file_data, variant)
+                cached_result = self.result_cache.get(cache_key, self.file_service.create_output_dir(project_id))
+                if cached_result:
+                    return cached_result
+            
+            # 프로젝트 추출
+            if cancel_token:
+                cancel_token.check()
+            extraction_result = self.file_service.extract_project(project_id, file_data)
+            if not extraction_result.success:
+                return {'success': False, 'error': extraction_result.error}
+            
+            # 프로젝트 분석
+            analysis_result = self.parser_service.analyze_project(
+                project_id, 
+                extraction_result.project_dir, 
+                extraction_result.output_dir,
+                extraction_result.archive_data,
+                output_profile,
+                cancel_token
+            )
+            
+            if analysis_result['success'] and cache_key:
+                self.result_cache.put(cache_key, analysis_result)
+            
+            return analysis_result
+        
+        except JobCancelled as e:
+            logger.warning(f"프로젝트 {project_id} 작업 중단: {e}")
+            self.file_service.cleanup_project(project_id)
+            return {'success': False, 'error': str(e), 'error_code': e.error_code, 'error_details': e.details}
+        except Exception as e:
+            logger.error(f"작업 처리 중 예외 발생: {str(e)}", exc_info=True)
+            return {'success': False, 'error': f"처리 오류: {str(e)}"}
+
+
+# 프로세스 백엔드의 자식 프로세스마다 한 번만 생성하여 재사용
+_process_job = None
+
+def run_analysis_job(project_id, file_data, file_ref=None, output_profile=None, cancel_token=None):
+    """프로세스 작업자 풀의 자식 프로세스에서 실행되는 진입점"""
+    global _process_job
+    if _process_job is None:
+        from file import file_service
+        from parser import parser_service
+        from cache import result_cache
+        _process_job = AnalysisJob(file_service, parser_service, result_cache)
+        logger.info("자식 프로세스 분석 작업 초기화 완료")
+    
+    return _process_job.run(project_id, file_data, file_ref, output_profile, cancel_token)
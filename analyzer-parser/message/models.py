@@ -0,0 +1,9 @@
+from dataclasses import dataclass, field
+
+@dataclass
+class UploadMessage:
+    project_id: str
+    file_data: bytes = None
+    file_ref: str = None  # 클레임 체크 - 공유 저장소에 있는 업로드 참조
+    content_type: str = None
+    metadata: dict = field(default_factory=dict)  # projectId/파일 내용 외의 부가 정보
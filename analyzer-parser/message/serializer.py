@@ -3,62 +3,128 @@ import json
 import base64
 import os
 from pathlib import Path
+from message.models import UploadMessage
 
-class MessageSerializer:    
+class MessageSerializer:
+    # ZIP 원본이 AMQP 본문으로 그대로 전달되는 바이너리 형식의 content_type
+    BINARY_CONTENT_TYPES = ("application/zip", "application/octet-stream")
+    
     @staticmethod
     def parse_and_validate(body):
+        """레거시 JSON 형식 메시지 파싱 (projectId, 파일 바이트 반환)"""
+        upload = MessageSerializer.parse_upload(body)
+        if not upload:
+            return None, None
+        return upload.project_id, upload.file_data
+    
+    @staticmethod
+    def parse_upload(body, properties=None):
+        """content_type에 따라 바이너리 또는 JSON 업로드 메시지 파싱"""
         logger = logging.getLogger("analyzer.messaging.serializer")
+        content_type = getattr(properties, 'content_type', None)
         
         try:
-            # 메시지 JSON 파싱
-            try:
-                message = json.loads(body)
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON 디코딩 오류: {str(e)}")
-                return None, None
-            
-            # 필수 필드 검증
-            project_id = message.get("projectId")
-            if not project_id:
-                logger.error("프로젝트 ID가 없습니다.")
-                return None, None
-            
-            file_content = message.get("fileContent")
-            if not file_content:
-                logger.error("파일 내용이 없습니다.")
-                return None, None
-            
-            # Base64 디코딩
-            try:
-                file_data = base64.b64decode(file_content)
-                return project_id, file_data
-            except Exception as e:
-                logger.error(f"Base64 디코딩 오류: {str(e)}")
-                return None, None
-                
+            if content_type in MessageSerializer.BINARY_CONTENT_TYPES:
+                return MessageSerializer._parse_binary(body, properties, content_type)
+            return MessageSerializer._parse_json(body)
         except Exception as e:
             logger.error(f"메시지 파싱/검증 중 예외 발생: {str(e)}", exc_info=True)
-            return None, None
+            return None
+    
+    @staticmethod
+    def _parse_binary(body, properties, content_type):
+        """ZIP이 본문, projectId와 메타데이터가 헤더로 전달되는 형식"""
+        logger = logging.getLogger("analyzer.messaging.serializer")
+        
+        headers = {}
+        for key, value in (getattr(properties, 'headers', None) or {}).items():
+            headers[key] = value.decode('utf-8') if isinstance(value, bytes) else value
+        
+        project_id = headers.pop("projectId", None)
+        if not project_id:
+            logger.error("프로젝트 ID 헤더가 없습니다.")
+            return None
+        
+        # 클레임 체크 - 본문 대신 fileRef 헤더로 업로드 참조 전달
+        file_ref = headers.pop("fileRef", None)
+        if not body and not file_ref:
+            logger.error("파일 내용이 없습니다.")
+            return None
+        
+        return UploadMessage(
+            project_id=project_id,
+            file_data=body or None,
+            file_ref=file_ref,
+            content_type=content_type,
+            metadata=headers
+        )
+    
+    @staticmethod
+    def _parse_json(body):
+        """fileContent에 Base64 인코딩된 ZIP이 담긴 레거시 JSON 형식"""
+        logger = logging.getLogger("analyzer.messaging.serializer")
+        
+        # 메시지 JSON 파싱
+        try:
+            message = json.loads(body)
+        except json.JSONDecodeError as e:
+            logger.error(f"JSON 디코딩 오류: {str(e)}")
+            return None
+        
+        # 필수 필드 검증
+        project_id = message.pop("projectId", None)
+        if not project_id:
+            logger.error("프로젝트 ID가 없습니다.")
+            return None
+        
+        file_content = message.pop("fileContent", None)
+        file_ref = message.pop("fileRef", None)
+        if not file_content:
+            # 클레임 체크 - 파일 내용 대신 업로드 참조만 전달된 경우
+            if file_ref:
+                return UploadMessage(
+                    project_id=project_id,
+                    file_ref=file_ref,
+                    content_type="application/json",
+                    metadata=message
+                )
+            logger.error("파일 내용이 없습니다.")
+            return None
+        
+        # Base64 디코딩
+        try:
+            file_data = base64.b64decode(file_content)
+        except Exception as e:
+            logger.error(f"Base64 디코딩 오류: {str(e)}")
+            return None
+        
+        return UploadMessage(
+            project_id=project_id,
+            file_data=file_data,
+            content_type="application/json",
+            metadata=message
+        )
     
     @staticmethod
-    def create_result_message(project_id, analysis_file_path, summary_file_path, files_processed=0):
-        """분석 결과 메시지 생성"""
+    def create_result_message(project_id, analysis_file_path, summary_file_path, files_processed=0,
+                              output_report=None, blob_store=None, claim_check_threshold=0, timings=None):
+        """분석 결과 메시지 생성
+        
+        claim_check_threshold(바이트)를 넘는 결과 파일은 공유 저장소에 저장하고 참조만 포함,
+        output_report(출력 프로필 보고서)와 timings(단계별 소요 시간)가 있으면 각각 outputReport/timings로 포함
+        """
         logger = logging.getLogger("analyzer.messaging.serializer")
         
         try:
-            # 분석 파일 읽기 및 Base64 인코딩
-            analysis_content = None
-            if analysis_file_path and os.path.exists(analysis_file_path):
-                with open(analysis_file_path, 'r', encoding='utf-8') as f:
-                    analysis_data = f.read()
-                    analysis_content = base64.b64encode(analysis_data.encode('utf-8')).decode('utf-8')
+            # 분석 파일 읽기 및 Base64 인코딩 (또는 저장소 참조)
+            analysis_content, analysis_ref = MessageSerializer._encode_result_file(
+                analysis_file_path, blob_store, claim_check_threshold
+            )
             
-            # 요약 파일 읽기 및 Base64 인코딩
-            summary_content = None
-            if summary_file_path and os.path.exists(summary_file_path):
-                with open(summary_file_path, 'r', encoding='utf-8') as f:
-                    summary_data = f.read()
-                    summary_content = base64.b64encode(summary_data.encode('utf-8')).decode('utf-8')
+            # 요약 파일 읽기 및 Base64 인코딩 (또는 저장소 참조)
+            summary_content, summary_ref = MessageSerializer._encode_result_file(
+                summary_file_path, blob_store, claim_check_threshold
+            )
             
             # 메시지 생성
             message = {
@@ -68,6 +134,14 @@ class MessageSerializer:
                 "summaryContent": summary_content,
                 "filesProcessed": files_processed
             }
+            if analysis_ref:
+                message["analysisRef"] = analysis_ref
+            if summary_ref:
+                message["summaryRef"] = summary_ref
+            if output_report:
+                message["outputReport"] = output_report
+            if timings:
+                message["timings"] = timings
             
             return json.dumps(message)
             
@@ -84,10 +158,29 @@ class MessageSerializer:
             return json.dumps(error_message)
     
     @staticmethod
-    def create_error_message(project_id, error_message):
-        """오류 메시지 생성"""
-        return json.dumps({
+    def _encode_result_file(file_path, blob_store, claim_check_threshold):
+        """결과 파일을 (Base64 내용, 저장소 참조) 형태로 변환"""
+        if not file_path or not os.path.exists(file_path):
+            return None, None
+        
+        # 임계값을 넘는 결과는 클레임 체크 저장소에 보관
+        if blob_store and claim_check_threshold > 0 and os.path.getsize(file_path) > claim_check_threshold:
+            return None, blob_store.put_file(file_path)
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = f.read()
+        return base64.b64encode(data.encode('utf-8')).decode('utf-8'), None
+    
+    @staticmethod
+    def create_error_message(project_id, error_message, error_code=None, details=None):
+        """오류 메시지 생성 (error_code(TIMEOUT, CANCELLED 등)와 details가 있으면 errorCode/details로 포함)"""
+        message = {
             "projectId": project_id,
             "success": False,
             "error": error_message
-        })
\ No newline at end of file
+        }
+        if error_code:
+            message["errorCode"] = error_code
+        if details:
+            message["details"] = details
+        return json.dumps(message)
\ No newline at end of file
@@ -5,11 +5,11 @@ class MessageUtils:
     """메시지 처리 유틸리티"""
     
     @staticmethod
-    def validate_message(body):
-        """메시지 유효성 검증"""
+    def validate_message(body, properties=None):
+        """메시지 유효성 검증 (유효하지 않으면 None 반환)"""
         logger = logging.getLogger("analyzer.utils.message")
-        project_id, file_data = MessageSerializer.parse_and_validate(body)
-        if not project_id or not file_data:
+        upload = MessageSerializer.parse_upload(body, properties)
+        if not upload or not upload.project_id or not (upload.file_data or upload.file_ref):
             logger.warning("유효하지 않은 메시지 형식")
-            return None, None
-        return project_id, file_data
\ No newline at end of file
+            return None
+        return upload
\ No newline at end of file
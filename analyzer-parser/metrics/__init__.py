@@ -0,0 +1,7 @@
+from .stage_histograms import StageHistograms
+from .prometheus import PrometheusExporter
+
+# 작업 단계별 소요 시간 히스토그램 인스턴스 생성
+stage_histograms = StageHistograms()
+
+__all__ = ['stage_histograms', 'PrometheusExporter']
@@ -0,0 +1,34 @@
+import bisect
+import threading
+
+# 기본 버킷 상한 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+class Histogram:
+    """고정 버킷 히스토그램 (관측은 버킷 하나만 증가시키고, 누적 개수는 조회할 때 계산)"""
+    
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # 마지막 칸은 가장 큰 버킷을 넘는 값 (+Inf)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+    
+    def observe(self, value):
+        """값 하나 기록"""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+    
+    def snapshot(self):
+        """누적 버킷 [(상한, 개수)], 개수, 합계 복사본 (Prometheus 형식)"""
+        with self._lock:
+            counts, count, total = list(self._counts), self._count, self._sum
+        buckets, running = [], 0
+        for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+            running += bucket_count
+            buckets.append((bound, running))
+        return {'buckets': buckets, 'count': count, 'sum': total}
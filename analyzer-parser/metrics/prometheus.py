@@ -0,0 +1,106 @@
+class PrometheusExporter:
+    """작업자 풀/파서 단계/결과 발행 통계를 Prometheus 텍스트 형식(0.0.4)으로 변환
+    
+    각 소스는 잠금 아래에서 카운터와 버킷 복사본만 읽으므로 작업량과 관계없이 조회 비용이 일정하다.
+    publisher_stats는 발행기 통계를 반환하는 함수 (연결 전에도 호출 가능해야 함)
+    """
+    
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+    
+    def __init__(self, worker_pool, stage_histograms=None, result_dispatcher=None, publisher_stats=None,
+                 prefix="analyzer"):
+        self.worker_pool = worker_pool
+        self.stage_histograms = stage_histograms
+        self.result_dispatcher = result_dispatcher
+        self.publisher_stats = publisher_stats
+        self.prefix = prefix
+    
+    def render(self):
+        """전체 지표를 텍스트로 생성"""
+        lines = []
+        self._worker_metrics(lines)
+        if self.stage_histograms:
+            self._stage_metrics(lines)
+        if self.result_dispatcher:
+            self._dispatcher_metrics(lines)
+        if self.publisher_stats:
+            self._publisher_metrics(lines)
+        return "\n".join(lines) + "\n"
+    
+    def _worker_metrics(self, lines):
+        stats = self.worker_pool.get_stats()
+        self._metric(lines, "tasks_submitted_total", "counter", "작업자 풀에 제출된 작업 수", [((), stats["submitted"])])
+        self._metric(lines, "tasks_completed_total", "counter", "성공한 작업 수", [((), stats["completed"])])
+        self._metric(lines, "tasks_failed_total", "counter", "실패한 작업 수 (실행 기한 초과 포함)", [((), stats["failed"])])
+        self._metric(lines, "tasks_cancelled_total", "counter", "취소된 작업 수 (실행 전 취소와 실행 중 중단 모두)",
+                     [((), stats["cancelled"])])
+        self._metric(lines, "tasks_superseded_total", "counter", "같은 프로젝트의 새 업로드로 대체되어 결과를 버린 작업 수",
+                     [((), stats["superseded"])])
+        self._metric(lines, "task_queue_depth", "gauge", "실행을 기다리는 작업 수", [((), stats["queued"])])
+        self._metric(lines, "tasks_running", "gauge", "실행 중인 작업 수", [((), stats["running"])])
+        self._metric(lines, "workers", "gauge", "최대 동시 실행 작업 수", [((), self.worker_pool.max_workers)])
+        self._histogram(lines, "task_duration_seconds", "작업 처리 시간",
+                        [((), self.worker_pool.duration_histogram.snapshot())])
+    
+    def _stage_metrics(self, lines):
+        stages = self.stage_histograms.snapshot()
+        self._metric(lines, "parser_jobs_observed_total", "counter", "단계별 시간이 집계된 분석 작업 수",
+                     [((), self.stage_histograms.jobs)])
+        self._histogram(lines, "parser_stage_duration_seconds", "파서 단계별 실행 시간",
+                        [((("stage", name),), entry['wall']) for name, entry in stages.items()])
+        self._histogram(lines, "parser_stage_cpu_seconds", "파서 단계별 CPU 시간 (작업 스레드 기준)",
+                        [((("stage", name),), entry['cpu']) for name, entry in stages.items()])
+        self._metric(lines, "parser_stage_files_total", "counter", "파서 단계별 처리 파일 수",
+                     [((("stage", name),), entry['files']) for name, entry in stages.items()])
+        self._metric(lines, "parser_stage_bytes_total", "counter", "파서 단계별 처리 바이트",
+                     [((("stage", name),), entry['bytes']) for name, entry in stages.items()])
+        self._metric(lines, "parser_stage_peak_memory_delta_kilobytes", "gauge", "파서 단계별 최대 RSS 증가량의 최댓값",
+                     [((("stage", name),), entry['max_mem_delta_kb']) for name, entry in stages.items()])
+    
+    def _dispatcher_metrics(self, lines):
+        stats = self.result_dispatcher.get_stats()
+        self._metric(lines, "result_publish_total", "counter", "브로커 확인 결과별 결과 메시지 발행 수",
+                     [((("outcome", outcome),), count) for outcome, count in stats.items()])
+    
+    def _publisher_metrics(self, lines):
+        stats = self.publisher_stats()
+        self._metric(lines, "publisher_messages_total", "counter", "발행기 상태별 메시지 수",
+                     [((("state", state),), stats[state]) for state in ("published", "confirmed", "nacked", "rejected")])
+        self._metric(lines, "publisher_buffered_messages", "gauge", "발행 대기 버퍼의 메시지 수", [((), stats["buffered"])])
+        self._metric(lines, "publisher_unconfirmed_messages", "gauge", "브로커 확인을 기다리는 메시지 수",
+                     [((), stats["unconfirmed"])])
+    
+    def _metric(self, lines, name, metric_type, help_text, samples):
+        """샘플 목록 [(레이블 튜플, 값)]을 가진 지표 하나 추가"""
+        name = f"{self.prefix}_{name}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for labels, value in samples:
+            lines.append(f"{name}{self._labels(labels)} {self._value(value)}")
+    
+    def _histogram(self, lines, name, help_text, samples):
+        """Histogram.snapshot() 형식 샘플 목록 [(레이블 튜플, 스냅샷)]을 가진 히스토그램 추가"""
+        name = f"{self.prefix}_{name}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for labels, snapshot in samples:
+            for bound, count in snapshot['buckets']:
+                lines.append(f"{name}_bucket{self._labels(labels + (('le', self._value(bound)),))} {count}")
+            lines.append(f"{name}_sum{self._labels(labels)} {self._value(snapshot['sum'])}")
+            lines.append(f"{name}_count{self._labels(labels)} {snapshot['count']}")
+    
+    @staticmethod
+    def _labels(labels):
+        if not labels:
+            return ""
+        escaped = (
+            (key, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+            for key, value in labels
+        )
+        return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+    
+    @staticmethod
+    def _value(value):
+        if value == float('inf'):
+            return "+Inf"
+        return repr(value) if isinstance(value, float) else str(value)
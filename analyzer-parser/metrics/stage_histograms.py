@@ -0,0 +1,46 @@
+import threading
+
+from .histogram import DEFAULT_BUCKETS, Histogram
+
+class StageHistograms:
+    """작업 단계별 실행 시간/CPU 시간 히스토그램과 파일 수/바이트 합계
+    
+    작업자 백엔드와 관계없이 부모 프로세스에서 결과의 timings를 받아 집계한다.
+    """
+    
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._stages = {}
+        self.jobs = 0
+    
+    def observe(self, timings):
+        """StageTimer.to_dict() 형식의 작업 하나 기록"""
+        if not timings:
+            return
+        with self._lock:
+            self.jobs += 1
+            for name, stage in timings.get('stages', {}).items():
+                entry = self._stages.get(name)
+                if entry is None:
+                    entry = self._stages[name] = {
+                        'wall': Histogram(self.buckets),
+                        'cpu': Histogram(self.buckets),
+                        'files': 0,
+                        'bytes': 0,
+                        'max_mem_delta_kb': 0
+                    }
+                entry['wall'].observe(stage['wallMs'] / 1000)
+                entry['cpu'].observe(stage['cpuMs'] / 1000)
+                entry['files'] += stage.get('files') or 0
+                entry['bytes'] += stage.get('bytes') or 0
+                entry['max_mem_delta_kb'] = max(entry['max_mem_delta_kb'], stage.get('peakMemDeltaKb') or 0)
+    
+    def snapshot(self):
+        """단계별 누적 버킷 [(상한, 개수)], 개수, 합계 복사본"""
+        with self._lock:
+            stages = {name: dict(entry) for name, entry in self._stages.items()}
+        return {
+            name: dict(entry, wall=entry['wall'].snapshot(), cpu=entry['cpu'].snapshot())
+            for name, entry in stages.items()
+        }
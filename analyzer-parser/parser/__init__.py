@@ -1,6 +1,42 @@
 # parser/__init__.py
+import logging
 from .service import ParserService
+from .sharding import ShardCoordinator, ShardWorker
+from cache import file_analysis_cache
+from config import Config
 
-parser_service = ParserService()
+# 큰 프로젝트 샤드 분석 조정자 (결과 큐를 소비하는 부모 프로세스에서 기다려야 하므로 스레드 백엔드에서만 사용)
+shard_coordinator = None
+if Config.SHARD_ENABLED:
+    if Config.WORKER_BACKEND == "thread":
+        shard_coordinator = ShardCoordinator(
+            node_id=Config.SHARD_NODE_ID,
+            task_routing_key=Config.ROUTING_SHARD_TASK,
+            result_routing_key=Config.ROUTING_SHARD_RESULT,
+            shard_bytes=Config.SHARD_KB * 1024,
+            min_files=Config.SHARD_MIN_JAVA_FILES,
+            timeout=Config.SHARD_TIMEOUT_SECONDS,
+            max_attempts=Config.SHARD_MAX_ATTEMPTS
+        )
+    else:
+        logging.getLogger("analyzer.parser").warning(
+            "WORKER_BACKEND가 thread가 아니어서 샤드 분석 요청은 하지 않고 다른 노드의 샤드만 처리합니다"
+        )
 
-__all__ = ['parser_service']
\ No newline at end of file
+parser_service = ParserService(
+    file_cache=file_analysis_cache,
+    java_workers=Config.JAVA_ANALYZER_WORKERS,
+    java_batch_bytes=Config.JAVA_ANALYZER_BATCH_KB * 1024,
+    compact_json=Config.RESULT_JSON_COMPACT,
+    collector_workers=Config.FILE_COLLECTOR_WORKERS,
+    shard_coordinator=shard_coordinator
+)
+
+# 다른 노드가 발행한 샤드를 처리 (Java 분석기와 파일 캐시는 이 노드의 파서와 공유)
+shard_worker = ShardWorker(
+    parser_service.parser_process.java_analyzer,
+    max_workers=Config.SHARD_WORKERS,
+    confirm_timeout=Config.PUBLISH_CONFIRM_TIMEOUT
+)
+
+__all__ = ['parser_service', 'shard_coordinator', 'shard_worker']
\ No newline at end of file
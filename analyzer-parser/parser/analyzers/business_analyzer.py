@@ -1,29 +1,33 @@
 import logging
 import re
 from collections import defaultdict
+from javalang.tree import MethodDeclaration
 
 logger = logging.getLogger("analyzer.parser.business_analyzer")
 
 class BusinessAnalyzer:
     """비즈니스 객체 및 로직 분석 클래스"""
     
-    def find_business_objects(self, files_info):
-        """핵심 비즈니스 객체와 그 관계 식별"""
+    RELATION_ANNOTATIONS = ['OneToMany', 'ManyToOne', 'OneToOne', 'ManyToMany', 'JoinColumn']
+    MAPPING_ANNOTATIONS = ('GetMapping', 'PostMapping', 'PutMapping', 'DeleteMapping', 'PatchMapping', 'RequestMapping')
+    
+    def find_business_objects(self, project_index, ast_store=None):
+        """핵심 비즈니스 객체와 그 관계 식별 (ast_store가 있으면 공유 AST 사용)"""
         business_objects = []
         
         # 엔티티 클래스 찾기
-        entities = [f for f in files_info if f.get('file_type') == 'entity']
+        entities = project_index.java_of_type('entity')
         
         # 엔티티 분석
         for entity in entities:
-            business_objects.append(self.analyze_entity(entity))
+            business_objects.append(self.analyze_entity(entity, ast_store))
         
         # 주요 DTO도 비즈니스 객체로 간주
-        self.analyze_dtos(files_info, business_objects)
+        self.analyze_dtos(project_index, business_objects)
         
         return business_objects
     
-    def analyze_entity(self, entity):
+    def analyze_entity(self, entity, ast_store=None):
         """엔티티 분석 및 관계 추출"""
         class_info = entity.get('class_info', {})
         if not class_info:
@@ -36,36 +40,53 @@ class BusinessAnalyzer:
             'relationships': []
         }
         
+        # AST가 있으면 필드 선언에 붙은 어노테이션을 그대로 사용 (없으면 텍스트 근사)
+        tree = ast_store.get(entity) if ast_store else None
+        tree_annotations = self.field_annotations_from_tree(tree) if tree else {}
+        
         # JPA 관계 어노테이션 찾기
         for field in object_info['fields']:
             field_annotations = []
-            field_pattern = field['name'] + r'\s*;'
             field_pos = entity['content'].find(field['name'])
-            if field_pos > -1:
+            if field['name'] in tree_annotations:
+                field_annotations = [a for a in self.RELATION_ANNOTATIONS if a in tree_annotations[field['name']]]
+                field['annotations'] = field_annotations
+            elif field_pos > -1:
                 # 필드 앞의 3줄에서 어노테이션 찾기
                 prev_lines = entity['content'][max(0, field_pos-200):field_pos]
                 
                 # 어노테이션 검색
-                for annotation in ['OneToMany', 'ManyToOne', 'OneToOne', 'ManyToMany', 'JoinColumn']:
+                for annotation in self.RELATION_ANNOTATIONS:
                     if f'@{annotation}' in prev_lines:
                         field_annotations.append(annotation)
                 
                 field['annotations'] = field_annotations
-                
-                # 가능한 경우 관련 엔티티 결정
-                if any(a in ['OneToMany', 'ManyToOne', 'OneToOne', 'ManyToMany'] for a in field_annotations):
-                    object_info['relationships'].append({
-                        'from': object_info['name'],
-                        'to': field['type'].replace('List<', '').replace('>', ''),
-                        'type': field_annotations[0] if field_annotations else 'Association',
-                        'field': field['name']
-                    })
+            
+            # 가능한 경우 관련 엔티티 결정
+            if any(a in ['OneToMany', 'ManyToOne', 'OneToOne', 'ManyToMany'] for a in field_annotations):
+                object_info['relationships'].append({
+                    'from': object_info['name'],
+                    'to': field['type'].replace('List<', '').replace('>', ''),
+                    'type': field_annotations[0] if field_annotations else 'Association',
+                    'field': field['name']
+                })
         
         return object_info
     
-    def analyze_dtos(self, files_info, business_objects):
+    def field_annotations_from_tree(self, tree):
+        """AST의 첫 번째 타입 선언에서 필드 이름별 어노테이션 이름 목록 추출"""
+        if not tree.types:
+            return {}
+        field_annotations = {}
+        for field in getattr(tree.types[0], 'fields', []):
+            names = [annotation.name.split('.')[-1] for annotation in field.annotations]
+            for declarator in field.declarators:
+                field_annotations[declarator.name] = names
+        return field_annotations
+    
+    def analyze_dtos(self, project_index, business_objects):
         """DTO 분석 및 비즈니스 객체 추가"""
-        dtos = [f for f in files_info if f.get('file_type') == 'dto' or 
+        dtos = [f for f in project_index.java_files() if f.get('file_type') == 'dto' or 
                 (f.get('path', '').lower().find('dto') > -1)]
         
         for dto in dtos:
@@ -82,12 +103,12 @@ class BusinessAnalyzer:
             
             business_objects.append(object_info)
     
-    def extract_logic(self, files_info):
+    def extract_logic(self, project_index):
         """서비스 클래스에서 비즈니스 로직 요약 추출"""
         business_logic = {}
         
         # 서비스 클래스 필터링
-        service_files = [f for f in files_info if f.get('file_type') == 'service']
+        service_files = project_index.java_of_type('service')
         
         for service in service_files:
             service_name = service.get('class_info', {}).get('name', 'Unknown')
@@ -102,22 +123,21 @@ class BusinessAnalyzer:
         return business_logic
     
     def analyze_service_methods(self, service, methods):
-        """서비스 메서드 분석"""
+        """서비스 메서드 분석 (메서드 위치 표로 각 메서드 본문만 읽음)"""
         logic_methods = []
         service_name = service.get('class_info', {}).get('name', 'Unknown')
+        class_transactional = 'Transactional' in service.get('class_info', {}).get('type_annotations', [])
         
-        for method in methods:
+        # method_spans는 class_info의 methods와 같은 순서
+        for method, span in zip(methods, service.get('method_spans', [])):
             # 생성자와 getter/setter 제외
             if method['name'] == service_name or method['name'].startswith('get') or method['name'].startswith('set'):
                 continue
-                
-            # 메서드 본문 추출 (근사값)
-            method_signature = f"{method['access']} {method['return_type']} {method['name']}"
-            method_pos = service['content'].find(method_signature)
             
-            if method_pos > -1:
-                method_body = self.extract_method_body(service['content'], method_pos)
-                key_operations = self.identify_key_operations(method_body, service['content'], method_pos)
+            if span['body_start'] is not None:
+                method_body = self.extract_method_body(service['content'], span)
+                transactional = class_transactional or 'Transactional' in span['annotations']
+                key_operations = self.identify_key_operations(method_body, transactional)
                 
                 logic_methods.append({
                     'name': method['name'],
@@ -129,27 +149,11 @@ class BusinessAnalyzer:
         
         return logic_methods
     
-    def extract_method_body(self, content, method_pos):
-        """메서드 본문 추출"""
-        # 메서드 본문 시작점 찾기
-        start_pos = content.find('{', method_pos)
-        if start_pos == -1:
-            return ""
-            
-        # 괄호 균형 계산으로 메서드 끝 찾기
-        balance = 1
-        end_pos = start_pos + 1
-        
-        while balance > 0 and end_pos < len(content):
-            if content[end_pos] == '{':
-                balance += 1
-            elif content[end_pos] == '}':
-                balance -= 1
-            end_pos += 1
-        
-        return content[start_pos:end_pos].strip()
+    def extract_method_body(self, content, span):
+        """메서드 본문 추출 (중괄호 포함, 문자열·주석 안의 중괄호는 렉서가 이미 제외)"""
+        return content[span['body_start']:span['end']]
     
-    def identify_key_operations(self, method_body, full_content, method_pos):
+    def identify_key_operations(self, method_body, transactional=False):
         """업무 로직 추출을 위한 휴리스틱"""
         key_operations = []
         
@@ -165,36 +169,36 @@ class BusinessAnalyzer:
         if 'if' in method_body and ('throw' in method_body or 'Exception' in method_body):
             key_operations.append('business_rule_validation')
         
-        # 트랜잭션 존재 여부
-        if '@Transactional' in full_content[:method_pos]:
+        # 트랜잭션 존재 여부 (메서드 또는 클래스의 @Transactional)
+        if transactional:
             key_operations.append('transactional')
         
         return key_operations
     
-    def analyze_flows(self, files_info, relationships):
+    def analyze_flows(self, project_index, relationships, ast_store=None):
         """컨트롤러에서 리포지토리까지의 데이터 흐름 분석"""
         # 컨트롤러, 서비스, 리포지토리 식별
-        controllers = [f for f in files_info if f.get('file_type') == 'controller']
-        services = {f.get('class_info', {}).get('name'): f for f in files_info if f.get('file_type') == 'service'}
-        repositories = {f.get('class_info', {}).get('name'): f for f in files_info if f.get('file_type') == 'repository'}
+        controllers = project_index.java_of_type('controller')
+        services = {f.get('class_info', {}).get('name'): f for f in project_index.java_of_type('service')}
+        repositories = {f.get('class_info', {}).get('name'): f for f in project_index.java_of_type('repository')}
         
         # 관계 맵 구성
         relation_map = self.build_relation_map(relationships)
         
         # 컨트롤러별 데이터 흐름 분석
-        data_flows = self.analyze_controller_flows(controllers, relation_map, services, repositories)
+        data_flows = self.analyze_controller_flows(controllers, relation_map, services, repositories, ast_store)
         
         return data_flows
     
     def build_relation_map(self, relationships):
-        """관계 맵 구성"""
+        """관계 맵 구성 (필드이면서 주입 대상인 의존성은 한 번만 기록)"""
         relation_map = defaultdict(list)
         for rel in relationships:
-            if rel['type'] in ['has_field', 'autowires']:
+            if rel['type'] in ['has_field', 'autowires'] and rel['target'] not in relation_map[rel['source']]:
                 relation_map[rel['source']].append(rel['target'])
         return relation_map
     
-    def analyze_controller_flows(self, controllers, relation_map, services, repositories):
+    def analyze_controller_flows(self, controllers, relation_map, services, repositories, ast_store=None):
         """컨트롤러별 데이터 흐름 분석"""
         data_flows = []
         
@@ -202,11 +206,19 @@ class BusinessAnalyzer:
             controller_name = controller.get('class_info', {}).get('name', 'Unknown')
             controller_deps = relation_map.get(controller_name, [])
             
+            # AST가 있으면 매핑 어노테이션이 붙은 메서드만 엔드포인트로 인정
+            tree = ast_store.get(controller) if ast_store else None
+            handler_names = self.handler_names_from_tree(tree) if tree else None
+            
             # 엔드포인트별 데이터 흐름 분석
             endpoints = []
             for method in controller.get('class_info', {}).get('methods', []):
-                # API 엔드포인트 메서드만 필터링 (getter/setter 제외)
-                if not method['name'].startswith('get') and not method['name'].startswith('set'):
+                if handler_names is not None:
+                    is_endpoint = method['name'] in handler_names
+                else:
+                    # API 엔드포인트 메서드만 필터링 (getter/setter 제외)
+                    is_endpoint = not method['name'].startswith('get') and not method['name'].startswith('set')
+                if is_endpoint:
                     endpoint_flow = self.trace_endpoint_flow(controller_name, controller_deps, services, repositories, relation_map)
                     
                     if len(endpoint_flow) > 1:  # 컨트롤러보다 더 많은 컴포넌트가 있을 때만
@@ -223,6 +235,14 @@ class BusinessAnalyzer:
         
         return data_flows
     
+    def handler_names_from_tree(self, tree):
+        """AST에서 요청 매핑 어노테이션이 붙은 메서드 이름 집합"""
+        handler_names = set()
+        for _, method in tree.filter(MethodDeclaration):
+            if any(annotation.name.split('.')[-1] in self.MAPPING_ANNOTATIONS for annotation in method.annotations):
+                handler_names.add(method.name)
+        return handler_names
+    
     def trace_endpoint_flow(self, controller_name, controller_deps, services, repositories, relation_map):
         """엔드포인트 흐름 추적"""
         endpoint_flow = [controller_name]
@@ -239,7 +259,7 @@ class BusinessAnalyzer:
         
         return endpoint_flow
     
-    def analyze_spring_features(self, files_info):
+    def analyze_spring_features(self, project_index):
         """Spring Boot 특화 기능 및 패턴 분석"""
         spring_features = {
             'auto_configuration': [],
@@ -249,38 +269,37 @@ class BusinessAnalyzer:
             'exception_handling': []
         }
         
-        # Java 파일 분석
-        for file in files_info:
-            if file.get('file_type') not in ['controller', 'service', 'repository', 'config', 'entity']:
-                continue
-                
-            content = file.get('content', '')
-            class_name = file.get('class_info', {}).get('name', 'Unknown')
+        # Java 파일 분석 (JavaAnalyzer가 토큰 스트림에서 추출한 class_info 사용)
+        for file in project_index.java_of_type('controller', 'service', 'repository', 'config', 'entity'):
+            class_info = file.get('class_info', {})
+            class_name = class_info.get('name', 'Unknown')
+            annotations = set(class_info.get('annotations', []))
             
             # 자동 구성 감지
-            if '@EnableAutoConfiguration' in content or '@SpringBootApplication' in content:
+            if 'EnableAutoConfiguration' in annotations or 'SpringBootApplication' in annotations:
                 spring_features['auto_configuration'].append(file.get('path'))
             
             # 의존성 주입 패턴 감지
-            self.detect_di_patterns(content, class_name, spring_features)
+            self.detect_di_patterns(class_info, class_name, spring_features)
             
             # 프로필 사용 감지
-            self.detect_profiles(content, class_name, spring_features)
+            self.detect_profiles(class_info, class_name, spring_features)
             
             # 프로퍼티 사용 감지
-            self.detect_properties(content, class_name, spring_features)
+            self.detect_properties(class_info, class_name, spring_features)
             
             # 예외 처리 패턴 감지
-            self.detect_exception_handling(content, class_name, spring_features)
+            self.detect_exception_handling(file, class_name, spring_features)
         
         return spring_features
     
-    def detect_di_patterns(self, content, class_name, spring_features):
-        """의존성 주입 패턴 감지"""
+    def detect_di_patterns(self, class_info, class_name, spring_features):
+        """의존성 주입 패턴 감지 (@Autowired 주입 지점 기준)"""
+        injection_kinds = {injection['kind'] for injection in class_info.get('injections', [])}
         di_patterns = {
-            'constructor': '@Autowired' in content and 'public ' + class_name in content,
-            'field': re.search(r'@Autowired\s+private', content) is not None,
-            'setter': re.search(r'@Autowired\s+(?:public|protected|private)\s+void\s+set', content) is not None
+            'constructor': 'constructor' in injection_kinds,
+            'field': 'field' in injection_kinds,
+            'setter': 'setter' in injection_kinds
         }
         
         if any(di_patterns.values()):
@@ -289,30 +308,43 @@ class BusinessAnalyzer:
                 'patterns': [k for k, v in di_patterns.items() if v]
             })
     
-    def detect_profiles(self, content, class_name, spring_features):
+    def annotation_values(self, class_info, annotation):
+        """특정 어노테이션에 전달된 문자열 값 목록"""
+        return [
+            value
+            for entry in class_info.get('annotation_values', [])
+            if entry['name'] == annotation
+            for value in entry['values']
+        ]
+    
+    def detect_profiles(self, class_info, class_name, spring_features):
         """프로필 사용 감지"""
-        if '@Profile' in content:
-            profiles = re.findall(r'@Profile\(["\']([^"\']+)["\']\)', content)
-            if profiles:
-                spring_features['profiles'].append({
-                    'class': class_name,
-                    'profiles': profiles
-                })
+        profiles = self.annotation_values(class_info, 'Profile')
+        if profiles:
+            spring_features['profiles'].append({
+                'class': class_name,
+                'profiles': profiles
+            })
     
-    def detect_properties(self, content, class_name, spring_features):
+    def detect_properties(self, class_info, class_name, spring_features):
         """프로퍼티 사용 감지"""
-        if '@Value' in content:
-            properties = re.findall(r'@Value\(["\'](\$\{[^"\']+\})["\']', content)
-            if properties:
-                spring_features['properties_usage'].append({
-                    'class': class_name,
-                    'properties': properties
-                })
+        properties = [
+            value for value in self.annotation_values(class_info, 'Value')
+            if re.fullmatch(r'\$\{[^"\']+\}', value)
+        ]
+        if properties:
+            spring_features['properties_usage'].append({
+                'class': class_name,
+                'properties': properties
+            })
     
-    def detect_exception_handling(self, content, class_name, spring_features):
-        """예외 처리 패턴 감지"""
-        if '@ExceptionHandler' in content or '@ControllerAdvice' in content:
+    def detect_exception_handling(self, file, class_name, spring_features):
+        """예외 처리 패턴 감지 (@ExceptionHandler는 메서드 위치 표, @ControllerAdvice는 클래스 어노테이션 기준)"""
+        type_annotations = file.get('class_info', {}).get('type_annotations', [])
+        is_global = 'ControllerAdvice' in type_annotations or 'RestControllerAdvice' in type_annotations
+        has_handler = any('ExceptionHandler' in span['annotations'] for span in file.get('method_spans', []))
+        if has_handler or is_global:
             spring_features['exception_handling'].append({
                 'class': class_name,
-                'global': '@ControllerAdvice' in content
-            })
\ No newline at end of file
+                'global': is_global
+            })
@@ -1,21 +1,41 @@
 import logging
-import javalang
-from javalang.tree import ClassDeclaration, MethodDeclaration
+from javalang.tree import ClassDeclaration, MethodDeclaration, Literal, ElementArrayValue, MemberReference
+from ..ast_store import AstStore
+from ..extractors.class_extractor import ClassInfoExtractor
+from ..extractors.java_lexer import JavaLexer, ANNOTATION, IDENT, STRING, KIND, TEXT, DEPTH, annotation_name, string_value
 
 logger = logging.getLogger("analyzer.parser.endpoint_analyzer")
 
 class EndpointAnalyzer:
     """API 엔드포인트 분석 클래스"""
     
-    def analyze(self, files_info):
-        """컨트롤러에서 요청/응답 모델과 함께 API 엔드포인트 추출"""
+    MAPPING_ANNOTATIONS = {
+        'GetMapping': 'GET',
+        'PostMapping': 'POST',
+        'PutMapping': 'PUT',
+        'DeleteMapping': 'DELETE',
+        'PatchMapping': 'PATCH',
+        'RequestMapping': None  # 별도 처리 필요
+    }
+    
+    def __init__(self):
+        self.lexer = JavaLexer()
+        self.class_extractor = ClassInfoExtractor(self.lexer)
+    
+    def analyze(self, project_index, ast_store=None):
+        """컨트롤러에서 요청/응답 모델과 함께 API 엔드포인트 추출
+        
+        ast_store가 주어지면 작업 내 다른 분석기와 AST를 공유
+        """
         endpoints = []
+        if ast_store is None:
+            ast_store = AstStore()
         
         # 컨트롤러 파일 필터링 (더 넓은 범위로 검색)
-        controller_files = [f for f in files_info if self._is_controller(f)]
+        controller_files = [f for f in project_index.java_files() if self._is_controller(f)]
         
         for controller in controller_files:
-            extracted_endpoints = self.extract_endpoints_from_controller(controller)
+            extracted_endpoints = self.extract_endpoints_from_controller(controller, ast_store)
             if extracted_endpoints:
                 endpoints.extend(extracted_endpoints)
         
@@ -39,14 +59,15 @@ class EndpointAnalyzer:
             
         return False
     
-    def extract_endpoints_from_controller(self, controller):
-        """JavaParser를 사용하여 컨트롤러에서 엔드포인트 추출"""
+    def extract_endpoints_from_controller(self, controller, ast_store=None):
+        """공유 AST로 컨트롤러에서 엔드포인트 추출 (파싱 실패 시 토큰 기반 추출)"""
         endpoints = []
         
+        tree = (ast_store or AstStore()).get(controller)
+        if tree is None:
+            return self.extract_endpoints_from_tokens(controller)
+        
         try:
-            # Java 코드 파싱
-            tree = javalang.parse.parse(controller['content'])
-            
             # 클래스 선언 찾기
             for path, node in tree.filter(ClassDeclaration):
                 # 컨트롤러 클래스인지 확인
@@ -87,23 +108,36 @@ class EndpointAnalyzer:
             return base_path
             
         for annotation in class_node.annotations:
-            if annotation.name != 'RequestMapping':
-                continue
-                
-            # 어노테이션 요소 추출
-            if hasattr(annotation, 'element') and annotation.element:
-                for element in annotation.element:
-                    # value 또는 path 속성 찾기
-                    if element[0] in ['value', 'path']:
-                        if isinstance(element[1], list):
-                            if element[1] and hasattr(element[1][0], 'value'):
-                                base_path = element[1][0].value
-                        elif hasattr(element[1], 'value'):
-                            base_path = element[1].value
-                        break
+            if annotation.name == 'RequestMapping':
+                base_path = self._extract_path_from_annotation(annotation)
+                break
                         
         return base_path
     
+    def _annotation_elements(self, annotation):
+        """어노테이션 인자를 {이름: 값 노드}로 변환 (단일 값은 value)"""
+        element = getattr(annotation, 'element', None)
+        if element is None:
+            return {}
+        if isinstance(element, list):
+            return {pair.name: pair.value for pair in element}
+        return {'value': element}
+    
+    def _first_value(self, node):
+        """값 노드 또는 배열 값의 첫 번째 요소"""
+        if isinstance(node, ElementArrayValue):
+            return node.values[0] if node.values else None
+        if isinstance(node, list):
+            return node[0] if node else None
+        return node
+    
+    def _string_literal(self, node):
+        """문자열 리터럴 노드의 내용 (따옴표 제외)"""
+        node = self._first_value(node)
+        if isinstance(node, Literal) and isinstance(node.value, str) and node.value[:1] in ('"', "'"):
+            return node.value[1:-1]
+        return None
+    
     def _process_method(self, method_node, base_path):
         """메서드 노드에서 엔드포인트 정보 추출"""
         # 메서드에 매핑 어노테이션이 있는지 확인
@@ -142,63 +176,37 @@ class EndpointAnalyzer:
         """메서드 레벨 매핑 어노테이션 처리"""
         if not hasattr(method_node, 'annotations') or not method_node.annotations:
             return None
-            
-        mapping_annotations = {
-            'GetMapping': 'GET',
-            'PostMapping': 'POST',
-            'PutMapping': 'PUT',
-            'DeleteMapping': 'DELETE',
-            'PatchMapping': 'PATCH',
-            'RequestMapping': None  # 별도 처리 필요
-        }
         
         for annotation in method_node.annotations:
-            if annotation.name not in mapping_annotations:
+            if annotation.name not in self.MAPPING_ANNOTATIONS:
                 continue
                 
             # 기본 HTTP 메서드가 있는 매핑 처리
-            if mapping_annotations[annotation.name]:
+            if self.MAPPING_ANNOTATIONS[annotation.name]:
                 path = self._extract_path_from_annotation(annotation)
-                return mapping_annotations[annotation.name], path
+                return self.MAPPING_ANNOTATIONS[annotation.name], path
                 
             # RequestMapping 특별 처리
-            elif annotation.name == 'RequestMapping':
-                method_type = 'GET'  # 기본값
-                
-                # method 속성 찾기
-                if hasattr(annotation, 'element') and annotation.element:
-                    for element in annotation.element:
-                        if element[0] == 'method':
-                            # RequestMethod 열거형 처리
-                            if hasattr(element[1], 'member') and element[1].member:
-                                method_type = element[1].member
-                            # 배열 형식 처리
-                            elif isinstance(element[1], list) and element[1]:
-                                if hasattr(element[1][0], 'member'):
-                                    method_type = element[1][0].member
-                
-                path = self._extract_path_from_annotation(annotation)
-                return method_type, path
+            method_type = 'GET'  # 기본값
+            
+            # method 속성 찾기 (RequestMethod.POST 또는 배열 형식)
+            method_value = self._first_value(self._annotation_elements(annotation).get('method'))
+            if isinstance(method_value, MemberReference) and method_value.member:
+                method_type = method_value.member
+            
+            path = self._extract_path_from_annotation(annotation)
+            return method_type, path
                 
         return None
     
     def _extract_path_from_annotation(self, annotation):
-        """어노테이션에서 경로 추출"""
-        path = ""
-        
-        if hasattr(annotation, 'element') and annotation.element:
-            for element in annotation.element:
-                # value, path 속성 탐색
-                if element[0] in ['value', 'path']:
-                    # 문자열 리터럴 처리
-                    if hasattr(element[1], 'value'):
-                        path = element[1].value
-                    # 배열 처리
-                    elif isinstance(element[1], list) and element[1]:
-                        if hasattr(element[1][0], 'value'):
-                            path = element[1][0].value
-        
-        return path
+        """어노테이션에서 경로 추출 (value 또는 path 속성, 배열이면 첫 번째 값)"""
+        elements = self._annotation_elements(annotation)
+        for name in ('value', 'path'):
+            path = self._string_literal(elements.get(name))
+            if path is not None:
+                return path
+        return ""
     
     def _combine_paths(self, base_path, path):
         """기본 경로와 메서드 경로 결합"""
@@ -264,9 +272,137 @@ class EndpointAnalyzer:
             
         for annotation in method_node.annotations:
             if annotation.name in ['Operation', 'ApiOperation']:
-                if hasattr(annotation, 'element') and annotation.element:
-                    for element in annotation.element:
-                        if element[0] in ['summary', 'value'] and hasattr(element[1], 'value'):
-                            return element[1].value
+                elements = self._annotation_elements(annotation)
+                for name in ('summary', 'value'):
+                    description = self._string_literal(elements.get(name))
+                    if description is not None:
+                        return description
                             
-        return None
\ No newline at end of file
+        return None
+    
+    def extract_endpoints_from_tokens(self, controller):
+        """AST 파싱에 실패한 컨트롤러의 토큰 기반 엔드포인트 추출 (대체 경로)"""
+        code = self.lexer.tokenize(controller['content']).code
+        endpoints = []
+        base_path = ""
+        is_controller = False
+        description = None  # 매핑 어노테이션보다 앞에 붙은 설명 어노테이션
+        position = 0
+        
+        while position < len(code):
+            token = code[position]
+            if token[KIND] != ANNOTATION:
+                # 선언이 끝나면 앞서 읽은 설명은 다음 메서드에 적용하지 않음
+                if token[TEXT] in ('{', ';'):
+                    description = None
+                position += 1
+                continue
+            
+            name = annotation_name(token)
+            arguments, position = self._read_annotation_arguments(code, position + 1)
+            
+            # 최상위 타입 선언 앞(깊이 0)의 어노테이션은 클래스 레벨
+            if token[DEPTH] == 0:
+                if name in ('Controller', 'RestController'):
+                    is_controller = True
+                elif name == 'RequestMapping':
+                    base_path = self._token_string_argument(arguments, ('value', 'path')) or ""
+                continue
+            
+            if name in ('Operation', 'ApiOperation'):
+                description = self._token_string_argument(arguments, ('summary', 'value'))
+                continue
+            if name not in self.MAPPING_ANNOTATIONS:
+                continue
+            
+            method_type = self.MAPPING_ANNOTATIONS[name]
+            if method_type is None:
+                method_type = self._token_request_method(arguments)
+            path = self._token_string_argument(arguments, ('value', 'path')) or ""
+            
+            declaration, position = self._read_method_declaration(code, position)
+            if not declaration:
+                continue
+            following_description, handler, response_type, params = declaration
+            endpoint_description = following_description or description
+            description = None
+            
+            endpoints.append({
+                "method": method_type,
+                "path": self._combine_paths(base_path, path),
+                "handler": handler,
+                "requestParams": [param['name'] for param in params if 'RequestParam' in param['annotations']],
+                "requestBody": next(
+                    (f"{param['type']} {param['name']}" for param in params if 'RequestBody' in param['annotations']),
+                    None
+                ),
+                "responseType": response_type,
+                "description": endpoint_description
+            })
+        
+        return endpoints if is_controller else []
+    
+    def _read_annotation_arguments(self, code, position):
+        """어노테이션 뒤의 괄호 인자 토큰과 다음 위치 반환"""
+        if position < len(code) and code[position][TEXT] == '(':
+            end = self.class_extractor.skip_balanced(code, position, '(', ')')
+            return code[position + 1:end - 1], end
+        return [], position
+    
+    def _token_string_argument(self, arguments, names):
+        """어노테이션 인자에서 지정한 이름(또는 단일 값)의 첫 번째 문자열"""
+        for part in self.class_extractor.split_top_level(arguments):
+            if len(part) > 2 and part[0][KIND] == IDENT and part[1][TEXT] == '=':
+                if part[0][TEXT] not in names:
+                    continue
+                part = part[2:]
+            strings = [token for token in part if token[KIND] == STRING]
+            if strings:
+                return string_value(strings[0])
+        return None
+    
+    def _token_request_method(self, arguments):
+        """RequestMapping의 method 속성 (RequestMethod.POST → POST, 없으면 GET)"""
+        for part in self.class_extractor.split_top_level(arguments):
+            if len(part) > 2 and part[0][TEXT] == 'method' and part[1][TEXT] == '=':
+                members = [token[TEXT] for token in part[2:] if token[KIND] == IDENT and token[TEXT] != 'RequestMethod']
+                if members:
+                    return members[0]
+        return 'GET'
+    
+    def _read_method_declaration(self, code, position):
+        """매핑 어노테이션 뒤의 메서드 선언 읽기 ((설명, 이름, 반환 타입, 파라미터), 다음 위치)"""
+        start = position
+        while position < len(code) and code[position][TEXT] not in ('(', '{', ';'):
+            if code[position][KIND] == ANNOTATION:
+                _, position = self._read_annotation_arguments(code, position + 1)
+                continue
+            position += 1
+        if position >= len(code) or code[position][TEXT] != '(' or code[position - 1][KIND] != IDENT:
+            return None, position
+        
+        # 같은 선언부의 다른 어노테이션(설명 포함)과 수식어를 건너뛰어 반환 타입 확인
+        _, _, offset = self.class_extractor.parse_modifiers(code[start:position - 1])
+        return_tokens = code[start + offset:position - 1]
+        response_type = next((token[TEXT] for token in return_tokens if token[KIND] == IDENT), "void")
+        
+        description = None
+        for index in range(start, position):
+            token = code[index]
+            if token[KIND] == ANNOTATION and annotation_name(token) in ('Operation', 'ApiOperation'):
+                arguments, _ = self._read_annotation_arguments(code, index + 1)
+                description = self._token_string_argument(arguments, ('summary', 'value'))
+        
+        end = self.class_extractor.skip_balanced(code, position, '(', ')')
+        params = []
+        for part in self.class_extractor.split_top_level(code[position + 1:end - 1]):
+            param_annotations, _, offset = self.class_extractor.parse_modifiers(part)
+            part = part[offset:]
+            if len(part) >= 2 and part[-1][KIND] == IDENT:
+                params.append({
+                    'annotations': param_annotations,
+                    'type': next((token[TEXT] for token in part if token[KIND] == IDENT), "Object"),
+                    'name': part[-1][TEXT]
+                })
+        
+        return (description, code[position - 1][TEXT], response_type, params), end
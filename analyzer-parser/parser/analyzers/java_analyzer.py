@@ -1,6 +1,10 @@
+import concurrent.futures
 import logging
+import multiprocessing
 import re
+import threading
 from ..extractors.class_extractor import ClassInfoExtractor
+from ..extractors.java_lexer import JavaLexer
 from ..extractors.javadoc_extractor import JavadocExtractor
 from ..extractors.todo_extractor import TodoExtractor
 
@@ -9,14 +13,25 @@ logger = logging.getLogger("analyzer.parser.java_analyzer")
 class CodeComplexityAnalyzer:
     """코드 복잡도 분석기"""
     
-    def calculate_complexity(self, content):
-        """코드 복잡성 지표 계산"""
+    BRANCH_KEYWORDS = ('if', 'case')  # else if는 if 하나로 계산
+    LOOP_KEYWORDS = ('for', 'while', 'do')
+    
+    def __init__(self, lexer=None):
+        self.lexer = lexer or JavaLexer()
+    
+    def calculate_complexity(self, content, tokens=None, class_info=None):
+        """코드 복잡성 지표 계산 (문자열·주석 안의 키워드는 세지 않음)"""
+        if tokens is None:
+            tokens = self.lexer.tokenize(content)
+        if class_info is None:
+            class_info = ClassInfoExtractor(self.lexer).extract(content, tokens)
+        
         complexity = {
             'lines': len(content.splitlines()),
-            'methods': len(re.findall(r'\b(public|private|protected)\s+[\w<>\[\]]+\s+\w+\s*\([^)]*\)\s*(\{|throws)', content)),
-            'conditional_branches': len(re.findall(r'\b(if|else if|case)\b', content)),
-            'loops': len(re.findall(r'\b(for|while|do)\b', content)),
-            'try_catch': len(re.findall(r'\btry\b', content))
+            'methods': len(class_info.get('methods', [])),
+            'conditional_branches': tokens.count_words(self.BRANCH_KEYWORDS),
+            'loops': tokens.count_words(self.LOOP_KEYWORDS),
+            'try_catch': tokens.count_words(('try',))
         }
         
         # 사이클로매틱 복잡도 근사값 계산
@@ -38,67 +53,230 @@ class CodeComplexityAnalyzer:
 class JavaAnalyzer:
     """Java 파일 분석 전담 클래스"""
     
-    def __init__(self):
-        self.class_extractor = ClassInfoExtractor()
-        self.code_analyzer = CodeComplexityAnalyzer()
-        self.javadoc_extractor = JavadocExtractor()
-        self.todo_extractor = TodoExtractor()
+    # 추출 로직이 바뀌면 올려서 파일 단위 캐시를 무효화
+    EXTRACTOR_VERSION = "6"
     
-    def analyze_all(self, java_files):
-        """모든 Java 파일 분석"""
-        analyzed_files = []
+    # 파일 단위 캐시에 저장되는 분석 결과 항목
+    CACHED_FIELDS = ('class_info', 'method_spans', 'complexity', 'javadocs', 'todos')
+    
+    def __init__(self, file_cache=None, max_workers=1, batch_bytes=1024 * 1024, min_parallel_files=64):
+        # 파일마다 한 번만 토큰화하고 모든 추출기가 같은 토큰 스트림을 사용
+        self.lexer = JavaLexer()
+        self.class_extractor = ClassInfoExtractor(self.lexer)
+        self.code_analyzer = CodeComplexityAnalyzer(self.lexer)
+        self.javadoc_extractor = JavadocExtractor(self.lexer)
+        self.todo_extractor = TodoExtractor(self.lexer)
+        self.file_cache = file_cache
         
-        for file_info in java_files:
-            analyzed = self.analyze_file(file_info)
-            analyzed_files.append(analyzed)
+        # 프로젝트 내부 병렬 분석 설정 (max_workers가 1이면 순차 분석)
+        self.max_workers = max_workers
+        self.batch_bytes = batch_bytes
+        self.min_parallel_files = min_parallel_files
+        self._executor = None
+        self._executor_lock = threading.Lock()
+    
+    def analyze_all(self, java_files, cache_stats=None, cancel_token=None):
+        """모든 Java 파일 분석 (cache_stats가 주어지면 캐시 적중 통계 기록)
+        
+        결과 순서는 입력 순서와 같으며, 분석에 실패한 파일은 analysis_error가 기록된 채 포함된다.
+        cancel_token이 주어지면 배치(batch_bytes 단위)마다 취소/기한 초과를 확인한다.
+        """
+        analyzed_files = [None] * len(java_files)
+        pending = []  # (index, file_info, cache_key)
+        
+        # 캐시 적중 파일은 바로 채우고 나머지만 분석 대상으로 모음
+        for index, file_info in enumerate(java_files):
+            cache_key = None
+            if self.file_cache:
+                cache_key = self.file_cache.make_key(file_info['content'], self.EXTRACTOR_VERSION)
+                cached = self.file_cache.get(cache_key)
+                if cached is not None:
+                    analyzed_files[index] = self._restore_result(file_info, cached)
+                    continue
+            pending.append((index, file_info, cache_key))
+        
+        # 캐시에 없는 파일 분석 (파일 수가 충분하면 프로세스 풀에 배치로 분배)
+        files_to_analyze = [file_info for _, file_info, _ in pending]
+        if self.max_workers > 1 and len(files_to_analyze) >= self.min_parallel_files:
+            results = self._analyze_parallel(files_to_analyze, cancel_token)
+        elif cancel_token:
+            results = []
+            for batch in self.make_batches(files_to_analyze, self.batch_bytes):
+                cancel_token.check()
+                results.extend(self.analyze_file_safely(file_info) for file_info in batch)
+        else:
+            results = [self.analyze_file_safely(file_info) for file_info in files_to_analyze]
+        
+        for (index, _, cache_key), result in zip(pending, results):
+            analyzed_files[index] = result
+            if cache_key and 'analysis_error' not in result:
+                self.file_cache.put(cache_key, {field: result[field] for field in self.CACHED_FIELDS})
+        
+        failed = sum(1 for result in results if 'analysis_error' in result)
+        if failed:
+            logger.warning(f"Java 파일 {failed}개 분석 실패 (결과에 analysis_error로 기록)")
+        
+        if self.file_cache:
+            total = len(java_files)
+            hits = total - len(pending)
+            hit_ratio = round(hits / total, 4) if total else 0
+            logger.info(f"Java 파일 캐시 적중: {hits}/{total} ({hit_ratio:.1%})")
+            if cache_stats is not None:
+                cache_stats.update({
+                    'hits': hits,
+                    'misses': total - hits,
+                    'hit_ratio': hit_ratio
+                })
             
         return analyzed_files
     
+    def _analyze_parallel(self, java_files, cancel_token=None):
+        """파일을 바이트 크기 기준 배치로 나누어 프로세스 풀에서 분석 (입력 순서 유지)"""
+        batches = self.make_batches(java_files, self.batch_bytes)
+        logger.info(f"Java 파일 {len(java_files)}개를 {len(batches)}개 배치로 병렬 분석 (workers={self.max_workers})")
+        
+        executor = self._get_executor()
+        futures = [executor.submit(_analyze_batch, batch) for batch in batches]
+        results = []
+        try:
+            # 제출 순서대로 결과를 모으므로 배치 순서 = 입력 순서
+            for future in futures:
+                results.extend(future.result())
+                if cancel_token:
+                    cancel_token.check()
+        finally:
+            # 취소/오류로 중단되면 아직 시작하지 않은 배치는 실행하지 않음 (공유 풀이라 종료하지 않음)
+            for future in futures:
+                future.cancel()
+        return results
+    
+    @staticmethod
+    def make_batches(java_files, batch_bytes):
+        """파일 수가 아닌 내용 크기 합계로 배치 구성"""
+        batches = []
+        current, current_bytes = [], 0
+        for file_info in java_files:
+            size = len(file_info['content'])
+            if current and current_bytes + size > batch_bytes:
+                batches.append(current)
+                current, current_bytes = [], 0
+            current.append(file_info)
+            current_bytes += size
+        if current:
+            batches.append(current)
+        return batches
+    
+    def _get_executor(self):
+        """병렬 분석용 프로세스 풀 (처음 사용할 때 생성하여 작업 간 공유)"""
+        with self._executor_lock:
+            if self._executor is None:
+                # 여러 스레드가 동작 중인 프로세스에서 fork하면 잠금 상태가 복제될 수 있어 spawn 사용
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+    
+    def shutdown(self):
+        """병렬 분석용 프로세스 풀 종료"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+    
+    def analyze_file_safely(self, file_info):
+        """단일 파일 분석 - 실패하면 작업 전체를 중단하지 않고 오류를 결과에 기록"""
+        try:
+            return self.analyze_file(file_info)
+        except Exception as e:
+            logger.error(f"Java 파일 분석 오류 {file_info.get('path')}: {str(e)}")
+            return self._error_result(file_info, str(e))
+    
+    def _error_result(self, file_info, error):
+        """분석에 실패한 파일의 결과 (빈 분석 항목과 analysis_error 기록)"""
+        result = dict(file_info)
+        result['class_info'] = {}
+        result['method_spans'] = []
+        result['complexity'] = None
+        result['javadocs'] = []
+        result['todos'] = []
+        result['analysis_error'] = error
+        return result
+    
+    def _restore_result(self, file_info, fields):
+        """캐시 항목(CACHED_FIELDS)으로 analyze_file과 같은 결과 복원"""
+        result = self._prepare_result(file_info)
+        result.update(fields)
+        result['file_type'] = self.determine_file_type(file_info['path'], result['class_info'])
+        return result
+    
+    def to_shard_results(self, analyzed_files):
+        """다른 노드로 보낼 파일별 분석 항목만 추림 (내용은 보내지 않음, 실패한 파일은 analysis_error만)"""
+        return [
+            {'analysis_error': result['analysis_error']} if 'analysis_error' in result
+            else {field: result[field] for field in self.CACHED_FIELDS}
+            for result in analyzed_files
+        ]
+    
+    def merge_shard_results(self, java_files, shard_results):
+        """to_shard_results 형식의 결과를 원래 파일 정보와 합쳐 analyze_all과 같은 결과 목록 생성"""
+        return [
+            self._error_result(file_info, fields['analysis_error']) if 'analysis_error' in fields
+            else self._restore_result(file_info, fields)
+            for file_info, fields in zip(java_files, shard_results)
+        ]
+    
     def analyze_file(self, file_info):
         """단일 Java 파일 분석"""
-        content = file_info['content']
-        
         # 임포트 제거
-        cleaned_content = self.code_analyzer.remove_imports(content)
+        result = self._prepare_result(file_info)
+        cleaned_content = result['content']
         
-        # 파일 유형 판별
-        file_type = self.determine_file_type(file_info['path'], content)
+        # 한 번의 스캔으로 토큰 스트림 생성 (import 제거는 주석/코드 토큰에 영향 없음)
+        tokens = self.lexer.tokenize(cleaned_content)
         
-        # 클래스 정보 추출
-        class_info = self.class_extractor.extract(cleaned_content)
+        # 클래스 정보 및 메서드 위치 표 추출 (같은 토큰 스캔에서 함께 계산)
+        method_spans = []
+        class_info = self.class_extractor.extract(cleaned_content, tokens, method_spans=method_spans)
         
         # 코드 복잡도 계산
-        complexity = self.code_analyzer.calculate_complexity(cleaned_content)
+        complexity = self.code_analyzer.calculate_complexity(cleaned_content, tokens, class_info)
         
         # JavaDoc 및 TODO 추출
-        javadocs = self.javadoc_extractor.extract(content)
-        todos = self.todo_extractor.extract(content)
+        javadocs = self.javadoc_extractor.extract(cleaned_content, tokens)
+        todos = self.todo_extractor.extract(cleaned_content, tokens)
         
         # 결과 병합
-        result = dict(file_info)
-        result['content'] = cleaned_content
-        result['file_type'] = file_type
         result['class_info'] = class_info
+        result['method_spans'] = method_spans
         result['complexity'] = complexity
         result['javadocs'] = javadocs
         result['todos'] = todos
+        result['file_type'] = self.determine_file_type(file_info['path'], class_info)
         
         return result
     
-    def determine_file_type(self, path, content):
-        """Java 파일 유형 판별"""
-        if 'Controller' in path and ('@Controller' in content or '@RestController' in content):
+    def _prepare_result(self, file_info):
+        """캐시 대상이 아닌 기본 결과 생성 (임포트 제거)"""
+        result = dict(file_info)
+        result['content'] = self.code_analyzer.remove_imports(file_info['content'])
+        return result
+    
+    def determine_file_type(self, path, class_info):
+        """Java 파일 유형 판별 (주석/문자열이 아닌 실제 어노테이션과 선언 기준)"""
+        annotations = set(class_info.get('annotations', []))
+        if 'Controller' in path and ('Controller' in annotations or 'RestController' in annotations):
             return 'controller'
-        elif 'Service' in path and '@Service' in content:
+        elif 'Service' in path and 'Service' in annotations:
             return 'service'
-        elif 'Repository' in path and '@Repository' in content:
+        elif 'Repository' in path and 'Repository' in annotations:
             return 'repository'
-        elif '@Entity' in content:
+        elif 'Entity' in annotations:
             return 'entity'
-        elif '@Configuration' in content:
+        elif 'Configuration' in annotations:
             return 'config'
         elif ('DTO' in path or 'Dto' in path or 'dto' in path.lower() or 
-              'Request' in path or 'Response' in path or 'record' in content.lower()):
+              'Request' in path or 'Response' in path or class_info.get('type') == 'record'):
             return 'dto'
         elif 'Mapper' in path:
             return 'mapper'
@@ -109,4 +287,15 @@ class JavaAnalyzer:
         elif '.dto.' in path.lower():
             return 'dto'
         
-        return None
\ No newline at end of file
+        return None
+
+
+# 병렬 분석 시 자식 프로세스마다 한 번만 생성하여 재사용
+_batch_analyzer = None
+
+def _analyze_batch(batch):
+    """자식 프로세스에서 파일 배치 분석"""
+    global _batch_analyzer
+    if _batch_analyzer is None:
+        _batch_analyzer = JavaAnalyzer()
+    return [_batch_analyzer.analyze_file_safely(file_info) for file_info in batch]
@@ -6,26 +6,20 @@ logger = logging.getLogger("analyzer.parser.relationship_analyzer")
 class RelationshipAnalyzer:
     """클래스 관계 분석 클래스"""
     
-    def analyze(self, files_info):
+    IDENTIFIER_PATTERN = re.compile(r'(?:[^\W\d]|\$)[\w$]*')
+    
+    def analyze(self, project_index):
         """클래스 간의 관계(의존성, 상속 등) 추출"""
         relationships = []
-        class_map = {}
         
-        # 클래스 이름을 파일 정보에 매핑하는 맵 구축
-        self.build_class_map(files_info, class_map)
+        # 클래스 이름을 파일 정보에 매핑하는 맵 (프로젝트 색인에서 조회)
+        class_map = project_index.class_map()
         
         # 관계 분석
         self.analyze_relationships(class_map, relationships)
         
         return relationships
     
-    def build_class_map(self, files_info, class_map):
-        """클래스 이름과 파일 매핑"""
-        for file_info in files_info:
-            if file_info.get('class_info') and file_info['class_info'].get('name'):
-                class_name = file_info['class_info']['name']
-                class_map[class_name] = file_info
-    
     def analyze_relationships(self, class_map, relationships):
         """모든 클래스 관계 분석"""
         for source_class, source_info in class_map.items():
@@ -99,13 +93,19 @@ class RelationshipAnalyzer:
                     })
     
     def analyze_autowired_dependencies(self, relationships, source_class, source_info, class_map):
-        """@Autowired 의존성 분석"""
-        content = source_info['content']
-        for target_class in class_map.keys():
-            # 필드나 생성자 파라미터에서 autowired 검색
-            if re.search(r'@Autowired[^;]*' + target_class, content):
+        """@Autowired 의존성 분석 (주입 지점의 식별자를 클래스 맵에서 해시 조회)"""
+        for identifier in self.injection_identifiers(source_info['class_info']):
+            if identifier in class_map:
                 relationships.append({
                     'source': source_class,
-                    'target': target_class,
+                    'target': identifier,
                     'type': 'autowires'
-                })
\ No newline at end of file
+                })
+    
+    def injection_identifiers(self, class_info):
+        """주입 지점(@Autowired 필드/세터/생성자, @RequiredArgsConstructor final 필드) 타입의 식별자 (List<Foo> → List, Foo)"""
+        identifiers = {}
+        for injection in class_info.get('injections', []):
+            for identifier in self.IDENTIFIER_PATTERN.findall(injection['type']):
+                identifiers[identifier] = True
+        return list(identifiers)
\ No newline at end of file
@@ -1,14 +1,23 @@
 import logging
-from pathlib import Path
 
 logger = logging.getLogger("analyzer.parser.structure_analyzer")
 
 class StructureAnalyzer:
     """프로젝트 구조 분석 클래스"""
     
-    def analyze(self, source_dir):
-        """어노테이션을 기반으로 Spring Boot 프로젝트 구조 분석"""
-        structure = {
+    def analyze(self, project_index):
+        """어노테이션을 기반으로 Spring Boot 프로젝트 구조 분석 (수집된 색인만 사용, 디스크 접근 없음)"""
+        structure = self.create_structure()
+        
+        for file_info in project_index.java_files():
+            # Spring 어노테이션 및 명명 규칙에 기반한 분류
+            self.classify_file(structure, file_info['path'], file_info['content'])
+        
+        return structure
+    
+    def create_structure(self):
+        """빈 구조 정보 생성"""
+        return {
             'controllers': [],     # @Controller, @RestController
             'services': [],        # @Service
             'repositories': [],    # @Repository
@@ -22,20 +31,6 @@ class StructureAnalyzer:
             'exceptions': [],      # Exception classes
             'tests': []            # @Test
         }
-        
-        source = Path(source_dir)
-        for path in source.rglob("*.java"):
-            try:
-                relative_path = path.relative_to(source)
-                content = path.read_text(encoding='utf-8', errors='ignore')
-                
-                # Spring 어노테이션 및 명명 규칙에 기반한 분류
-                self.classify_file(structure, str(relative_path), content)
-                
-            except Exception as e:
-                logger.error(f"파일 분석 오류 {path}: {str(e)}")
-        
-        return structure
     
     def classify_file(self, structure, relative_path, content):
         """파일 내용 및 경로를 기반으로 분류"""
@@ -0,0 +1,61 @@
+import logging
+import javalang
+
+logger = logging.getLogger("analyzer.parser.ast_store")
+
+class AstStore:
+    """프로젝트 분석 작업 하나 동안 Java 파일의 javalang AST를 공유하는 저장소
+    
+    파일마다 처음 요청될 때 한 번만 파싱하고, 파싱에 실패한 파일은 기억해 두어 다시 시도하지 않는다.
+    get()이 None을 반환하면 호출자는 토큰/정규식 기반 경로로 대체해야 한다.
+    """
+    
+    def __init__(self):
+        self._trees = {}     # path -> CompilationUnit
+        self._failures = {}  # path -> 파싱 오류 메시지
+        self.stats = {
+            "parsed": 0,
+            "failed": 0,
+            "reused": 0
+        }
+    
+    def get(self, file_info):
+        """파일의 AST 반환 (처음 요청 시 파싱, 실패한 파일은 None)"""
+        path = file_info['path']
+        
+        tree = self._trees.get(path)
+        if tree is not None:
+            self.stats["reused"] += 1
+            return tree
+        if path in self._failures:
+            return None
+        
+        try:
+            tree = javalang.parse.parse(file_info['content'])
+        except Exception as e:
+            # javalang 오류는 메시지가 비어 있는 경우가 많아 예외 타입도 함께 기록
+            error = f"{type(e).__name__}: {str(e)}" if str(e) else type(e).__name__
+            self._failures[path] = error
+            self.stats["failed"] += 1
+            logger.warning(f"AST 파싱 실패, 토큰 기반 분석으로 대체: {path} - {error}")
+            return None
+        
+        self._trees[path] = tree
+        self.stats["parsed"] += 1
+        return tree
+    
+    def peek(self, path):
+        """이미 파싱된 AST만 반환 (파싱하지 않음)"""
+        return self._trees.get(path)
+    
+    def failed(self, path):
+        """파싱에 실패한 파일인지 확인"""
+        return path in self._failures
+    
+    def get_failure(self, path):
+        """파싱 실패 사유 (실패하지 않았으면 None)"""
+        return self._failures.get(path)
+    
+    def get_stats(self):
+        """파싱/재사용/실패 횟수 반환"""
+        return dict(self.stats)
@@ -1,149 +1,466 @@
 import logging
-import re
+from .java_lexer import (
+    JavaLexer, ANNOTATION, IDENT, STRING, SYMBOL, KIND, TEXT, START, DEPTH,
+    annotation_name, string_value
+)
 
 logger = logging.getLogger("analyzer.parser.extractors.class")
 
 class ClassInfoExtractor:
-    """Java 클래스 정보 추출 클래스"""
+    """Java 클래스 정보 추출 클래스 (렉서 토큰 스트림 기반)"""
     
-    def extract(self, content):
-        """상속 및 인터페이스를 포함한 종합적인 클래스 정보 추출"""
-        class_info = {}
+    TYPE_KEYWORDS = ('class', 'interface', 'enum', 'record')
+    MODIFIERS = {
+        'public', 'protected', 'private', 'static', 'final', 'abstract', 'default',
+        'synchronized', 'native', 'transient', 'volatile', 'strictfp', 'sealed'
+    }
+    ACCESS_MODIFIERS = ('public', 'protected', 'private')
+    
+    def __init__(self, lexer=None):
+        self.lexer = lexer or JavaLexer()
+    
+    def extract(self, content, tokens=None, method_spans=None):
+        """상속 및 인터페이스를 포함한 종합적인 클래스 정보 추출
         
-        # 일반 클래스/인터페이스/열거형 매칭 시도
-        class_match = re.search(r'(public|private|protected)?\s*(class|interface|enum|@interface)\s+(\w+)(?:\s+extends\s+(\w+))?(?:\s+implements\s+([\w\s,]+))?', content)
+        method_spans 목록이 주어지면 methods와 같은 순서의 메서드 위치 표를 채운다.
+        """
+        if tokens is None:
+            tokens = self.lexer.tokenize(content)
+        code = tokens.code
         
-        if class_match:
-            class_info = self.extract_class_info(class_match)
-        else:
-            # 레코드 선언 매칭 시도
-            record_match = re.search(r'(public|private|protected)?\s*record\s+(\w+)\s*\((.*?)\)(?:\s+implements\s+([\w\s,]+))?', content)
-            if record_match:
-                class_info = self.extract_record_info(record_match)
+        # 파일의 첫 번째 타입 선언 (클래스/인터페이스/열거형/어노테이션/레코드)
+        declaration_index = self.find_type_declaration(code)
         
         # 클래스나 레코드를 찾지 못한 경우 빈 정보 반환
-        if not class_info:
+        if declaration_index is None:
             return {}
         
-        # 일반 클래스의 경우 필드 추출
+        class_info, body_index = self.extract_class_info(code, declaration_index)
+        type_annotations = [annotation_name(token) for token in code[:declaration_index] if token[KIND] == ANNOTATION]
+        
+        # 클래스 본문의 필드, 메서드, 생성자 추출
+        fields, methods, constructors = self.extract_members(code, body_index, class_info)
+        
+        # 일반 클래스의 경우 필드 추출 (레코드는 컴포넌트가 필드)
         if class_info.get('type') != 'record':
-            class_info['fields'] = self.extract_fields(content)
+            class_info['fields'] = [self.to_field_info(field) for field in fields]
         
         # 메서드 추출
-        class_info['methods'] = self.extract_methods(content, class_info)
+        class_info['methods'] = [self.to_method_info(method, class_info) for method in methods]
+        if method_spans is not None:
+            method_spans.extend(self.to_method_span(method) for method in methods)
         
-        # 클래스 레벨의 어노테이션 추출
-        class_info['annotations'] = self.extract_annotations(content)
+        # 어노테이션 추출 (주석과 문자열 안의 어노테이션은 제외)
+        class_info['annotations'] = self.extract_annotations(content, tokens)
+        class_info['type_annotations'] = type_annotations
+        class_info['annotation_values'] = self.extract_annotation_values(code)
+        
+        # 의존성 주입 지점 (@Autowired 필드/세터/생성자, Lombok 생성자 주입)
+        class_info['injections'] = self.extract_injections(fields, methods, constructors, type_annotations)
         
         return class_info
     
-    def extract_class_info(self, class_match):
-        """클래스 기본 정보 추출"""
+    def find_type_declaration(self, code):
+        """첫 번째 타입 선언 키워드의 토큰 인덱스"""
+        for index, token in enumerate(code):
+            if token[KIND] != IDENT or token[TEXT] not in self.TYPE_KEYWORDS:
+                continue
+            if index + 1 >= len(code) or code[index + 1][KIND] != IDENT:
+                continue
+            # Foo.class 같은 클래스 리터럴 제외
+            if index > 0 and code[index - 1][TEXT] == '.':
+                continue
+            # record는 문맥 키워드이므로 "record 이름(" 또는 "record 이름<" 형태만 인정
+            if token[TEXT] == 'record':
+                if index + 2 >= len(code) or code[index + 2][TEXT] not in ('(', '<'):
+                    continue
+            return index
+        return None
+    
+    def extract_class_info(self, code, index):
+        """클래스 기본 정보 추출 (클래스 정보, 본문 '{' 인덱스 반환)"""
+        keyword = code[index][TEXT]
+        type_name = keyword
+        if keyword == 'interface' and index > 0 and code[index - 1][TEXT] == '@':
+            type_name = '@interface'
+        
+        # 선언 키워드 앞의 수식어에서 접근 제어자 확인
+        modifiers = []
+        back = index - 1 if type_name != '@interface' else index - 2
+        while back >= 0 and code[back][KIND] == IDENT and code[back][TEXT] in self.MODIFIERS:
+            modifiers.append(code[back][TEXT])
+            back -= 1
+        
         class_info = {
-            'access': class_match.group(1) if class_match.group(1) else "default",
-            'type': class_match.group(2),
-            'name': class_match.group(3)
+            'access': self.find_access(modifiers),
+            'type': type_name,
+            'name': code[index + 1][TEXT]
         }
         
-        if class_match.group(4):  # extends
-            class_info['extends'] = class_match.group(4)
+        # 선언부 파싱 (타입 매개변수, 레코드 컴포넌트, extends/implements)
+        depth = code[index][DEPTH]
+        position = index + 2
+        if position < len(code) and code[position][TEXT] == '<':
+            position = self.skip_balanced(code, position, '<', '>')
+        
+        if keyword == 'record' and position < len(code) and code[position][TEXT] == '(':
+            end = self.skip_balanced(code, position, '(', ')')
+            class_info['fields'] = [
+                {
+                    'access': 'private final',  # 레코드는 private final 필드를 가짐
+                    'type': param['type'],
+                    'name': param['name']
+                }
+                for param in self.parse_parameters(code[position + 1:end - 1])
+            ]
+            position = end
+        
+        clause = None
+        clauses = {'extends': [], 'implements': [], 'permits': []}
+        while position < len(code):
+            token = code[position]
+            if token[TEXT] == '{' and token[DEPTH] == depth:
+                break
+            if token[KIND] == IDENT and token[TEXT] in clauses:
+                clause = token[TEXT]
+            elif clause:
+                clauses[clause].append(token)
+            position += 1
+        
+        if clauses['extends']:
+            # 인터페이스의 다중 상속은 첫 번째 상위 타입만 기록
+            class_info['extends'] = self.split_type_names(clauses['extends'])[0]
+        if clauses['implements']:
+            class_info['implements'] = self.split_type_names(clauses['implements'])
+        
+        return class_info, position
+    
+    def extract_members(self, code, body_index, class_info):
+        """클래스 본문 깊이의 선언문을 순서대로 모아 필드/메서드/생성자로 분류"""
+        fields, methods, constructors = [], [], []
+        if body_index >= len(code):
+            return fields, methods, constructors
         
-        if class_match.group(5):  # implements
-            interfaces = [i.strip() for i in class_match.group(5).split(',')]
-            class_info['implements'] = interfaces
+        body_depth = code[body_index][DEPTH] + 1
+        statement = []
+        has_initializer = False
+        paren_depth = 0  # 어노테이션 인자(@Transactional(readOnly = true)) 안의 '='는 초기값이 아님
+        position = body_index + 1
+        
+        while position < len(code):
+            token = code[position]
+            text = token[TEXT]
             
-        return class_info
+            # 클래스 본문을 닫는 중괄호
+            if token[DEPTH] < body_depth:
+                break
+            
+            if token[DEPTH] == body_depth and token[KIND] == SYMBOL:
+                if text == ';':
+                    member = self.classify_member(statement, False, class_info, fields, methods, constructors)
+                    if member is not None:
+                        member.update(body_start=None, end=token[START] + 1)
+                    statement, has_initializer, paren_depth = [], False, 0
+                    position += 1
+                    continue
+                
+                if text == '{' and paren_depth == 0 and not has_initializer:
+                    # 메서드/생성자 본문, 초기화 블록, 중첩 타입 본문 - 선언부만 분류하고 본문은 건너뜀
+                    member = self.classify_member(statement, True, class_info, fields, methods, constructors)
+                    statement, paren_depth = [], 0
+                    position += 1
+                    while position < len(code) and not (code[position][TEXT] == '}' and code[position][DEPTH] == body_depth):
+                        position += 1
+                    if member is not None:
+                        # 닫는 중괄호가 없으면(잘린 파일) 마지막 토큰까지를 본문으로 봄
+                        last = code[min(position, len(code) - 1)]
+                        member.update(body_start=token[START], end=last[START] + len(last[TEXT]))
+                    position += 1
+                    continue
+                
+                if text == '(':
+                    paren_depth += 1
+                elif text == ')':
+                    paren_depth = max(paren_depth - 1, 0)
+                elif text == '=' and paren_depth == 0:
+                    # 필드 초기값의 배열/람다/익명 클래스 중괄호는 ';'까지 선언문에 포함
+                    has_initializer = True
+            
+            statement.append(token)
+            position += 1
+        
+        return fields, methods, constructors
     
-    def extract_record_info(self, record_match):
-        """레코드 정보 추출"""
-        class_info = {
-            'access': record_match.group(1) if record_match.group(1) else "default",
-            'type': 'record',
-            'name': record_match.group(2)
+    def classify_member(self, statement, has_body, class_info, fields, methods, constructors):
+        """선언문 하나를 필드, 메서드, 생성자 중 하나로 분류 (메서드/생성자이면 해당 정보 반환)"""
+        annotations, modifiers, position = self.parse_modifiers(statement)
+        rest = statement[position:]
+        if not rest:
+            return
+        
+        # 중첩 타입 선언은 건너뜀
+        if rest[0][TEXT] in self.TYPE_KEYWORDS or rest[0][TEXT] == '@':
+            return
+        
+        # 제네릭 메서드의 타입 매개변수
+        if rest[0][TEXT] == '<':
+            rest = rest[self.skip_balanced(rest, 0, '<', '>'):]
+        
+        paren_index = None
+        for index, token in enumerate(rest):
+            if token[TEXT] == '=':
+                break
+            if token[TEXT] == '(':
+                paren_index = index
+                break
+        
+        member = {
+            'annotations': annotations,
+            'access': self.find_access(modifiers),
+            'modifiers': modifiers,
+            'start': statement[0][START]
         }
         
-        # 필드로서의 레코드 컴포넌트 추출
-        fields = []
-        if record_match.group(3):
-            components = record_match.group(3).split(',')
-            for component in components:
-                component = component.strip()
-                if component:
-                    parts = component.split()
-                    if len(parts) >= 2:
-                        field_type = ' '.join(parts[:-1])
-                        field_name = parts[-1]
-                        fields.append({
-                            'access': 'private final',  # 레코드는 private final 필드를 가짐
-                            'type': field_type,
-                            'name': field_name
-                        })
-        
-        class_info['fields'] = fields
-        
-        if record_match.group(4):  # implements
-            interfaces = [i.strip() for i in record_match.group(4).split(',')]
-            class_info['implements'] = interfaces
+        if paren_index is not None:
+            head = rest[:paren_index]
+            if not head or head[-1][KIND] != IDENT:
+                return
             
-        return class_info
+            end = self.skip_balanced(rest, paren_index, '(', ')')
+            member['name'] = head[-1][TEXT]
+            member['parameters'] = self.parse_parameters(rest[paren_index + 1:end - 1])
+            member['has_body'] = has_body
+            
+            if len(head) == 1:
+                # 반환 타입이 없으면 생성자 (열거형 상수 등은 제외)
+                if member['name'] == class_info.get('name'):
+                    constructors.append(member)
+                    return member
+            else:
+                member['return_type'] = self.render_type(head[:-1])
+                methods.append(member)
+                return member
+            return
+        
+        if has_body:
+            return
+        
+        # 필드 선언 (int a = 1, b; 처럼 선언자가 여러 개일 수 있음)
+        declarators = self.split_declarators(rest)
+        first, initialized = declarators[0]
+        if len(first) < 2 or first[-1][KIND] != IDENT:
+            return
+        field_type = self.render_type(first[:-1])
+        fields.append(dict(member, type=field_type, name=first[-1][TEXT], initialized=initialized))
+        for declarator, initialized in declarators[1:]:
+            if len(declarator) == 1 and declarator[0][KIND] == IDENT:
+                fields.append(dict(member, type=field_type, name=declarator[0][TEXT], initialized=initialized))
     
-    def extract_fields(self, content):
+    def to_field_info(self, field):
         """필드 정보 추출"""
-        fields = []
-        field_pattern = r'(public|private|protected)?\s+(?:static\s+)?(?:final\s+)?([\w<>\[\]]+)\s+(\w+)\s*(?:=\s*[^;]+)?;'
-        for match in re.finditer(field_pattern, content):
-            field = {
-                'access': match.group(1) if match.group(1) else "default",
-                'type': match.group(2),
-                'name': match.group(3)
-            }
-            fields.append(field)
-        
-        return fields
-    
-    def extract_methods(self, content, class_info):
+        return {
+            'access': field['access'],
+            'type': field['type'],
+            'name': field['name']
+        }
+    
+    def to_method_span(self, method):
+        """메서드 위치 정보 (선언 시작, 본문 '{' 위치, 끝 다음 위치, 어노테이션; 본문이 없으면 body_start는 None)"""
+        return {
+            'name': method['name'],
+            'start': method['start'],
+            'body_start': method['body_start'],
+            'end': method['end'],
+            'annotations': method['annotations']
+        }
+    
+    def to_method_info(self, method, class_info):
         """메서드 정보 추출"""
-        methods = []
-        method_pattern = r'(public|private|protected)?\s+(?:static\s+)?(?:final\s+)?([\w<>\[\]]+)\s+(\w+)\s*\((.*?)\)\s*(?:throws\s+[\w,\s]+)?\s*(\{|\;)'
-        for match in re.finditer(method_pattern, content):
-            # 매개변수 추출
-            params = self.extract_parameters(match.group(4))
-            
-            method = {
-                'access': match.group(1) if match.group(1) else "default",
-                'return_type': match.group(2),
-                'name': match.group(3),
-                'parameters': params,
-                'is_implementation': False
-            }
-            
-            # 인터페이스 메서드 구현인지 확인
-            if class_info.get('implements'):
-                # 이는 단순화된 확인 - 보다 정확한 구현은 실제 인터페이스 정의를 확인해야 함
-                method['is_implementation'] = True
-            
-            methods.append(method)
+        method_info = {
+            'access': method['access'],
+            'return_type': method['return_type'],
+            'name': method['name'],
+            'parameters': method['parameters'],
+            'is_implementation': False
+        }
+        
+        # 인터페이스 메서드 구현인지 확인
+        if class_info.get('implements'):
+            # 이는 단순화된 확인 - 보다 정확한 구현은 실제 인터페이스 정의를 확인해야 함
+            method_info['is_implementation'] = True
         
-        return methods
+        return method_info
     
     def extract_parameters(self, param_text):
-        """메서드 파라미터 추출"""
+        """메서드 파라미터 추출 (파라미터 목록 문자열)"""
+        return self.parse_parameters(self.lexer.tokenize(param_text).code)
+    
+    def parse_parameters(self, tokens):
+        """파라미터 토큰을 최상위 쉼표로 나누어 타입/이름 추출 (어노테이션과 final은 제외)"""
         params = []
-        if param_text:
-            param_entries = [p.strip() for p in param_text.split(',') if p.strip()]
-            for param in param_entries:
-                param_parts = param.split()
-                if len(param_parts) >= 2:
-                    param_type = ' '.join(param_parts[:-1])
-                    param_name = param_parts[-1]
-                    params.append({'type': param_type, 'name': param_name})
+        for part in self.split_top_level(tokens):
+            _, _, position = self.parse_modifiers(part)
+            part = part[position:]
+            if len(part) >= 2 and part[-1][KIND] == IDENT:
+                params.append({'type': self.render_type(part[:-1]), 'name': part[-1][TEXT]})
         return params
     
-    def extract_annotations(self, content):
-        """클래스 레벨 어노테이션 추출"""
-        annotations = []
-        annotation_pattern = r'@(\w+)(?:\([^)]*\))?'
-        for match in re.finditer(annotation_pattern, content):
-            annotations.append(match.group(1))
-        
-        return annotations
\ No newline at end of file
+    def extract_annotations(self, content, tokens=None):
+        """코드에 사용된 어노테이션 이름 추출"""
+        if tokens is None:
+            tokens = self.lexer.tokenize(content)
+        return tokens.annotation_names()
+    
+    def extract_annotation_values(self, code):
+        """문자열 인자를 가진 어노테이션의 이름과 문자열 값 (@Value("${a}") → Value, ['${a}'])"""
+        annotation_values = []
+        for index, token in enumerate(code):
+            if token[KIND] != ANNOTATION or index + 1 >= len(code) or code[index + 1][TEXT] != '(':
+                continue
+            end = self.skip_balanced(code, index + 1, '(', ')')
+            values = [string_value(arg) for arg in code[index + 2:end - 1] if arg[KIND] == STRING]
+            if values:
+                annotation_values.append({'name': annotation_name(token), 'values': values})
+        return annotation_values
+    
+    def extract_injections(self, fields, methods, constructors, type_annotations=()):
+        """@Autowired 필드, 세터, 생성자 파라미터와 @RequiredArgsConstructor의 final 필드를 주입 지점으로 수집"""
+        injections = []
+        for field in fields:
+            if 'Autowired' in field['annotations']:
+                injections.append({'kind': 'field', 'type': field['type'], 'name': field['name']})
+        for method in methods:
+            if 'Autowired' in method['annotations'] and method['name'].startswith('set'):
+                for param in method['parameters']:
+                    injections.append({'kind': 'setter', 'type': param['type'], 'name': param['name']})
+        for constructor in constructors:
+            if 'Autowired' in constructor['annotations']:
+                for param in constructor['parameters']:
+                    injections.append({'kind': 'constructor', 'type': param['type'], 'name': param['name']})
+        if 'RequiredArgsConstructor' in type_annotations:
+            # Lombok이 초기값 없는 final 인스턴스 필드로 생성자를 만듦
+            for field in fields:
+                modifiers = field['modifiers']
+                if 'final' in modifiers and 'static' not in modifiers and not field['initialized']:
+                    injections.append({'kind': 'constructor', 'type': field['type'], 'name': field['name']})
+        return injections
+    
+    def parse_modifiers(self, tokens):
+        """선언 앞의 어노테이션(인자 포함)과 수식어를 읽고 다음 위치 반환"""
+        annotations, modifiers = [], []
+        position = 0
+        while position < len(tokens):
+            token = tokens[position]
+            if token[KIND] == ANNOTATION:
+                annotations.append(annotation_name(token))
+                position += 1
+                if position < len(tokens) and tokens[position][TEXT] == '(':
+                    position = self.skip_balanced(tokens, position, '(', ')')
+            elif token[KIND] == IDENT and token[TEXT] in self.MODIFIERS:
+                modifiers.append(token[TEXT])
+                position += 1
+            else:
+                break
+        return annotations, modifiers, position
+    
+    def find_access(self, modifiers):
+        """수식어 목록에서 접근 제어자 (없으면 default)"""
+        for modifier in modifiers:
+            if modifier in self.ACCESS_MODIFIERS:
+                return modifier
+        return "default"
+    
+    def skip_balanced(self, tokens, position, opening, closing):
+        """position의 여는 기호와 짝이 맞는 닫는 기호 다음 인덱스"""
+        balance = 0
+        while position < len(tokens):
+            text = tokens[position][TEXT]
+            if text == opening:
+                balance += 1
+            elif text == closing:
+                balance -= 1
+                if balance == 0:
+                    return position + 1
+            position += 1
+        return position
+    
+    def split_top_level(self, tokens):
+        """제네릭/괄호 안이 아닌 쉼표로 토큰 목록 분할"""
+        parts, current = [], []
+        nesting = 0
+        for token in tokens:
+            text = token[TEXT]
+            if text in ('<', '(', '['):
+                nesting += 1
+            elif text in ('>', ')', ']'):
+                nesting -= 1
+            elif text == ',' and nesting == 0:
+                parts.append(current)
+                current = []
+                continue
+            current.append(token)
+        if current:
+            parts.append(current)
+        return parts
+    
+    def split_declarators(self, tokens):
+        """필드 선언문을 선언자별로 나누고 초기값은 제외 ((선언자 토큰, 초기값 여부) 목록)"""
+        declarators, current = [], []
+        angle = paren = 0
+        in_initializer = False
+        for token in tokens:
+            text = token[TEXT]
+            if text in ('(', '[', '{'):
+                paren += 1
+            elif text in (')', ']', '}'):
+                paren -= 1
+            
+            if in_initializer:
+                if text == ',' and paren == 0:
+                    declarators.append((current, True))
+                    current, in_initializer = [], False
+                continue
+            
+            if text == '<':
+                angle += 1
+            elif text == '>':
+                angle -= 1
+            elif text == '=' and angle == 0 and paren == 0:
+                in_initializer = True
+                continue
+            elif text == ',' and angle == 0 and paren == 0:
+                declarators.append((current, False))
+                current = []
+                continue
+            current.append(token)
+        declarators.append((current, in_initializer))
+        return declarators
+    
+    def split_type_names(self, tokens):
+        """extends/implements 목록을 타입 이름 목록으로 변환 (제네릭 인자 제외)"""
+        names = []
+        for part in self.split_top_level(tokens):
+            name = []
+            for token in part:
+                if token[TEXT] == '<':
+                    break
+                if token[KIND] == IDENT or token[TEXT] == '.':
+                    name.append(token[TEXT])
+            if name:
+                names.append(''.join(name))
+        return names
+    
+    def render_type(self, tokens):
+        """타입 토큰을 소스 표기에 가까운 문자열로 변환 (타입 어노테이션 제외)"""
+        parts = []
+        previous_word = False
+        for token in tokens:
+            if token[KIND] == ANNOTATION:
+                continue
+            text = token[TEXT]
+            is_word = token[KIND] == IDENT or text == '?'
+            if is_word and previous_word:
+                parts.append(' ')
+            parts.append(', ' if text == ',' else text)
+            previous_word = is_word
+        return ''.join(parts)
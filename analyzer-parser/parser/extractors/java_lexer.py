@@ -0,0 +1,99 @@
+import logging
+import re
+from collections import Counter
+
+logger = logging.getLogger("analyzer.parser.extractors.lexer")
+
+# 토큰 종류
+JAVADOC = 'javadoc'
+COMMENT = 'comment'
+STRING = 'string'
+ANNOTATION = 'annotation'
+IDENT = 'ident'
+NUMBER = 'number'
+SYMBOL = 'symbol'
+
+# 토큰은 (종류, 텍스트, 시작 위치, 중괄호 깊이) 튜플이며 아래 인덱스로 접근
+KIND, TEXT, START, DEPTH = range(4)
+
+
+class JavaTokens:
+    """한 Java 파일의 토큰 스트림
+    
+    code에는 주석을 뺀 코드 토큰이, comments에는 주석(JavaDoc 포함) 토큰이 원본 순서대로 들어 있다.
+    '{'는 여는 위치의 깊이를, '}'는 닫힌 뒤의 깊이를 가지므로 짝이 맞는 중괄호는 깊이가 같다.
+    """
+    
+    def __init__(self, content, code, comments):
+        self.content = content
+        self.code = code
+        self.comments = comments
+        self._word_counts = None
+    
+    def count_words(self, words):
+        """코드 토큰 중 주어진 식별자/키워드의 등장 횟수 합계 (문자열·주석 제외)"""
+        if self._word_counts is None:
+            self._word_counts = Counter(token[TEXT] for token in self.code if token[KIND] == IDENT)
+        return sum(self._word_counts[word] for word in words)
+    
+    def annotation_names(self):
+        """코드에 등장한 어노테이션의 단순 이름 목록 (등장 순서)"""
+        return [annotation_name(token) for token in self.code if token[KIND] == ANNOTATION]
+    
+    def javadocs(self):
+        """JavaDoc 주석 토큰 목록"""
+        return [token for token in self.comments if token[KIND] == JAVADOC]
+
+
+def annotation_name(token):
+    """어노테이션 토큰의 단순 이름 (@org.foo.Bar → Bar)"""
+    return token[TEXT][1:].rsplit('.', 1)[-1]
+
+
+def string_value(token):
+    """문자열 리터럴 토큰에서 따옴표를 뺀 내용"""
+    text = token[TEXT]
+    if text.startswith('"""'):
+        return text[3:-3]
+    return text[1:-1]
+
+
+class JavaLexer:
+    """Java 소스를 한 번만 훑어 토큰 스트림을 만드는 렉서"""
+    
+    TOKEN_PATTERN = re.compile(
+        r'(?P<javadoc>/\*\*(?!/).*?\*/)'
+        r'|(?P<comment>/\*.*?\*/|//[^\n]*)'
+        r'|(?P<string>"""[\s\S]*?"""|"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\')'
+        r'|(?P<annotation>@(?!interface\b)(?:[^\W\d]|\$)[\w$]*(?:\.(?:[^\W\d]|\$)[\w$]*)*)'
+        r'|(?P<ident>(?:[^\W\d]|\$)[\w$]*)'
+        r'|(?P<number>\d[\w.]*)'
+        r'|(?P<symbol>[^\s\w])',
+        re.DOTALL
+    )
+    
+    def tokenize(self, content):
+        """소스 전체를 한 번 스캔하여 JavaTokens 생성"""
+        code = []
+        comments = []
+        depth = 0
+        
+        for match in self.TOKEN_PATTERN.finditer(content):
+            kind = match.lastgroup
+            text = match.group()
+            
+            if kind == JAVADOC or kind == COMMENT:
+                comments.append((kind, text, match.start(), depth))
+                continue
+            
+            if kind == SYMBOL:
+                if text == '{':
+                    code.append((kind, text, match.start(), depth))
+                    depth += 1
+                    continue
+                if text == '}':
+                    depth -= 1
+            
+            code.append((kind, text, match.start(), depth))
+        
+        return JavaTokens(content, code, comments)
@@ -1,16 +1,28 @@
 import re
+from .java_lexer import JavaLexer, COMMENT, KIND, TEXT
 
 class TodoExtractor:
     """TODO 및 FIXME 주석 추출 클래스"""
     
-    def extract(self, content):
-        """코드에서 TODO 및 FIXME 주석 추출"""
-        todo_pattern = r'(?://|/\*|^\s*\*)\s*(TODO|FIXME):\s*(.*?)(?:\*/|\n)'
-        todos = []
+    TODO_PATTERN = re.compile(r'(?://|/\*|^\s*\*)\s*(TODO|FIXME):\s*(.*?)(?:\*/|\n)', re.MULTILINE)
+    
+    def __init__(self, lexer=None):
+        self.lexer = lexer or JavaLexer()
+    
+    def extract(self, content, tokens=None):
+        """코드에서 TODO 및 FIXME 주석 추출 (주석 토큰만 검사하여 문자열 안의 TODO 제외)"""
+        if tokens is None:
+            tokens = self.lexer.tokenize(content)
         
-        for match in re.finditer(todo_pattern, content, re.MULTILINE):
-            todo_type = match.group(1)
-            todo_text = match.group(2).strip()
-            todos.append(f"{todo_type}: {todo_text}")
+        todos = []
+        for token in tokens.comments:
+            text = token[TEXT]
+            if 'TODO' not in text and 'FIXME' not in text:
+                continue
+            # 한 줄 주석 토큰에는 줄바꿈이 없으므로 종료 문자를 붙여 패턴을 맞춤
+            if token[KIND] == COMMENT and text.startswith('//'):
+                text += '\n'
+            for match in self.TODO_PATTERN.finditer(text):
+                todos.append(f"{match.group(1)}: {match.group(2).strip()}")
         
-        return todos
\ No newline at end of file
+        return todos
@@ -1,14 +1,21 @@
+import concurrent.futures
+import io
 import logging
 import mimetypes
-from pathlib import Path
+import os
+import threading
+import zipfile
+from pathlib import Path, PurePosixPath
 import re
 
+from .project_index import ProjectIndex
+
 logger = logging.getLogger("analyzer.file.collector")
 
 class FileCollector:
     """프로젝트 파일 수집 담당 클래스"""
     
-    def __init__(self):
+    def __init__(self, max_workers=1):
         # 제외할 불필요한 파일/디렉터리
         self.exclude_dirs = {
             '.git', 'build', 'out', '.idea', 'target', 'bin', '.mvn', 
@@ -29,6 +36,25 @@ class FileCollector:
         
         # 최대 파일 크기 (1MB)
         self.max_file_size_kb = 1024
+        
+        # 프로젝트 루트에서 찾을 README 파일
+        self.readme_files = ['README.md', 'README.txt', 'readme.md']
+        
+        # 넓은 디렉토리 트리 병렬 스캔/읽기 설정 (max_workers가 1이면 순차 수집)
+        self.max_workers = max_workers
+        self._executor = None
+        self._executor_lock = threading.Lock()
+    
+    def collect_index(self, source_dir=None, archive=None):
+        """분석 대상 파일을 수집하여 ProjectIndex 생성 (archive가 주어지면 ZIP에서 바로 수집)
+        
+        수집 이후의 단계는 디스크 대신 반환된 색인만 조회한다.
+        """
+        if archive is not None:
+            files_info, readme_content = self.collect_from_archive(archive)
+        else:
+            files_info, readme_content = self.collect_files(source_dir)
+        return ProjectIndex(files_info, readme_content)
     
     def collect_files(self, source_dir):
         """프로젝트 디렉토리에서 분석 대상 파일 수집"""
@@ -38,7 +64,7 @@ class FileCollector:
         
         # README 파일 찾기
         readme_content = None
-        for readme_file in ['README.md', 'README.txt', 'readme.md']:
+        for readme_file in self.readme_files:
             readme_path = source / readme_file
             if readme_path.exists():
                 try:
@@ -47,63 +73,179 @@ class FileCollector:
                 except:
                     pass
         
-        # 핵심 파일만 수집
-        for path in source.rglob('*'):
-            if path.is_file() and \
-               not any(exclude_dir in path.parts for exclude_dir in self.exclude_dirs) and \
-               path.name not in self.exclude_files and \
-               (path.suffix.lower() not in self.exclude_extensions or 
-                path.name in ['build.gradle', 'build.gradle.kts', 'settings.gradle.kts', 'pom.xml']):
+        # 핵심 파일만 수집 (제외 디렉토리는 내려가기 전에 잘라냄)
+        executor = self._get_executor() if self.max_workers > 1 else None
+        targets = self.walk_target_files(source, skipped_count, executor)
+        
+        root = os.path.join(str(source), '')
+        read = lambda target: self.read_target_file(root, *target)
+        for reason, file_info in (executor.map(read, targets) if executor else map(read, targets)):
+            if reason:
+                skipped_count[reason] += 1
+            else:
+                collected_files.append(file_info)
+        
+        logger.debug(f"디렉토리에서 {len(collected_files)}개 파일 수집 (건너뜀: {skipped_count})")
+        return collected_files, readme_content
+    
+    def walk_target_files(self, source_dir, skipped_count, executor=None):
+        """os.scandir로 분석 대상 파일의 (경로, 크기) 목록 수집 (순서는 rglob과 같은 디렉토리 전위 순서)
+        
+        executor가 주어지면 같은 깊이의 디렉토리들을 병렬로 스캔한다.
+        """
+        scanned = {}
+        level = [str(source_dir)]
+        while level:
+            results = executor.map(self.scan_directory, level) if executor else map(self.scan_directory, level)
+            next_level = []
+            for directory, result in zip(level, results):
+                scanned[directory] = result
+                next_level.extend(result[1])
+            level = next_level
+        
+        # 스캔 결과를 디렉토리 전위 순서로 이어 붙임
+        targets = []
+        stack = [str(source_dir)]
+        while stack:
+            files, subdirs, excluded = scanned.pop(stack.pop())
+            targets.extend(files)
+            skipped_count['excluded'] += excluded
+            stack.extend(reversed(subdirs))
+        return targets
+    
+    def scan_directory(self, directory):
+        """디렉토리 하나를 스캔하여 (대상 파일 (경로, 크기) 목록, 하위 디렉토리 목록, 제외 항목 수) 반환"""
+        files, subdirs, excluded = [], [], 0
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        # 제외 디렉토리는 하위 트리 전체를 스캔하지 않음
+                        if entry.name in self.exclude_dirs:
+                            excluded += 1
+                        else:
+                            subdirs.append(entry.path)
+                    elif entry.is_file():
+                        if self.is_target_name(entry.name):
+                            files.append((entry.path, entry.stat().st_size))
+                        else:
+                            excluded += 1
+        except OSError as e:
+            logger.warning(f"디렉토리 스캔 오류 {directory}: {str(e)}")
+        return files, subdirs, excluded
+    
+    def read_target_file(self, root, path, size):
+        """스캔한 파일 하나를 읽어 (건너뛴 이유, 파일 정보) 반환"""
+        # 파일 크기 제한 (1MB, 스캔할 때 얻은 크기 사용)
+        if size > self.max_file_size_kb * 1024:
+            return 'large', None
+        
+        try:
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+        except OSError as e:
+            logger.warning(f"파일 읽기 오류 {path}: {str(e)}")
+            return 'binary', None
+        
+        return None, self.build_file_info(Path(path[len(root):]), content, size)
+    
+    def _get_executor(self):
+        """병렬 수집용 스레드 풀 (처음 사용할 때 생성하여 작업 간 공유)"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="file-collector"
+                )
+            return self._executor
+    
+    def collect_from_archive(self, archive):
+        """ZIP 압축 해제 없이 중앙 디렉토리에서 분석 대상 멤버만 골라 메모리로 읽기
+        
+        archive는 ZIP 바이트 또는 ZIP 파일 경로
+        """
+        collected_files = []
+        skipped_count = {'binary': 0, 'large': 0, 'excluded': 0}
+        readme_content = None
+        
+        source = io.BytesIO(archive) if isinstance(archive, (bytes, bytearray, memoryview)) else archive
+        with zipfile.ZipFile(source, 'r') as zip_ref:
+            for member in zip_ref.infolist():
+                if member.is_dir():
+                    continue
                 
-                try:
-                    # 파일 크기 제한 (1MB)
-                    if path.stat().st_size > self.max_file_size_kb * 1024:
-                        skipped_count['large'] += 1
-                        continue
-                    
-                    relative_path = path.relative_to(source)
-                    
-                    try:
-                        content = path.read_text(encoding='utf-8', errors='ignore')
-                    except Exception:
-                        # 바이너리 파일 처리
-                        skipped_count['binary'] += 1
-                        continue
-                    
-                    file_info = {
-                        'path': str(relative_path),
-                        'package': '/'.join(relative_path.parts[:-1]),
-                        'content': content
-                    }
-
-                    # 파일 유형 및 추가 정보 판별
-                    if path.name in ['build.gradle', 'build.gradle.kts', 'settings.gradle.kts']:
-                        file_info['file_type'] = 'build'
-                    elif path.name == 'pom.xml':
-                        file_info['file_type'] = 'build'
-                    elif path.name in ['application.yml', 'application.yaml', 'application.properties']:
-                        file_info['file_type'] = 'config'
-                    elif path.suffix == '.java':
-                        # Java 파일의 추가 처리
-                        cleaned_content = self.remove_imports(content)
-                        file_type = self.determine_file_type(str(relative_path), content)
-                        
-                        file_info['content'] = cleaned_content
-                        file_info['file_type'] = file_type
-                        
-                        # 클래스 정보 등 추가 정보는 파서에서 별도로 추출
-                    elif path.suffix in ['.yml', '.yaml', '.properties']:
-                        file_info['file_type'] = 'config'
-                    else:
-                        file_info['file_type'] = 'resource'
-                    
-                    collected_files.append(file_info)
+                relative_path = PurePosixPath(member.filename)
+                
+                # 루트의 README 파일
+                if readme_content is None and member.filename in self.readme_files:
+                    readme_content = zip_ref.read(member).decode('utf-8', errors='ignore')
+                
+                # 이름만으로 제외 규칙 적용 (압축 해제 전)
+                if relative_path.is_absolute() or '..' in relative_path.parts or \
+                   not self.is_target_file(relative_path):
+                    skipped_count['excluded'] += 1
+                    continue
+                
+                # 파일 크기 제한 (중앙 디렉토리의 원본 크기 기준)
+                if member.file_size > self.max_file_size_kb * 1024:
+                    skipped_count['large'] += 1
+                    continue
                 
+                try:
+                    content = zip_ref.read(member).decode('utf-8', errors='ignore')
                 except Exception as e:
-                    print(f"File reading error {path}: {str(e)}")
+                    skipped_count['binary'] += 1
+                    logger.warning(f"압축 멤버 읽기 오류 {member.filename}: {str(e)}")
+                    continue
+                
+                collected_files.append(self.build_file_info(relative_path, content, member.file_size))
         
+        logger.debug(f"압축 파일에서 {len(collected_files)}개 파일 수집 (건너뜀: {skipped_count})")
         return collected_files, readme_content
     
+    def is_target_file(self, relative_path):
+        """상대 경로의 디렉토리/파일명/확장자 규칙으로 수집 대상 여부 판별"""
+        return not any(exclude_dir in relative_path.parts for exclude_dir in self.exclude_dirs) and \
+            self.is_target_name(relative_path.name)
+    
+    def is_target_name(self, name):
+        """파일명/확장자 규칙으로 수집 대상 여부 판별"""
+        return name not in self.exclude_files and \
+            (PurePosixPath(name).suffix.lower() not in self.exclude_extensions or 
+             name in ['build.gradle', 'build.gradle.kts', 'settings.gradle.kts', 'pom.xml'])
+    
+    def build_file_info(self, relative_path, content, size):
+        """수집된 파일의 기본 정보 및 유형 생성 (size는 읽은 원본 바이트 수로 단계별 처리량 집계에 사용)"""
+        file_info = {
+            'path': str(relative_path),
+            'package': '/'.join(relative_path.parts[:-1]),
+            'content': content,
+            'size': size
+        }
+        
+        # 파일 유형 및 추가 정보 판별
+        if relative_path.name in ['build.gradle', 'build.gradle.kts', 'settings.gradle.kts']:
+            file_info['file_type'] = 'build'
+        elif relative_path.name == 'pom.xml':
+            file_info['file_type'] = 'build'
+        elif relative_path.name in ['application.yml', 'application.yaml', 'application.properties']:
+            file_info['file_type'] = 'config'
+        elif relative_path.suffix == '.java':
+            # Java 파일의 추가 처리
+            cleaned_content = self.remove_imports(content)
+            file_type = self.determine_file_type(str(relative_path), content)
+            
+            file_info['content'] = cleaned_content
+            file_info['file_type'] = file_type
+            
+            # 클래스 정보 등 추가 정보는 파서에서 별도로 추출
+        elif relative_path.suffix in ['.yml', '.yaml', '.properties']:
+            file_info['file_type'] = 'config'
+        else:
+            file_info['file_type'] = 'resource'
+        
+        return file_info
+    
     def remove_imports(self, content):
         """Java 파일에서 import 문 제거"""
         # import 블록 제거 (패키지 문부터 첫 클래스/인터페이스 선언까지)
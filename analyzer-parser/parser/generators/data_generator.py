@@ -27,9 +27,8 @@ class FullDataGenerator:
         # 설정 정보 설정
         full_data.update_configuration(config_info)
         
-        # 소스 파일 설정
-        for file_info in all_files:
-            self.add_source_file(full_data, file_info)
+        # 소스 파일 설정 (항목은 저장할 때 파일마다 만들어 바로 씀)
+        self.add_source_files(full_data, all_files)
         
         # 엔드포인트 설정
         for endpoint in endpoints:
@@ -79,9 +78,9 @@ class FullDataGenerator:
         
         full_data.update_architecture(typical_flows, component_counts)
     
-    def add_source_file(self, full_data, file_info):
-        """소스 파일 정보 추가"""
-        full_data.add_source_file(
+    def add_source_files(self, full_data, files_info):
+        """소스 파일 정보 등록"""
+        full_data.add_source_files(files_info, lambda file_info: full_data.make_source_file(
             path=file_info['path'],
             package=file_info['package'],
             content=file_info['content'],
@@ -90,7 +89,7 @@ class FullDataGenerator:
             complexity=file_info.get('complexity'),
             javadocs=file_info.get('javadocs', []),
             todos=file_info.get('todos', [])
-        )
+        ))
     
     def add_endpoint(self, full_data, endpoint):
         """API 엔드포인트 추가"""
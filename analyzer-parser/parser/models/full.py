@@ -1,5 +1,7 @@
 from datetime import datetime
 import json
+from .json_writer import JsonStreamWriter
+from .output_profile import OutputProfile
 
 class FullData:
     def __init__(self, project_name):
@@ -40,6 +42,7 @@ class FullData:
         }
         self.configuration = {}
         self.source_files = []
+        self._source_file_feeds = []  # (파일 목록, 항목 생성 함수) - 저장할 때 항목을 만듦
     
     def update_basic_info(self, group, version, spring_boot_version, java_version):
         """기본 프로젝트 정보 업데이트"""
@@ -135,7 +138,18 @@ class FullData:
     
     def add_source_file(self, path, package, content, file_type=None, class_name=None, complexity=None, javadocs=None, todos=None):
         """소스 파일 추가"""
-        source_file = {
+        self.source_files.append(self.make_source_file(
+            path, package, content, file_type, class_name, complexity, javadocs, todos
+        ))
+    
+    def add_source_files(self, files, to_source_file):
+        """소스 파일 목록 등록 (항목은 저장할 때 to_source_file로 하나씩 만들어 바로 씀)"""
+        self._source_file_feeds.append((files, to_source_file))
+    
+    @staticmethod
+    def make_source_file(path, package, content, file_type=None, class_name=None, complexity=None, javadocs=None, todos=None):
+        """소스 파일 항목 생성"""
+        return {
             "path": path,
             "package": package,
             "content": content,
@@ -145,27 +159,62 @@ class FullData:
             "javadocs": javadocs or [],
             "todos": todos or []
         }
-        self.source_files.append(source_file)
+    
+    def iter_source_files(self):
+        """소스 파일 항목을 등록 순서대로 생성"""
+        yield from self.source_files
+        for files, to_source_file in self._source_file_feeds:
+            for file in files:
+                yield to_source_file(file)
+    
+    def sections(self):
+        """sourceFiles를 제외한 최상위 섹션 (이름, 값) 목록"""
+        return [
+            ("projectSummary", self.project_summary),
+            ("api", self.api),
+            ("domain", self.domain),
+            ("projectStructure", self.project_structure),
+            ("relationships", self.relationships),
+            ("businessLogic", self.business_logic),
+            ("dataFlows", self.data_flows),
+            ("springFeatures", self.spring_features),
+            ("configuration", self.configuration)
+        ]
     
     def to_dict(self):
         """객체를 사전 형태로 변환"""
-        return {
-            "projectSummary": self.project_summary,
-            "api": self.api,
-            "domain": self.domain,
-            "projectStructure": self.project_structure,
-            "relationships": self.relationships,
-            "businessLogic": self.business_logic,
-            "dataFlows": self.data_flows,
-            "springFeatures": self.spring_features,
-            "configuration": self.configuration,
-            "sourceFiles": self.source_files
-        }
+        data = dict(self.sections())
+        data["sourceFiles"] = list(self.iter_source_files())
+        return data
     
-    def save_to_file(self, file_path):
-        """분석 결과를 JSON 파일로 저장"""
+    def save_to_file(self, file_path, compact=False, profile=None):
+        """분석 결과를 JSON 파일로 저장 (compact이면 들여쓰기 없이 저장), 출력 프로필 보고서 반환"""
         with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+            return self.write_json(f, compact, profile)
+    
+    def write_json(self, fp, compact=False, profile=None):
+        """섹션과 소스 파일 항목을 하나씩 인코딩하여 바로 쓰기 (문서 전체를 메모리에 만들지 않음)
+        
+        profile이 dedup이면 sourceFiles 뒤에 해시별 내용을 담은 contents 섹션을 쓴다.
+        """
+        profile = profile or OutputProfile()
+        report = profile.new_report()
+        contents = {}
+        writer = JsonStreamWriter(fp, indent=None if compact else 2)
+        writer.begin_object()
+        for key, value in self.sections():
+            writer.write_field(key, value)
+        writer.begin_array("sourceFiles")
+        for source_file in self.iter_source_files():
+            writer.write_item(profile.apply(source_file, contents, report))
+        writer.end_array()
+        if profile.dedup:
+            writer.begin_object("contents")
+            for digest, content in contents.items():
+                writer.write_field(digest, content)
+            writer.end_object()
+        writer.end_object()
+        return report
 
 
 # parser/models/summary.py
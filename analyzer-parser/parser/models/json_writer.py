@@ -0,0 +1,79 @@
+import json
+
+class JsonStreamWriter:
+    """JSON 문서를 필드/배열 항목 단위로 인코딩하는 즉시 파일에 쓰는 스트리밍 작성기
+    
+    값 하나씩 인코딩해 바로 쓰므로 메모리에는 한 번에 값 하나의 문자열만 남는다.
+    indent가 None이면 공백 없는 압축 모드(C 인코더 사용)이고,
+    indent를 주면 json.dump(..., indent=indent)와 같은 모양으로 쓴다.
+    """
+    
+    def __init__(self, fp, indent=None, ensure_ascii=False):
+        self.fp = fp
+        self.indent = indent
+        self.ensure_ascii = ensure_ascii
+        # 값마다 json.dumps를 부르면 인코더를 매번 새로 만들므로 하나를 재사용
+        self._encoder = json.JSONEncoder(
+            ensure_ascii=ensure_ascii,
+            indent=indent,
+            separators=(',', ':') if indent is None else None
+        )
+        self._empty = []  # 열려 있는 컨테이너별로 아직 항목이 없는지 여부
+    
+    def begin_object(self, key=None):
+        """객체 시작 (key가 있으면 현재 객체의 필드로 시작)"""
+        self._open(key, '{')
+    
+    def end_object(self):
+        """객체 종료"""
+        self._close('}')
+    
+    def begin_array(self, key=None):
+        """배열 시작 (key가 있으면 현재 객체의 필드로 시작)"""
+        self._open(key, '[')
+    
+    def end_array(self):
+        """배열 종료"""
+        self._close(']')
+    
+    def write_field(self, key, value):
+        """현재 객체에 필드 하나 쓰기"""
+        self._write_prefix(key)
+        self.fp.write(self._encode(value))
+    
+    def write_item(self, value):
+        """현재 배열에 항목 하나 쓰기"""
+        self._write_prefix(None)
+        self.fp.write(self._encode(value))
+    
+    def _open(self, key, bracket):
+        if self._empty:
+            self._write_prefix(key)
+        self.fp.write(bracket)
+        self._empty.append(True)
+    
+    def _close(self, bracket):
+        empty = self._empty.pop()
+        if not empty and self.indent is not None:
+            self.fp.write('\n' + ' ' * (self.indent * len(self._empty)))
+        self.fp.write(bracket)
+    
+    def _write_prefix(self, key):
+        """항목 구분자, 들여쓰기, 필드 이름 쓰기"""
+        if self._empty[-1]:
+            self._empty[-1] = False
+        else:
+            self.fp.write(',')
+        if self.indent is not None:
+            self.fp.write('\n' + ' ' * (self.indent * len(self._empty)))
+        if key is not None:
+            self.fp.write(json.dumps(key, ensure_ascii=self.ensure_ascii))
+            self.fp.write(': ' if self.indent is not None else ':')
+    
+    def _encode(self, value):
+        """값 하나 인코딩 (들여쓰기 모드에서는 현재 깊이만큼 줄 앞을 밀어 넣음)"""
+        text = self._encoder.encode(value)
+        if self.indent is None:
+            return text
+        # 문자열 안의 줄바꿈은 \n으로 이스케이프되므로 실제 줄바꿈은 서식용뿐
+        return text.replace('\n', '\n' + ' ' * (self.indent * len(self._empty)))
@@ -0,0 +1,102 @@
+import hashlib
+
+class OutputProfile:
+    """분석 결과 JSON의 소스 파일 내용(content) 저장 방식
+    
+    full: 모든 파일 내용을 sourceFiles[].content에 그대로 포함 (기본)
+    dedup: 서로 다른 내용을 해시별로 한 번만 최상위 contents에 저장하고 sourceFiles[].contentRef로 참조
+    slim: omit_types에 해당하는 파일 유형은 내용을 제외 (content는 null)
+    """
+    
+    FULL = "full"
+    DEDUP = "dedup"
+    SLIM = "slim"
+    NAMES = (FULL, DEDUP, SLIM)
+    
+    def __init__(self, name=FULL, omit_types=()):
+        if name not in self.NAMES:
+            raise ValueError(f"알 수 없는 출력 프로필: {name}")
+        self.name = name
+        self.omit_types = frozenset(omit_types) if name == self.SLIM else frozenset()
+    
+    @property
+    def dedup(self):
+        return self.name == self.DEDUP
+    
+    @classmethod
+    def from_metadata(cls, metadata, default_name=FULL, default_omit_types=()):
+        """업로드 메타데이터의 outputProfile/omitContentTypes로 프로필 생성 (잘못된 값이면 기본값)"""
+        metadata = metadata or {}
+        name = cls._as_text(metadata.get('outputProfile')) or default_name
+        omit_types = metadata.get('omitContentTypes')
+        if omit_types is None:
+            omit_types = default_omit_types
+        elif not isinstance(omit_types, (list, tuple)):
+            omit_types = cls._as_text(omit_types).split(',')
+        omit_types = [cls._as_text(file_type).strip() for file_type in omit_types]
+        
+        name = name.strip().lower()
+        if name not in cls.NAMES:
+            name = default_name
+        return cls(name, [file_type for file_type in omit_types if file_type])
+    
+    @staticmethod
+    def _as_text(value):
+        # 바이너리 메시지의 AMQP 헤더 값은 bytes로 올 수 있음
+        if isinstance(value, bytes):
+            return value.decode('utf-8', errors='replace')
+        return '' if value is None else str(value)
+    
+    def cache_variant(self):
+        """결과 캐시 키 구분값 (full은 None이라 기존 캐시 키를 그대로 사용)"""
+        if self.name == self.FULL:
+            return None
+        if self.name == self.SLIM:
+            return f"{self.name}:{','.join(sorted(self.omit_types))}"
+        return self.name
+    
+    def new_report(self):
+        """저장 결과 보고서 (내용 바이트는 UTF-8 기준)"""
+        return {
+            'profile': self.name,
+            'files': 0,
+            'contentBytes': 0,
+            'writtenContentBytes': 0,
+            'bytesSaved': 0,
+            'duplicateFiles': 0,
+            'omittedFiles': 0
+        }
+    
+    def apply(self, source_file, contents, report):
+        """소스 파일 항목에 프로필 적용 (dedup이면 contents에 해시별 내용을 모음, 원래 항목은 바꾸지 않음)"""
+        content = source_file.get('content')
+        encoded = content.encode('utf-8') if content else b''
+        size = len(encoded)
+        report['files'] += 1
+        report['contentBytes'] += size
+        
+        if content is None or self.name == self.FULL:
+            written = size
+        elif source_file.get('fileType') in self.omit_types:
+            source_file = dict(source_file, content=None)
+            report['omittedFiles'] += 1
+            written = 0
+        elif self.dedup:
+            digest = hashlib.sha256(encoded).hexdigest()
+            if digest in contents:
+                report['duplicateFiles'] += 1
+                written = 0
+            else:
+                contents[digest] = content
+                written = size
+            # content 자리에 contentRef를 두어 필드 순서 유지
+            source_file = {
+                ('contentRef' if key == 'content' else key): (digest if key == 'content' else value)
+                for key, value in source_file.items()
+            }
+        else:
+            written = size
+        
+        report['writtenContentBytes'] += written
+        report['bytesSaved'] = report['contentBytes'] - report['writtenContentBytes']
+        return source_file
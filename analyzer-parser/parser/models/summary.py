@@ -1,5 +1,5 @@
 from datetime import datetime
-import json
+from .json_writer import JsonStreamWriter
 
 class SummaryData:
     def __init__(self, project_name):
@@ -94,7 +94,11 @@ class SummaryData:
             "dependencies": self.dependencies
         }
     
-    def save_to_file(self, file_path):
-        """요약 정보를 JSON 파일로 저장"""
+    def save_to_file(self, file_path, compact=False):
+        """요약 정보를 JSON 파일로 저장 (compact이면 들여쓰기 없이 저장)"""
         with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
\ No newline at end of file
+            writer = JsonStreamWriter(f, indent=None if compact else 2)
+            writer.begin_object()
+            for key, value in self.to_dict().items():
+                writer.write_field(key, value)
+            writer.end_object()
\ No newline at end of file
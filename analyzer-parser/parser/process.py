@@ -3,6 +3,8 @@ from datetime import datetime
 from pathlib import Path
 
 from .file_collector import FileCollector
+from .ast_store import AstStore
+from .stage_timer import StageTimer, content_bytes
 from .analyzers.java_analyzer import JavaAnalyzer
 from .analyzers.build_analyzer import BuildAnalyzer
 from .analyzers.config_analyzer import ConfigAnalyzer
@@ -12,15 +14,21 @@ from .analyzers.business_analyzer import BusinessAnalyzer
 from .analyzers.relationship_analyzer import RelationshipAnalyzer
 from .generators.summary_generator import SummaryGenerator
 from .generators.data_generator import FullDataGenerator
+from worker.cancellation import JobCancelled
 
 logger = logging.getLogger("analyzer.parser.process")
 
 class ParserProcess:
     """파싱 프로세스 전체 조율 클래스"""
     
-    def __init__(self):
-        self.file_collector = FileCollector()
-        self.java_analyzer = JavaAnalyzer()
+    def __init__(self, file_cache=None, java_workers=1, java_batch_bytes=1024 * 1024, compact_json=False,
+                 collector_workers=1, shard_coordinator=None):
+        self.file_collector = FileCollector(max_workers=collector_workers)
+        self.java_analyzer = JavaAnalyzer(
+            file_cache=file_cache,
+            max_workers=java_workers,
+            batch_bytes=java_batch_bytes
+        )
         self.build_analyzer = BuildAnalyzer()
         self.config_analyzer = ConfigAnalyzer()
         self.structure_analyzer = StructureAnalyzer()
@@ -29,53 +37,82 @@ class ParserProcess:
         self.relationship_analyzer = RelationshipAnalyzer()
         self.summary_generator = SummaryGenerator()
         self.data_generator = FullDataGenerator()
+        self.compact_json = compact_json
+        # 주어지면 큰 프로젝트의 Java 파일 분석을 여러 노드에 샤드로 나누어 맡김 (ShardCoordinator)
+        self.shard_coordinator = shard_coordinator
     
-    def process_project(self, source_dir, output_dir):
-        """전체 파싱 프로세스 실행"""
+    def process_project(self, source_dir, output_dir, archive_data=None, output_profile=None, cancel_token=None):
+        """전체 파싱 프로세스 실행
+        
+        archive_data가 주어지면 압축 해제 없이 ZIP 내부에서 바로 파일을 수집하고,
+        output_profile(OutputProfile)에 따라 결과 JSON의 소스 파일 내용 저장 방식을 정함
+        cancel_token(CancelToken)은 각 단계 시작 전과 Java 파일 배치 사이에서 확인하며, 취소되면 JobCancelled 발생
+        """
+        timer = StageTimer(cancel_token)
         try:
-            # 1. 파일 수집
-            files_info, readme_content = self.file_collector.collect_files(source_dir)
+            # 1. 파일 수집 (이후 단계는 디스크 대신 프로젝트 색인만 조회)
+            with timer.stage("collect") as stage:
+                project_index = self.file_collector.collect_index(source_dir, archive_data)
+                readme_content = project_index.readme_content
+                stage['files'] = len(project_index.files())
+                stage['bytes'] = content_bytes(project_index.files())
             
             # 2. 기본 프로젝트 정보 분석
             project_name = Path(source_dir).name
-            structure_info = self.structure_analyzer.analyze(source_dir)
+            with timer.stage("structure", files=stage['files']):
+                structure_info = self.structure_analyzer.analyze(project_index)
             
             # 3. 빌드 파일 분석
-            build_files = [f for f in files_info if f['file_type'] == 'build']
-            project_info = self.build_analyzer.analyze(build_files)
+            build_files = project_index.of_type('build')
+            with timer.stage("build", len(build_files), content_bytes(build_files)):
+                project_info = self.build_analyzer.analyze(build_files)
             
             # 4. 설정 파일 분석
-            config_files = [f for f in files_info if f['file_type'] == 'config']
-            config_info = self.config_analyzer.analyze(config_files)
+            config_files = project_index.of_type('config')
+            with timer.stage("config", len(config_files), content_bytes(config_files)):
+                config_info = self.config_analyzer.analyze(config_files)
             
-            # 5. Java 파일 상세 분석
-            java_files = [f for f in files_info if f['path'].endswith('.java')]
-            analyzed_java_files = self.java_analyzer.analyze_all(java_files)
+            # 5. Java 파일 상세 분석 (분석 결과의 class_info/file_type을 색인에 반영)
+            java_files = project_index.java_files()
+            java_count, java_bytes = len(java_files), content_bytes(java_files)
+            with timer.stage("java", java_count, java_bytes):
+                java_cache_stats = {}
+                if self.shard_coordinator and self.shard_coordinator.should_shard(java_files):
+                    analyzed_java_files = self.shard_coordinator.analyze(java_files, self.java_analyzer, cancel_token)
+                else:
+                    analyzed_java_files = self.java_analyzer.analyze_all(java_files, java_cache_stats, cancel_token)
+                project_index.update(analyzed_java_files)
             
-            # 6. 모든 분석 파일 합치기
-            all_files = [f for f in files_info if not f['path'].endswith('.java')]
+            # 6. 모든 분석 파일 합치기 (이후 파일 간 분석과 생성은 샤드 분석 여부와 관계없이 이 노드에서 한 번만 실행)
+            all_files = project_index.other_files()
             all_files.extend(analyzed_java_files)
             
-            # 7. 고급 분석 
-            relationships = self.relationship_analyzer.analyze(analyzed_java_files)
-            business_objects = self.business_analyzer.find_business_objects(analyzed_java_files)
-            endpoints = self.endpoint_analyzer.analyze(analyzed_java_files)
-            business_logic = self.business_analyzer.extract_logic(analyzed_java_files)
-            data_flows = self.business_analyzer.analyze_flows(analyzed_java_files, relationships)
-            spring_features = self.business_analyzer.analyze_spring_features(analyzed_java_files)
+            # 7. 고급 분석 (AST는 작업 단위로 한 번만 파싱하여 분석기들이 공유 - 파싱 비용은 먼저 요청한 business 단계에 포함)
+            ast_store = AstStore()
+            with timer.stage("relationships", java_count, java_bytes):
+                relationships = self.relationship_analyzer.analyze(project_index)
+            with timer.stage("business", java_count, java_bytes):
+                business_objects = self.business_analyzer.find_business_objects(project_index, ast_store)
+                business_logic = self.business_analyzer.extract_logic(project_index)
+                data_flows = self.business_analyzer.analyze_flows(project_index, relationships, ast_store)
+                spring_features = self.business_analyzer.analyze_spring_features(project_index)
+            with timer.stage("endpoints", java_count, java_bytes):
+                endpoints = self.endpoint_analyzer.analyze(project_index, ast_store)
+            logger.info(f"AST 공유 통계: {ast_store.get_stats()}")
             
-            # 8. 결과 데이터 생성
-            full_data = self.data_generator.create_full_data(
-                project_name, project_info, structure_info, readme_content,
-                config_info, all_files, relationships, business_objects,
-                endpoints, business_logic, data_flows, spring_features
-            )
-            
-            # 9. 요약 데이터 생성
-            summary_data = self.summary_generator.generate(
-                project_name, project_info, structure_info, 
-                endpoints, business_objects, analyzed_java_files
-            )
+            with timer.stage("generation", files=len(all_files)):
+                # 8. 결과 데이터 생성
+                full_data = self.data_generator.create_full_data(
+                    project_name, project_info, structure_info, readme_content,
+                    config_info, all_files, relationships, business_objects,
+                    endpoints, business_logic, data_flows, spring_features
+                )
+                
+                # 9. 요약 데이터 생성
+                summary_data = self.summary_generator.generate(
+                    project_name, project_info, structure_info, 
+                    endpoints, business_objects, analyzed_java_files
+                )
             
             # 10. 결과 저장
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -85,18 +122,28 @@ class ParserProcess:
             analysis_path = Path(output_dir) / analysis_filename
             summary_path = Path(output_dir) / summary_filename
             
-            full_data.save_to_file(analysis_path)
-            summary_data.save_to_file(summary_path)
+            with timer.stage("save", files=len(all_files)) as stage:
+                output_report = full_data.save_to_file(analysis_path, compact=self.compact_json, profile=output_profile)
+                summary_data.save_to_file(summary_path, compact=self.compact_json)
+                stage['bytes'] = analysis_path.stat().st_size + summary_path.stat().st_size
+            logger.info(f"출력 프로필 보고서: {output_report}")
+            logger.info(f"단계별 소요 시간: {timer.format()}")
             
             return {
                 'success': True,
                 'analysis_file': str(analysis_path),
                 'summary_file': str(summary_path),
-                'files_processed': len(all_files)
+                'files_processed': len(all_files),
+                'java_cache': java_cache_stats,
+                'output': output_report,
+                'timings': timer.to_dict()
             }
             
+        except JobCancelled as e:
+            logger.warning(f"프로젝트 파싱 중단: {e} (완료된 단계: {timer.format()})")
+            raise
         except Exception as e:
-            logger.error(f"프로젝트 파싱 실패: {str(e)}", exc_info=True)
+            logger.error(f"프로젝트 파싱 실패: {str(e)} (완료된 단계: {timer.format()})", exc_info=True)
             return {
                 'success': False,
                 'error': f"파싱 오류: {str(e)}"
@@ -0,0 +1,113 @@
+import logging
+from collections import defaultdict
+
+logger = logging.getLogger("analyzer.parser.project_index")
+
+class ProjectIndex:
+    """수집된 프로젝트 파일을 경로, 클래스 이름, 파일 유형, 어노테이션으로 바로 찾는 메모리 색인
+    
+    FileCollector가 수집 직후 만들며, 이후 단계는 디스크나 파일 목록 재필터링 대신 이 색인을 조회한다.
+    Java 분석이 끝나면 update()로 분석 결과(class_info, file_type)를 반영한다.
+    조회 결과 목록은 항상 수집 순서를 따른다.
+    """
+    
+    def __init__(self, files_info=(), readme_content=None):
+        self.readme_content = readme_content
+        self._files = list(files_info)
+        self._reindex()
+    
+    def _reindex(self):
+        """파일 목록으로 모든 조회 테이블 재구성"""
+        self._by_path = {}
+        self._position = {}
+        self._by_type = defaultdict(list)
+        self._java_by_type = defaultdict(list)
+        self._by_class = {}
+        self._by_annotation = defaultdict(list)
+        self._java_files = []
+        self._other_files = []
+        
+        for position, file_info in enumerate(self._files):
+            path = file_info['path']
+            file_type = file_info.get('file_type')
+            self._by_path[path] = file_info
+            self._position[path] = position
+            self._by_type[file_type].append(file_info)
+            
+            if not path.endswith('.java'):
+                self._other_files.append(file_info)
+                continue
+            
+            self._java_files.append(file_info)
+            self._java_by_type[file_type].append(file_info)
+            
+            # 같은 이름의 클래스가 여러 개면 나중 파일이 우선 (기존 클래스 맵과 동일)
+            class_info = file_info.get('class_info') or {}
+            if class_info.get('name'):
+                self._by_class[class_info['name']] = file_info
+            for annotation in dict.fromkeys(class_info.get('annotations', [])):
+                self._by_annotation[annotation].append(file_info)
+    
+    def update(self, files_info):
+        """분석된 파일 정보로 같은 경로의 항목을 교체하고 색인 재구성 (새 경로는 뒤에 추가)"""
+        for file_info in files_info:
+            position = self._position.get(file_info['path'])
+            if position is None:
+                self._position[file_info['path']] = len(self._files)
+                self._files.append(file_info)
+            else:
+                self._files[position] = file_info
+        self._reindex()
+        logger.debug(f"프로젝트 색인 갱신: 파일 {len(self._files)}개, 클래스 {len(self._by_class)}개")
+    
+    def __len__(self):
+        return len(self._files)
+    
+    def __iter__(self):
+        return iter(self._files)
+    
+    def get(self, path):
+        """경로로 파일 정보 조회"""
+        return self._by_path.get(path)
+    
+    def find_class(self, class_name):
+        """클래스 이름으로 Java 파일 정보 조회"""
+        return self._by_class.get(class_name)
+    
+    def class_map(self):
+        """클래스 이름 → Java 파일 정보 맵"""
+        return dict(self._by_class)
+    
+    def files(self):
+        """전체 파일 목록"""
+        return list(self._files)
+    
+    def java_files(self):
+        """Java 파일 목록"""
+        return list(self._java_files)
+    
+    def other_files(self):
+        """Java 이외의 파일 목록"""
+        return list(self._other_files)
+    
+    def of_type(self, *file_types):
+        """파일 유형으로 전체 파일 조회"""
+        return self._merge(self._by_type, file_types)
+    
+    def java_of_type(self, *file_types):
+        """파일 유형으로 Java 파일 조회"""
+        return self._merge(self._java_by_type, file_types)
+    
+    def with_annotation(self, *annotations):
+        """어노테이션 중 하나라도 사용하는 Java 파일 조회"""
+        return self._merge(self._by_annotation, annotations)
+    
+    def _merge(self, table, keys):
+        """여러 키의 조회 결과를 중복 없이 수집 순서대로 합침"""
+        if len(keys) == 1:
+            return list(table.get(keys[0], []))
+        merged = {}
+        for key in keys:
+            for file_info in table.get(key, []):
+                merged[file_info['path']] = file_info
+        return sorted(merged.values(), key=lambda file_info: self._position[file_info['path']])
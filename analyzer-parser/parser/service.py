@@ -1,29 +1,43 @@
 import logging
 from pathlib import Path
 from .process import ParserProcess
+from worker.cancellation import JobCancelled
 
 class ParserService:
     """프로젝트 분석을 담당하는 서비스 클래스"""
     
-    def __init__(self):
+    def __init__(self, file_cache=None, java_workers=1, java_batch_bytes=1024 * 1024, compact_json=False,
+                 collector_workers=1, shard_coordinator=None):
         self.logger = logging.getLogger("analyzer.parser.service")
-        self.parser_process = ParserProcess()
+        self.parser_process = ParserProcess(
+            file_cache=file_cache,
+            java_workers=java_workers,
+            java_batch_bytes=java_batch_bytes,
+            compact_json=compact_json,
+            collector_workers=collector_workers,
+            shard_coordinator=shard_coordinator
+        )
     
-    def analyze_project(self, project_id, source_dir, output_dir):
-        """프로젝트 파일 분석 수행"""
+    def analyze_project(self, project_id, source_dir, output_dir, archive_data=None, output_profile=None,
+                        cancel_token=None):
+        """프로젝트 파일 분석 수행 (취소되거나 기한을 넘기면 JobCancelled를 그대로 전달)"""
         try:
             # 출력 디렉토리 생성
             target_dir = Path(output_dir)
             target_dir.mkdir(parents=True, exist_ok=True)
             
             # 파싱 프로세스 실행
-            result = self.parser_process.process_project(source_dir, output_dir)
+            result = self.parser_process.process_project(
+                source_dir, output_dir, archive_data, output_profile, cancel_token
+            )
             
             if result['success']:
                 self.logger.info(f"프로젝트 {project_id} 파싱 완료: JSON={result['analysis_file']}, 요약={result['summary_file']}")
             
             return result
             
+        except JobCancelled:
+            raise
         except Exception as e:
             self.logger.error(f"프로젝트 파싱 실패: {str(e)}", exc_info=True)
             return {
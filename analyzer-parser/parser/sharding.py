@@ -0,0 +1,270 @@
+import concurrent.futures
+import json
+import logging
+import threading
+import time
+import uuid
+
+from .analyzers.java_analyzer import JavaAnalyzer
+
+logger = logging.getLogger("analyzer.parser.sharding")
+
+class ShardCoordinator:
+    """큰 프로젝트의 Java 파일을 샤드로 나누어 여러 파서 노드에 분석을 맡기고 결과를 모으는 조정자
+    
+    샤드 메시지는 task_routing_key로 발행되어 어느 노드의 ShardWorker든 처리할 수 있고,
+    결과는 이 노드 전용 라우팅 키(reply_to)로 돌아와 on_result로 전달된다.
+    샤드마다 제한 시간과 시도 횟수를 따로 관리하여 실패하거나 응답이 없는 샤드만 다시 발행하며,
+    max_attempts번 모두 실패한 샤드는 이 노드에서 직접 분석한다.
+    publish(routing_key, message)는 브로커 확인 결과(bool)를 담은 Future를 반환해야 한다.
+    """
+    
+    POLL_SECONDS = 1.0  # 결과를 기다리는 동안 취소/기한 초과를 확인하는 간격
+    
+    def __init__(self, node_id, task_routing_key, result_routing_key, shard_bytes=4 * 1024 * 1024,
+                 min_files=5000, timeout=300, max_attempts=3, publish=None):
+        self.node_id = node_id
+        self.task_routing_key = task_routing_key
+        self.reply_to = f"{result_routing_key}.{node_id}"
+        self.shard_bytes = shard_bytes
+        self.min_files = min_files
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self._publish = publish
+        self._jobs = {}  # job_id -> _ShardJob
+        self._jobs_lock = threading.Lock()
+    
+    def _get_publisher(self):
+        if not self._publish:
+            from rabbitmq import publish_result
+            self._publish = publish_result
+        return self._publish
+    
+    def should_shard(self, java_files):
+        """샤드 분석 대상인지 (Java 파일 수 기준)"""
+        return len(java_files) >= self.min_files
+    
+    def analyze(self, java_files, analyzer, cancel_token=None):
+        """샤드 분석 후 analyzer.analyze_all과 같은 순서/형식의 결과 반환 (map 단계)
+        
+        analyzer는 결과 병합과 재시도를 모두 실패한 샤드의 직접 분석에 사용한다.
+        """
+        batches = JavaAnalyzer.make_batches(java_files, self.shard_bytes)
+        job = _ShardJob(uuid.uuid4().hex, batches)
+        logger.info(f"Java 파일 {len(java_files)}개를 샤드 {len(batches)}개로 나누어 분산 분석 (job={job.job_id})")
+        
+        with self._jobs_lock:
+            self._jobs[job.job_id] = job
+        try:
+            for shard in range(len(batches)):
+                self._send(job, shard)
+            self._wait(job, analyzer, cancel_token)
+        finally:
+            with self._jobs_lock:
+                self._jobs.pop(job.job_id, None)
+        
+        logger.info(f"샤드 분석 완료 (job={job.job_id}): {job.get_stats()}")
+        shard_results = [fields for results in job.results for fields in results]
+        return analyzer.merge_shard_results(java_files, shard_results)
+    
+    def _send(self, job, shard):
+        """샤드 하나 발행 (발행 실패는 샤드 실패로 기록하여 재시도)"""
+        with job.condition:
+            job.attempts[shard] += 1
+            job.deadlines[shard] = time.monotonic() + self.timeout
+            job.failed.discard(shard)
+            attempt = job.attempts[shard]
+        
+        message = json.dumps({
+            "jobId": job.job_id,
+            "shard": shard,
+            "attempt": attempt,
+            "replyTo": self.reply_to,
+            "files": [{"path": file_info['path'], "content": file_info['content']} for file_info in job.batches[shard]]
+        })
+        
+        def on_confirm(future):
+            if future.exception() or not future.result():
+                logger.error(f"샤드 {shard} 발행이 브로커에서 확인되지 않음 (job={job.job_id})")
+                job.fail(shard, attempt)
+        
+        try:
+            self._get_publisher()(self.task_routing_key, message).add_done_callback(on_confirm)
+        except Exception as e:
+            logger.error(f"샤드 {shard} 발행 오류 (job={job.job_id}): {str(e)}")
+            job.fail(shard, attempt)
+    
+    def _wait(self, job, analyzer, cancel_token):
+        """모든 샤드 결과가 모일 때까지 대기하며 실패/시간 초과 샤드만 다시 발행"""
+        while True:
+            if cancel_token:
+                cancel_token.check()
+            
+            with job.condition:
+                pending = job.pending()
+                if not pending:
+                    return
+                now = time.monotonic()
+                retry = [shard for shard in pending if shard in job.failed or job.deadlines[shard] <= now]
+                if not retry:
+                    next_deadline = min(job.deadlines[shard] for shard in pending)
+                    job.condition.wait(min(self.POLL_SECONDS, max(next_deadline - now, 0)))
+                    continue
+            
+            for shard in retry:
+                reason = "실패" if shard in job.failed else "시간 초과"
+                if job.attempts[shard] < self.max_attempts:
+                    logger.warning(f"샤드 {shard} {reason}, 다시 발행 (job={job.job_id}, 시도 {job.attempts[shard] + 1})")
+                    job.retried += 1
+                    self._send(job, shard)
+                else:
+                    logger.warning(f"샤드 {shard} {job.attempts[shard]}회 {reason}, 이 노드에서 직접 분석 (job={job.job_id})")
+                    job.local += 1
+                    results = analyzer.to_shard_results(analyzer.analyze_all(job.batches[shard], cancel_token=cancel_token))
+                    job.complete(shard, job.attempts[shard], results)
+    
+    def on_result(self, body, properties=None, on_complete=None):
+        """샤드 결과 메시지 처리 (소비자 콜백, 항상 ACK - 늦게 도착한 결과나 끝난 작업의 결과는 버림)"""
+        try:
+            result = json.loads(body)
+            with self._jobs_lock:
+                job = self._jobs.get(result.get('jobId'))
+            if job is None:
+                logger.debug(f"끝났거나 알 수 없는 샤드 작업의 결과 무시: {result.get('jobId')}")
+            elif result.get('success'):
+                job.complete(result['shard'], result.get('attempt'), result['results'])
+            else:
+                logger.warning(f"샤드 {result.get('shard')} 분석 실패 (job={job.job_id}): {result.get('error')}")
+                job.fail(result['shard'], result.get('attempt'))
+        except Exception as e:
+            logger.error(f"샤드 결과 처리 오류: {str(e)}", exc_info=True)
+        finally:
+            if on_complete:
+                on_complete()
+        return True
+
+
+class _ShardJob:
+    """프로젝트 하나의 샤드별 시도 횟수, 기한, 결과 (condition으로 보호)"""
+    
+    def __init__(self, job_id, batches):
+        self.job_id = job_id
+        self.batches = batches
+        self.results = [None] * len(batches)
+        self.attempts = [0] * len(batches)
+        self.deadlines = [0.0] * len(batches)
+        self.failed = set()
+        self.retried = 0
+        self.local = 0
+        self.condition = threading.Condition()
+    
+    def pending(self):
+        return [shard for shard, results in enumerate(self.results) if results is None]
+    
+    def complete(self, shard, attempt, results):
+        """샤드 결과 기록 (이미 다시 발행된 이전 시도의 늦은 결과는 무시)"""
+        with self.condition:
+            if self.results[shard] is not None or attempt != self.attempts[shard]:
+                return
+            if len(results) != len(self.batches[shard]):
+                logger.warning(f"샤드 {shard} 결과 파일 수 불일치 (job={self.job_id}, attempt={attempt})")
+                self.failed.add(shard)
+            else:
+                self.results[shard] = results
+            self.condition.notify_all()
+    
+    def fail(self, shard, attempt):
+        """샤드 실패 기록 (이미 다시 발행된 이전 시도의 실패는 무시)"""
+        with self.condition:
+            if self.results[shard] is None and attempt == self.attempts[shard]:
+                self.failed.add(shard)
+                self.condition.notify_all()
+    
+    def get_stats(self):
+        return {
+            'shards': len(self.batches),
+            'attempts': sum(self.attempts),
+            'retried': self.retried,
+            'local': self.local
+        }
+
+
+class ShardWorker:
+    """다른 노드가 발행한 샤드 메시지를 받아 Java 파일을 분석하고 결과를 요청한 노드로 발행
+    
+    작업자 풀과 별도의 스레드에서 실행하여, 샤드 결과를 기다리는 조정 작업이 작업자 슬롯을 모두 차지해도
+    샤드 분석이 막히지 않는다.
+    """
+    
+    def __init__(self, java_analyzer, max_workers=1, publish=None, confirm_timeout=60):
+        self.java_analyzer = java_analyzer
+        self.max_workers = max_workers
+        self.confirm_timeout = confirm_timeout
+        self._publish = publish
+        self._executor = None
+        self._executor_lock = threading.Lock()
+    
+    def _get_publisher(self):
+        if not self._publish:
+            from rabbitmq import publish_result
+            self._publish = publish_result
+        return self._publish
+    
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="shard-worker"
+                )
+            return self._executor
+    
+    def on_message(self, body, properties=None, on_complete=None):
+        """샤드 메시지 처리 (소비자 콜백, 결과를 발행한 뒤 on_complete 호출)"""
+        try:
+            task = json.loads(body)
+            task_info = (task['jobId'], task['shard'], task['attempt'], task['replyTo'], task['files'])
+        except Exception as e:
+            # 다시 받아도 처리할 수 없는 메시지는 버림
+            logger.error(f"잘못된 샤드 메시지 폐기: {str(e)}")
+            if on_complete:
+                on_complete()
+            return True
+        
+        self._get_executor().submit(self._run, *task_info, on_complete)
+        return True
+    
+    def _run(self, job_id, shard, attempt, reply_to, files, on_complete=None):
+        """샤드 분석 후 결과 발행 (분석 오류도 결과로 보내 요청한 노드가 재시도하도록 함)"""
+        try:
+            started = time.perf_counter()
+            analyzed_files = self.java_analyzer.analyze_all(files)
+            message = {
+                "jobId": job_id,
+                "shard": shard,
+                "attempt": attempt,
+                "success": True,
+                "results": self.java_analyzer.to_shard_results(analyzed_files)
+            }
+            logger.info(f"샤드 {shard} 분석 완료 (job={job_id}, 파일 {len(files)}개, "
+                        f"{time.perf_counter() - started:.2f}초)")
+        except Exception as e:
+            logger.error(f"샤드 {shard} 분석 오류 (job={job_id}): {str(e)}", exc_info=True)
+            message = {"jobId": job_id, "shard": shard, "attempt": attempt, "success": False, "error": str(e)}
+        
+        try:
+            future = self._get_publisher()(reply_to, json.dumps(message))
+            if not future.result(timeout=self.confirm_timeout):
+                logger.error(f"샤드 {shard} 결과 발행 실패 (job={job_id})")
+        except Exception as e:
+            # 결과가 전달되지 않으면 요청한 노드가 시간 초과 후 다시 발행함
+            logger.error(f"샤드 {shard} 결과 발행 오류 (job={job_id}): {str(e)}")
+        finally:
+            if on_complete:
+                on_complete()
+    
+    def shutdown(self):
+        """샤드 분석 스레드 종료"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
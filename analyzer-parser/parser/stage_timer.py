@@ -0,0 +1,71 @@
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows에는 resource 모듈이 없음 - 메모리 증가량은 기록하지 않음
+    resource = None
+
+class StageTimer:
+    """작업 하나의 단계별 실행 시간, CPU 시간, 최대 메모리 증가량, 파일 수/바이트 기록
+    
+    CPU 시간은 현재 스레드 기준이라 프로세스 풀로 넘긴 작업(병렬 Java 분석)의 CPU는 포함하지 않고,
+    메모리는 프로세스 최대 RSS의 증가분이라 단계 중 최대치가 갱신되지 않으면 0이다.
+    cancel_token(CancelToken)이 주어지면 단계를 시작하기 전에 취소/기한 초과를 확인한다.
+    """
+    
+    def __init__(self, cancel_token=None):
+        self.stages = {}
+        self.cancel_token = cancel_token
+    
+    @contextmanager
+    def stage(self, name, files=None, size=None):
+        """단계 하나 측정 (with 블록 안에서 반환된 기록의 files/bytes를 채울 수 있음)"""
+        if self.cancel_token:
+            self.cancel_token.check()
+        record = {'files': files, 'bytes': size}
+        started_wall = time.perf_counter()
+        started_cpu = time.thread_time()
+        started_rss = max_rss_kb()
+        try:
+            yield record
+        finally:
+            rss = max_rss_kb()
+            self.stages[name] = {
+                'wallMs': round((time.perf_counter() - started_wall) * 1000, 3),
+                'cpuMs': round((time.thread_time() - started_cpu) * 1000, 3),
+                'peakMemDeltaKb': rss - started_rss if rss is not None else None,
+                'files': record['files'],
+                'bytes': record['bytes']
+            }
+    
+    def to_dict(self):
+        """단계별 기록과 합계"""
+        return {
+            'stages': dict(self.stages),
+            'total': {
+                'wallMs': round(sum(s['wallMs'] for s in self.stages.values()), 3),
+                'cpuMs': round(sum(s['cpuMs'] for s in self.stages.values()), 3),
+                'peakMemDeltaKb': sum(s['peakMemDeltaKb'] or 0 for s in self.stages.values())
+            }
+        }
+    
+    def format(self):
+        """로그용 한 줄 요약"""
+        parts = [f"{name}={s['wallMs']:.0f}ms/cpu {s['cpuMs']:.0f}ms" for name, s in self.stages.items()]
+        return ", ".join(parts)
+
+
+def max_rss_kb():
+    """현재 프로세스의 최대 RSS (KB, resource 모듈이 없으면 None)"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, 리눅스는 KB 단위
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+
+def content_bytes(files_info):
+    """파일 정보 목록의 원본 크기 합계 (수집할 때 기록한 바이트 수, 내용을 다시 인코딩하지 않음)"""
+    return sum(file_info.get('size', 0) for file_info in files_info)
@@ -5,6 +5,8 @@ from .consumer import RabbitMQAsyncConsumer
 from .publisher import RabbitMQAsyncPublisher
 from config import Config
 from message import message_processor
+from parser import shard_coordinator, shard_worker
+from worker import worker_pool
 
 logger = logging.getLogger('rabbitmq')
 
@@ -16,19 +18,23 @@ connection = RabbitMQAsyncConnection(
     Config.RABBITMQ_PASS
 )
 
+# 결과 발행기 (채널 연결 전에 발행된 메시지는 버퍼에 보관)
+publisher = RabbitMQAsyncPublisher(
+    exchange_name=Config.EXCHANGE_NAME,
+    buffer_size=Config.PUBLISHER_BUFFER_SIZE,
+    batch_size=Config.PUBLISHER_BATCH_SIZE
+)
+
 # 전역 변수로 사용할 객체들
-publisher = None
 analysis_consumer = None
+shard_consumers = []
 connection_thread = None
 
 def setup_rabbitmq(channel):
     """채널이 준비되면 호출되는 설정 함수"""
-    global publisher, analysis_consumer
+    global analysis_consumer, shard_consumers
     
-    # Publisher 초기화
-    publisher = RabbitMQAsyncPublisher(
-        exchange_name=Config.EXCHANGE_NAME
-    )
+    # Publisher를 새 채널에 연결 (재연결 시에도 버퍼와 확인 대기 메시지 유지)
     publisher.setup(channel)
     
     # Consumer 초기화
@@ -36,9 +42,38 @@ def setup_rabbitmq(channel):
         exchange_name=Config.EXCHANGE_NAME,
         queue_name=Config.ANALYSIS_QUEUE,
         routing_key=Config.ROUTING_ANALYSIS_UPLOAD,
-        callback_function=message_processor.on_message
+        callback_function=message_processor.on_message,
+        # 실행 가능한 작업 수 + 여유분만큼만 미리 받아 노드별 처리량에 맞춤
+        prefetch_count=worker_pool.max_workers + Config.CONSUMER_PREFETCH_BUFFER
     )
     analysis_consumer.setup(channel)
+    
+    if Config.SHARD_ENABLED:
+        shard_consumers = _create_shard_consumers()
+        for consumer in shard_consumers:
+            consumer.setup(channel)
+
+def _create_shard_consumers():
+    """샤드 분석 소비자 (모든 노드가 공유하는 샤드 큐 + 이 노드가 요청한 샤드의 결과 큐)"""
+    consumers = [
+        RabbitMQAsyncConsumer(
+            exchange_name=Config.EXCHANGE_NAME,
+            queue_name=Config.SHARD_QUEUE,
+            routing_key=Config.ROUTING_SHARD_TASK,
+            callback_function=shard_worker.on_message,
+            prefetch_count=Config.SHARD_WORKERS
+        )
+    ]
+    if shard_coordinator:
+        consumers.append(RabbitMQAsyncConsumer(
+            exchange_name=Config.EXCHANGE_NAME,
+            queue_name=f"{Config.SHARD_RESULT_QUEUE}.{Config.SHARD_NODE_ID}",
+            routing_key=shard_coordinator.reply_to,
+            callback_function=shard_coordinator.on_result,
+            # 결과 처리는 기록만 하고 바로 ACK하므로 넉넉하게 받음
+            prefetch_count=100
+        ))
+    return consumers
 
 def init_rabbitmq():
     """RabbitMQ 초기화 및 소비자 시작"""
@@ -65,15 +100,20 @@ def init_rabbitmq():
         return False
 
 def publish_result(routing_key, message):
-    """결과 메시지 발행 헬퍼 함수"""
-    if publisher:
-        return publisher.publish(routing_key, message)
-    return False
+    """결과 메시지 발행 헬퍼 함수 (브로커 확인 결과를 담을 Future 반환)"""
+    return publisher.publish(routing_key, message, timeout=Config.PUBLISHER_BUFFER_TIMEOUT)
+
+def get_publisher_stats():
+    """결과 발행기 통계 (버퍼/확인 대기 메시지 수 포함)"""
+    return publisher.get_stats()
 
 def close_connections():
     """모든 RabbitMQ 연결 종료"""
     if analysis_consumer:
         analysis_consumer.stop()
+    for consumer in shard_consumers:
+        consumer.stop()
+    shard_worker.shutdown()
     
     connection.stop()
     
@@ -84,4 +124,4 @@ def close_connections():
     logger.info("RabbitMQ 연결 종료됨")
 
 # 이 함수들을 외부로 노출
-__all__ = ['init_rabbitmq', 'publish_result', 'close_connections']
\ No newline at end of file
+__all__ = ['init_rabbitmq', 'publish_result', 'get_publisher_stats', 'close_connections']
\ No newline at end of file
@@ -3,11 +3,17 @@ import logging
 logger = logging.getLogger('rabbitmq.consumer')
 
 class RabbitMQAsyncConsumer:
-    def __init__(self, exchange_name, queue_name, routing_key, callback_function):
+    def __init__(self, exchange_name, queue_name, routing_key, callback_function, prefetch_count=1):
+        """
+        callback_function(body, properties, on_complete)가 True를 반환하면 메시지를 맡은 것으로 보고,
+        작업이 끝나 on_complete()가 호출될 때 ACK를 보낸다. False를 반환하면 즉시 NACK.
+        on_complete(False)는 처리 결과를 전달하지 못한 경우로 NACK(requeue)하여 다시 받는다.
+        """
         self.exchange_name = exchange_name
         self.queue_name = queue_name
         self.routing_key = routing_key
         self.callback_function = callback_function
+        self.prefetch_count = prefetch_count
         self.channel = None
         self.consumer_tag = None
         
@@ -46,15 +52,15 @@ class RabbitMQAsyncConsumer:
         """바인딩 성공 시 메시지 소비 시작"""
         logger.info(f"Queue '{self.queue_name}'가 Exchange '{self.exchange_name}'에 바인딩됨")
         
-        # QoS 설정 - 한 번에 하나의 메시지만 처리
+        # QoS 설정 - 작업자가 동시에 처리할 수 있는 만큼만 미리 받음
         self.channel.basic_qos(
-            prefetch_count=1,
+            prefetch_count=self.prefetch_count,
             callback=self._on_qos_set
         )
     
     def _on_qos_set(self, _unused_frame):
         """QoS 설정 완료 시 소비 시작"""
-        logger.info("QoS 설정 완료")
+        logger.info(f"QoS 설정 완료 (prefetch_count={self.prefetch_count})")
         self.consumer_tag = self.channel.basic_consume(
             queue=self.queue_name,
             on_message_callback=self._on_message,
@@ -63,22 +69,48 @@ class RabbitMQAsyncConsumer:
         logger.info(f"Consumer '{self.consumer_tag}' 시작됨")
     
     def _on_message(self, channel, method, properties, body):
-        """메시지 수신 시 처리 핸들러"""
-        logger.info(f"메시지 수신: routing_key={method.routing_key}")
+        """메시지 수신 시 처리 핸들러 (ACK는 작업 완료 후 전송)"""
+        logger.info(f"메시지 수신: routing_key={method.routing_key}, content_type={properties.content_type}")
+        delivery_tag = method.delivery_tag
         
         try:
-            # 메시지 처리
-            success = self.callback_function(body)
+            # 메시지 처리 (content_type/헤더로 형식을 판별하도록 properties 함께 전달)
+            accepted = self.callback_function(
+                body, properties,
+                lambda delivered=True: self._ack_threadsafe(channel, delivery_tag, delivered)
+            )
             
-            if success:
-                channel.basic_ack(delivery_tag=method.delivery_tag)
-                logger.info("메시지 처리 성공, ACK 전송")
+            if accepted:
+                logger.info(f"메시지 작업 제출됨, 완료 후 ACK 예정 (delivery_tag={delivery_tag})")
             else:
-                channel.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
+                channel.basic_nack(delivery_tag=delivery_tag, requeue=True)
                 logger.warning("메시지 처리 실패, NACK 전송 (requeue=True)")
         except Exception as e:
             logger.error(f"메시지 처리 오류: {str(e)}", exc_info=True)
-            channel.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
+            channel.basic_nack(delivery_tag=delivery_tag, requeue=True)
+    
+    def _ack_threadsafe(self, channel, delivery_tag, delivered=True):
+        """작업자 스레드에서 호출 - ACK(전달 실패 시 NACK)를 pika 이벤트 루프 스레드로 넘겨 전송"""
+        try:
+            channel.connection.ioloop.add_callback_threadsafe(
+                lambda: self._ack(channel, delivery_tag, delivered)
+            )
+        except Exception as e:
+            # 연결이 이미 닫힌 경우 메시지는 브로커가 다시 전달함
+            logger.warning(f"ACK 예약 실패 (delivery_tag={delivery_tag}): {str(e)}")
+    
+    def _ack(self, channel, delivery_tag, delivered=True):
+        """이벤트 루프 스레드에서 ACK 전송 (delivered가 False면 NACK requeue)"""
+        # delivery_tag는 채널 단위이므로 메시지를 받은 채널이 살아 있을 때만 ACK
+        if channel is not self.channel or not channel.is_open:
+            logger.warning(f"메시지를 받은 채널이 닫혀 ACK 생략 (delivery_tag={delivery_tag}), 브로커가 재전달합니다")
+            return
+        if not delivered:
+            channel.basic_nack(delivery_tag=delivery_tag, requeue=True)
+            logger.warning(f"결과 전달 실패, NACK 전송 (requeue=True, delivery_tag={delivery_tag})")
+            return
+        channel.basic_ack(delivery_tag=delivery_tag)
+        logger.info(f"작업 완료, ACK 전송 (delivery_tag={delivery_tag})")
     
     def stop(self):
         """소비 중지"""
@@ -0,0 +1,123 @@
+import concurrent.futures
+import logging
+import queue
+import threading
+from types import SimpleNamespace
+
+logger = logging.getLogger('rabbitmq.local_broker')
+
+class LocalBroker:
+    """RabbitMQ 대신 쓰는 프로세스 내부 브로커 (테스트/벤치마크용)
+    
+    topic exchange 하나와 수동 ACK 큐를 흉내 낸다. publish는 RabbitMQAsyncPublisher.publish처럼
+    브로커 확인 결과(라우팅된 큐가 있으면 True)를 담은 Future를 반환하고, consume 콜백은
+    RabbitMQAsyncConsumer와 같은 callback(body, properties, on_complete) 규약을 따른다.
+    콜백이 False를 반환하거나 예외가 나거나 on_complete(False)가 호출되면 메시지를 큐에 다시 넣는다 (NACK requeue).
+    """
+    
+    def __init__(self):
+        self.queues = {}  # 큐 이름 -> queue.Queue
+        self.bindings = []  # (라우팅 키 패턴, 큐 이름)
+        self.lock = threading.Lock()
+        self.threads = []
+        self.is_running = True
+        self.stats = {"published": 0, "unroutable": 0, "delivered": 0, "requeued": 0}
+    
+    def bind(self, queue_name, routing_key):
+        """큐 선언 및 바인딩 (이미 있으면 바인딩만 추가)"""
+        with self.lock:
+            self.queues.setdefault(queue_name, queue.Queue())
+            if (routing_key, queue_name) not in self.bindings:
+                self.bindings.append((routing_key, queue_name))
+    
+    def publish(self, routing_key, message, content_type="application/json", timeout=None):
+        """메시지를 바인딩이 일치하는 모든 큐에 넣고 확인 결과 Future 반환"""
+        future = concurrent.futures.Future()
+        with self.lock:
+            targets = [self.queues[name] for pattern, name in self.bindings if self.topic_matches(pattern, routing_key)]
+            self.stats["published"] += 1
+            if not targets:
+                self.stats["unroutable"] += 1
+        for target in targets:
+            target.put((routing_key, message, content_type))
+        if not targets:
+            logger.warning(f"라우팅할 큐가 없는 메시지: routing_key={routing_key}")
+        future.set_result(bool(targets))
+        return future
+    
+    def consume(self, queue_name, callback, prefetch_count=1):
+        """큐 소비 시작 (ACK 전 메시지는 prefetch_count개까지만 전달)"""
+        with self.lock:
+            messages = self.queues.setdefault(queue_name, queue.Queue())
+        thread = threading.Thread(
+            target=self._deliver, args=(messages, callback, prefetch_count),
+            name=f"local-broker-{queue_name}", daemon=True
+        )
+        self.threads.append(thread)
+        thread.start()
+    
+    def _deliver(self, messages, callback, prefetch_count):
+        """소비자 하나의 전달 루프"""
+        slots = threading.Semaphore(prefetch_count)
+        while self.is_running:
+            slots.acquire()
+            entry = messages.get()
+            if entry is None or not self.is_running:
+                break
+            routing_key, body, content_type = entry
+            properties = SimpleNamespace(content_type=content_type, headers={}, routing_key=routing_key)
+            
+            acked = threading.Event()
+            
+            def on_complete(delivered=True, acked=acked, entry=entry):
+                # ACK/NACK는 한 번만 반영
+                if not acked.is_set():
+                    acked.set()
+                    slots.release()
+                    if not delivered:
+                        with self.lock:
+                            self.stats["requeued"] += 1
+                        messages.put(entry)
+            
+            try:
+                accepted = callback(body, properties, on_complete)
+            except Exception as e:
+                logger.error(f"소비자 콜백 오류: {str(e)}", exc_info=True)
+                accepted = False
+            if accepted:
+                with self.lock:
+                    self.stats["delivered"] += 1
+            elif not acked.is_set():
+                acked.set()
+                slots.release()
+                with self.lock:
+                    self.stats["requeued"] += 1
+                messages.put(entry)
+    
+    def get_stats(self):
+        with self.lock:
+            return dict(self.stats)
+    
+    def stop(self):
+        """전달 루프 종료"""
+        self.is_running = False
+        with self.lock:
+            targets = list(self.queues.values())
+        for target in targets:
+            for _ in self.threads:
+                target.put(None)
+    
+    @staticmethod
+    def topic_matches(pattern, routing_key):
+        """topic exchange 바인딩 규칙 (*는 단어 하나, #는 0개 이상의 단어)"""
+        def match(pattern_words, key_words):
+            if not pattern_words:
+                return not key_words
+            head, rest = pattern_words[0], pattern_words[1:]
+            if head == '#':
+                return any(match(rest, key_words[i:]) for i in range(len(key_words) + 1))
+            if not key_words:
+                return False
+            return (head == '*' or head == key_words[0]) and match(rest, key_words[1:])
+        
+        return match(pattern.split('.'), routing_key.split('.'))
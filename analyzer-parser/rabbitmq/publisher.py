@@ -1,20 +1,70 @@
+import collections
+import concurrent.futures
 import logging
+import threading
 import pika
 
 logger = logging.getLogger("rabbitmq.publisher")
 
 class RabbitMQAsyncPublisher:
-    def __init__(self, exchange_name):
+    """결과 메시지 발행기
+    
+    publish()는 어느 스레드에서나 호출할 수 있다. 메시지는 제한된 버퍼에 쌓이고
+    실제 basic_publish는 항상 pika 이벤트 루프 스레드에서 실행된다.
+    publish()가 반환하는 Future는 브로커가 발행 확인(ack)하면 True, nack하면 False가 된다.
+    """
+    
+    def __init__(self, exchange_name, buffer_size=1000, batch_size=100):
         self.exchange_name = exchange_name
         self.channel = None
+        self.ioloop = None
         self.is_ready = False
-        self.message_queue = []  # 채널이 준비되기 전 메시지 저장용
+        self.batch_size = batch_size
+        
+        # 발행 대기 버퍼 (routing_key, message, content_type, future) - 가득 차면 호출 스레드가 대기
+        self.buffer_size = buffer_size
+        self.message_queue = collections.deque()
+        self.buffer_condition = threading.Condition()
+        self.flush_scheduled = False
+        
+        # 발행 후 브로커 확인을 기다리는 메시지 (이벤트 루프 스레드에서만 접근)
+        self.delivery_tag = 0
+        self.unconfirmed = {}  # delivery_tag -> (routing_key, message, content_type, future)
+        
+        # 통계 정보
+        self.stats = {
+            "published": 0,
+            "confirmed": 0,
+            "nacked": 0,
+            "rejected": 0
+        }
+        self.stats_lock = threading.Lock()
     
     def setup(self, channel):
-        """채널이 준비되면 Exchange 설정"""
+        """채널이 준비되면 발행 확인 모드 활성화 후 Exchange 설정 (이벤트 루프 스레드에서 호출)"""
         self.channel = channel
+        self.ioloop = channel.connection.ioloop
+        self.is_ready = False
+        channel.add_on_close_callback(self._on_channel_closed)
+        
+        # 이전 채널에서 확인받지 못한 메시지는 새 채널로 다시 발행 (최소 한 번 전달)
+        if self.unconfirmed:
+            logger.warning(f"확인되지 않은 메시지 {len(self.unconfirmed)}개를 다시 발행합니다")
+            with self.buffer_condition:
+                for tag in sorted(self.unconfirmed, reverse=True):
+                    self.message_queue.appendleft(self.unconfirmed[tag])
+            self.unconfirmed.clear()
+        self.delivery_tag = 0
         
-        # Exchange 선언
+        # 발행 확인(publisher confirms) 활성화
+        self.channel.confirm_delivery(
+            ack_nack_callback=self._on_delivery_confirmation,
+            callback=self._on_confirm_selectok
+        )
+    
+    def _on_confirm_selectok(self, _unused_frame):
+        """발행 확인 모드 활성화 후 Exchange 선언"""
+        logger.info("발행 확인 모드 활성화")
         self.channel.exchange_declare(
             exchange=self.exchange_name,
             exchange_type='topic',
@@ -30,34 +80,122 @@ class RabbitMQAsyncPublisher:
         # 대기 중인 메시지 발행
         if self.message_queue:
             logger.info(f"{len(self.message_queue)}개의 대기 메시지 발행 시작")
-            for routing_key, message, content_type in self.message_queue:
-                self.publish(routing_key, message, content_type)
-            self.message_queue.clear()
-    
-    def publish(self, routing_key, message, content_type="application/json"):
-        """메시지 발행"""
-        if not self.is_ready or not self.channel:
-            # 아직 준비되지 않았으면 대기열에 추가
-            self.message_queue.append((routing_key, message, content_type))
-            logger.info(f"채널 준비 전 메시지 대기: routing_key={routing_key}")
-            return False
+        self._flush()
+    
+    def _on_channel_closed(self, channel, reason):
+        """채널이 닫히면 다음 setup까지 버퍼에만 쌓음"""
+        if channel is self.channel:
+            self.is_ready = False
+    
+    def publish(self, routing_key, message, content_type="application/json", timeout=None):
+        """메시지 발행 요청 (스레드 안전)
         
-        try:
-            properties = pika.BasicProperties(
-                content_type=content_type,
-                delivery_mode=2  # 메시지 지속성 설정
-            )
-            
-            self.channel.basic_publish(
-                exchange=self.exchange_name,
-                routing_key=routing_key,
-                body=message,
-                properties=properties
+        버퍼가 가득 차면 timeout초까지 대기하며, 그래도 자리가 없으면 False가 담긴 Future 반환
+        """
+        future = concurrent.futures.Future()
+        
+        with self.buffer_condition:
+            has_room = self.buffer_condition.wait_for(
+                lambda: len(self.message_queue) < self.buffer_size, timeout=timeout
             )
+            if not has_room:
+                logger.error(f"발행 버퍼가 가득 차 메시지 거부: routing_key={routing_key}")
+                with self.stats_lock:
+                    self.stats["rejected"] += 1
+                future.set_result(False)
+                return future
             
-            logger.info(f"메시지 발행 성공: routing_key={routing_key}")
-            return True
-            
+            self.message_queue.append((routing_key, message, content_type, future))
+            if not self.is_ready:
+                logger.info(f"채널 준비 전 메시지 대기: routing_key={routing_key}")
+            self._schedule_flush()
+        
+        return future
+    
+    def _schedule_flush(self):
+        """이벤트 루프 스레드에 버퍼 비우기 예약 (buffer_condition을 잡은 상태에서 호출)"""
+        if self.flush_scheduled or not self.is_ready or not self.ioloop:
+            return
+        try:
+            self.ioloop.add_callback_threadsafe(self._flush)
+            self.flush_scheduled = True
         except Exception as e:
-            logger.error(f"메시지 발행 실패: {str(e)}", exc_info=True)
-            return False
\ No newline at end of file
+            # 연결이 닫힌 경우 다음 setup에서 발행
+            logger.warning(f"발행 예약 실패: {str(e)}")
+    
+    def _flush(self):
+        """버퍼의 메시지를 한 번에 최대 batch_size개 발행 (이벤트 루프 스레드)"""
+        with self.buffer_condition:
+            self.flush_scheduled = False
+            if not self.is_ready or not self.channel or not self.channel.is_open:
+                return
+            batch = [
+                self.message_queue.popleft()
+                for _ in range(min(self.batch_size, len(self.message_queue)))
+            ]
+            self.buffer_condition.notify_all()
+        
+        for index, entry in enumerate(batch):
+            routing_key, message, content_type, future = entry
+            try:
+                properties = pika.BasicProperties(
+                    content_type=content_type,
+                    delivery_mode=2  # 메시지 지속성 설정
+                )
+                
+                self.channel.basic_publish(
+                    exchange=self.exchange_name,
+                    routing_key=routing_key,
+                    body=message,
+                    properties=properties
+                )
+            except Exception as e:
+                # 채널이 닫히는 중이면 남은 메시지를 버퍼 앞쪽으로 되돌림
+                logger.error(f"메시지 발행 실패: {str(e)}", exc_info=True)
+                with self.buffer_condition:
+                    for remaining in reversed(batch[index:]):
+                        self.message_queue.appendleft(remaining)
+                return
+            
+            self.delivery_tag += 1
+            self.unconfirmed[self.delivery_tag] = entry
+            with self.stats_lock:
+                self.stats["published"] += 1
+            logger.debug(f"메시지 발행: routing_key={routing_key}, delivery_tag={self.delivery_tag}")
+        
+        # 남은 메시지는 I/O 처리 후 다음 차례에 발행
+        with self.buffer_condition:
+            if self.message_queue:
+                self._schedule_flush()
+    
+    def _on_delivery_confirmation(self, method_frame):
+        """브로커의 발행 확인(ack/nack) 처리 (이벤트 루프 스레드)"""
+        method = method_frame.method
+        acked = isinstance(method, pika.spec.Basic.Ack)
+        
+        if method.multiple:
+            tags = [tag for tag in self.unconfirmed if tag <= method.delivery_tag]
+        else:
+            tags = [method.delivery_tag]
+        
+        for tag in tags:
+            entry = self.unconfirmed.pop(tag, None)
+            if not entry:
+                continue
+            routing_key, _, _, future = entry
+            if acked:
+                logger.info(f"메시지 발행 확인: routing_key={routing_key}")
+            else:
+                logger.error(f"브로커가 메시지를 거부함(nack): routing_key={routing_key}")
+            future.set_result(acked)
+        
+        with self.stats_lock:
+            self.stats["confirmed" if acked else "nacked"] += len(tags)
+    
+    def get_stats(self):
+        """발행기 통계 반환 (버퍼/확인 대기 메시지 수 포함)"""
+        with self.stats_lock:
+            stats = dict(self.stats)
+        stats["buffered"] = len(self.message_queue)
+        stats["unconfirmed"] = len(self.unconfirmed)
+        return stats
@@ -0,0 +1,23 @@
+from .blob_store import BlobStore, LocalBlobStore
+from config import Config
+
+# 저장소 백엔드 (새 백엔드는 여기에 등록)
+blob_store_backends = {
+    "local": LocalBlobStore
+}
+
+def create_blob_store(backend, **kwargs):
+    """설정된 백엔드 이름으로 저장소 생성"""
+    if backend not in blob_store_backends:
+        raise ValueError(f"지원하지 않는 저장소 백엔드: {backend}")
+    return blob_store_backends[backend](**kwargs)
+
+# 클레임 체크 저장소 인스턴스 생성
+blob_store = create_blob_store(
+    Config.CLAIM_CHECK_BACKEND,
+    base_dir=Config.CLAIM_CHECK_DIR,
+    ttl_seconds=Config.CLAIM_CHECK_TTL_SECONDS,
+    cleanup_interval=Config.CLAIM_CHECK_CLEANUP_INTERVAL_SECONDS
+)
+
+__all__ = ['blob_store', 'create_blob_store', 'BlobStore']
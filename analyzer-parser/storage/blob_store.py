@@ -0,0 +1,173 @@
+import abc
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+
+logger = logging.getLogger("analyzer.storage.blob")
+
+class BlobStore(abc.ABC):
+    """클레임 체크용 공유 저장소 인터페이스
+    
+    메시지에는 "<scheme>://<key>" 형식의 참조만 담고 실제 데이터는 저장소에 보관
+    """
+    scheme = None
+    
+    def make_ref(self, key):
+        return f"{self.scheme}://{key}"
+    
+    def parse_ref(self, ref):
+        """참조 문자열에서 키 추출"""
+        prefix = f"{self.scheme}://"
+        if not ref or not ref.startswith(prefix):
+            raise ValueError(f"지원하지 않는 저장소 참조: {ref}")
+        return ref[len(prefix):]
+    
+    @abc.abstractmethod
+    def put(self, data):
+        """데이터 저장 후 참조 반환"""
+    
+    def put_file(self, file_path):
+        """파일 내용 저장 후 참조 반환"""
+        with open(file_path, 'rb') as f:
+            return self.put(f.read())
+    
+    @abc.abstractmethod
+    def get(self, ref):
+        """참조로 데이터 조회"""
+    
+    @abc.abstractmethod
+    def delete(self, ref):
+        """참조된 데이터 삭제"""
+    
+    @abc.abstractmethod
+    def cleanup_expired(self):
+        """TTL이 지난 데이터 정리 후 삭제 개수 반환"""
+    
+    def start_cleanup(self):
+        """만료 데이터 주기 정리 시작 (저장소가 스스로 만료시키면 아무것도 하지 않음)"""
+    
+    def stop_cleanup(self):
+        """만료 데이터 주기 정리 중지"""
+
+
+class LocalBlobStore(BlobStore):
+    """로컬(또는 공유 마운트) 파일시스템 기반 저장소
+    
+    만료 데이터는 start_cleanup()의 정리 스레드가 cleanup_interval초마다 지우고,
+    저장/조회/삭제 시점에도 같은 간격으로 정리한다 (업로드만 읽는 노드에서도 쌓이지 않도록).
+    """
+    scheme = "local"
+    
+    KEY_PATTERN = re.compile(r'[0-9a-f]{32}')
+    
+    def __init__(self, base_dir, ttl_seconds=86400, cleanup_interval=600):
+        self.base_dir = Path(base_dir)
+        self.ttl_seconds = ttl_seconds
+        self.cleanup_interval = cleanup_interval
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self._last_cleanup = 0
+        self._cleanup_lock = threading.Lock()
+        self._cleanup_thread = None
+        self._cleanup_stop = threading.Event()
+    
+    def _blob_path(self, ref):
+        key = self.parse_ref(ref)
+        # 키 형식을 제한하여 저장소 밖의 경로 접근 방지
+        if not self.KEY_PATTERN.fullmatch(key):
+            raise ValueError(f"잘못된 저장소 키: {key}")
+        return self.base_dir / key
+    
+    def put(self, data):
+        ref = self.make_ref(uuid.uuid4().hex)
+        blob_path = self._blob_path(ref)
+        tmp_path = blob_path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, blob_path)
+        
+        self._maybe_cleanup()
+        return ref
+    
+    def put_file(self, file_path):
+        ref = self.make_ref(uuid.uuid4().hex)
+        blob_path = self._blob_path(ref)
+        tmp_path = blob_path.with_suffix('.tmp')
+        shutil.copyfile(file_path, tmp_path)
+        os.replace(tmp_path, blob_path)
+        
+        self._maybe_cleanup()
+        return ref
+    
+    def get(self, ref):
+        with open(self._blob_path(ref), 'rb') as f:
+            data = f.read()
+        self._maybe_cleanup()
+        return data
+    
+    def delete(self, ref):
+        try:
+            self._blob_path(ref).unlink()
+            deleted = True
+        except FileNotFoundError:
+            deleted = False
+        self._maybe_cleanup()
+        return deleted
+    
+    def cleanup_expired(self):
+        expire_before = time.time() - self.ttl_seconds
+        removed = 0
+        with os.scandir(self.base_dir) as it:
+            for entry in it:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < expire_before:
+                        os.unlink(entry.path)
+                        removed += 1
+                except OSError as e:
+                    logger.warning(f"저장소 정리 중 오류 {entry.path}: {str(e)}")
+        
+        if removed:
+            logger.info(f"만료된 저장소 데이터 {removed}개 삭제")
+        return removed
+    
+    def start_cleanup(self):
+        """시작 시 한 번 정리한 뒤 cleanup_interval초마다 만료 데이터를 정리하는 스레드 시작"""
+        if self._cleanup_thread is not None:
+            return
+        self._cleanup_stop.clear()
+        self._cleanup_thread = threading.Thread(target=self._cleanup_loop, name="blob-cleanup", daemon=True)
+        self._cleanup_thread.start()
+    
+    def stop_cleanup(self):
+        if self._cleanup_thread is None:
+            return
+        self._cleanup_stop.set()
+        self._cleanup_thread.join(timeout=5)
+        self._cleanup_thread = None
+    
+    def _cleanup_loop(self):
+        while True:
+            try:
+                self._last_cleanup = time.time()
+                self.cleanup_expired()
+            except Exception as e:
+                logger.error(f"저장소 주기 정리 오류: {str(e)}")
+            if self._cleanup_stop.wait(self.cleanup_interval):
+                return
+    
+    def _maybe_cleanup(self):
+        """저장/조회/삭제 시점에 일정 간격으로만 만료 데이터 정리"""
+        now = time.time()
+        if now - self._last_cleanup < self.cleanup_interval:
+            return
+        if not self._cleanup_lock.acquire(blocking=False):
+            return
+        try:
+            self._last_cleanup = now
+            self.cleanup_expired()
+        finally:
+            self._cleanup_lock.release()
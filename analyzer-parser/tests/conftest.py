@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# 테스트는 analyzer-parser 디렉토리를 기준으로 패키지를 가져옴 (python -m pytest tests)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,43 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+from storage import blob_store
+from worker import worker_pool
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """브로커 연결 없이 만든 앱의 테스트 클라이언트 (종료 처리는 직접 수행)"""
+    root = Path(__file__).resolve().parent.parent
+    spec = importlib.util.spec_from_file_location("analyzer_app", root / "__init__.py")
+    app_module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "analyzer_app", app_module)
+    spec.loader.exec_module(app_module)
+    monkeypatch.setattr(app_module, "init_rabbitmq", lambda: True)
+    monkeypatch.setattr(app_module.atexit, "register", lambda func: None)
+
+    app = app_module.create_app()
+    yield app.test_client()
+    worker_pool.stop()
+    blob_store.stop_cleanup()
+
+
+def test_polled_routes_keep_worker_pool_running(client):
+    """/metrics 조회와 작업 취소 요청이 작업자 풀을 멈추지 않음"""
+    assert client.get('/metrics').status_code == 200
+    assert worker_pool.is_running
+
+    response = client.post('/jobs/unknown-project/cancel')
+    assert response.status_code == 404
+    assert response.get_json() == {"projectId": "unknown-project", "cancelled": False}
+    assert worker_pool.is_running
+
+
+def test_metrics_export_worker_pool_outcomes(client):
+    """작업자 풀 통계의 대체/취소 작업 수가 지표로 노출됨"""
+    body = client.get('/metrics').get_data(as_text=True)
+    for name in ("tasks_completed_total", "tasks_failed_total", "tasks_cancelled_total", "tasks_superseded_total"):
+        assert f"\nanalyzer_{name} " in body
@@ -0,0 +1,42 @@
+import javalang
+
+from parser.ast_store import AstStore
+
+
+def counting_parser(monkeypatch):
+    calls = []
+    parse = javalang.parse.parse
+
+    def counted(content):
+        calls.append(content)
+        return parse(content)
+
+    monkeypatch.setattr(javalang.parse, "parse", counted)
+    return calls
+
+
+def test_each_file_is_parsed_at_most_once_per_job(monkeypatch):
+    calls = counting_parser(monkeypatch)
+    store = AstStore()
+    file_info = {'path': "src/A.java", 'content': "class A { void run() { } }"}
+
+    tree = store.get(file_info)
+    assert tree is not None
+    assert store.get(file_info) is tree
+    assert store.peek("src/A.java") is tree
+    assert len(calls) == 1
+    assert store.get_stats() == {"parsed": 1, "failed": 0, "reused": 1}
+
+
+def test_parse_failures_are_remembered_and_not_retried(monkeypatch):
+    calls = counting_parser(monkeypatch)
+    store = AstStore()
+    broken = {'path': "src/B.java", 'content': "class B { void run( }"}
+
+    assert store.get(broken) is None
+    assert store.get(broken) is None
+    assert len(calls) == 1
+    assert store.failed("src/B.java")
+    assert store.get_failure("src/B.java")
+    assert store.peek("src/B.java") is None
+    assert store.get_stats() == {"parsed": 0, "failed": 1, "reused": 0}
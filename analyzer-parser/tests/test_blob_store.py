@@ -0,0 +1,54 @@
+import os
+import time
+
+from storage.blob_store import LocalBlobStore
+
+
+def expire(store, ref):
+    past = time.time() - store.ttl_seconds - 1
+    os.utime(store._blob_path(ref), (past, past))
+
+
+def test_cleanup_removes_only_expired_blobs(tmp_path):
+    store = LocalBlobStore(tmp_path, ttl_seconds=60)
+    old_ref, new_ref = store.put(b"old"), store.put(b"new")
+    expire(store, old_ref)
+
+    assert store.cleanup_expired() == 1
+    assert not store._blob_path(old_ref).exists()
+    assert store.get(new_ref) == b"new"
+
+
+def test_reading_node_sweeps_expired_uploads(tmp_path):
+    """업로드를 저장하지 않고 읽기만 하는 노드에서도 조회/삭제 시점에 만료 데이터를 정리"""
+    uploader = LocalBlobStore(tmp_path, ttl_seconds=60)
+    abandoned, upload = uploader.put(b"abandoned"), uploader.put(b"upload")
+    expire(uploader, abandoned)
+
+    reader = LocalBlobStore(tmp_path, ttl_seconds=60, cleanup_interval=0)
+    assert reader.get(upload) == b"upload"
+    assert not reader._blob_path(abandoned).exists()
+    assert reader.delete(upload) is True
+
+
+def test_cleanup_thread_sweeps_at_start_and_periodically(tmp_path):
+    store = LocalBlobStore(tmp_path, ttl_seconds=60, cleanup_interval=0.05)
+    first = store.put(b"first")
+    expire(store, first)
+
+    store.start_cleanup()
+    try:
+        deadline = time.monotonic() + 5
+        while store._blob_path(first).exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not store._blob_path(first).exists()
+
+        second = store.put(b"second")
+        expire(store, second)
+        deadline = time.monotonic() + 5
+        while store._blob_path(second).exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not store._blob_path(second).exists()
+    finally:
+        store.stop_cleanup()
+    assert store._cleanup_thread is None
@@ -0,0 +1,71 @@
+from parser.extractors.class_extractor import ClassInfoExtractor
+
+SERVICE_SOURCE = """
+package com.example.service;
+
+@Service
+public class FooService {
+    private final FooRepository repository;
+    private int[] limits = {1, 2};
+
+    @Transactional(readOnly = true)
+    public List<Foo> find(String query) {
+        return repository.findAll();
+    }
+
+    public void save(Foo foo) {
+        repository.save(foo);
+    }
+}
+"""
+
+
+def test_annotation_argument_assignment_keeps_method_bodies():
+    """어노테이션 인자의 '='가 메서드 본문을 필드 초기값으로 오인하게 만들지 않음"""
+    class_info = ClassInfoExtractor().extract(SERVICE_SOURCE)
+
+    assert [method['name'] for method in class_info['methods']] == ['find', 'save']
+    assert class_info['methods'][0]['parameters'] == [{'type': 'String', 'name': 'query'}]
+    assert [field['name'] for field in class_info['fields']] == ['repository', 'limits']
+
+
+def test_field_initializer_braces_stay_in_declaration():
+    """필드 초기값의 배열 중괄호는 본문이 아니라 선언문의 일부"""
+    source = "class A { int[] values = {1, 2}; void run() { } }"
+    class_info = ClassInfoExtractor().extract(source)
+
+    assert [field['name'] for field in class_info['fields']] == ['values']
+    assert [method['name'] for method in class_info['methods']] == ['run']
+
+
+ARRAY_ANNOTATION_SOURCE = """
+@RestController
+public class FooController {
+    @GetMapping({"/a", "/b"})
+    public String list() {
+        return "ok";
+    }
+
+    @SuppressWarnings({"unchecked"})
+    public int count() {
+        return 0;
+    }
+
+    @ExceptionHandler({IllegalStateException.class})
+    public void handle(IllegalStateException e) {
+    }
+}
+"""
+
+
+def test_annotation_array_braces_are_not_member_bodies():
+    """어노테이션 인자의 배열 중괄호를 메서드 본문 시작으로 오인하지 않음"""
+    method_spans = []
+    class_info = ClassInfoExtractor().extract(ARRAY_ANNOTATION_SOURCE, method_spans=method_spans)
+
+    assert [(method['access'], method['return_type'], method['name']) for method in class_info['methods']] == [
+        ('public', 'String', 'list'), ('public', 'int', 'count'), ('public', 'void', 'handle')
+    ]
+    assert [span['annotations'] for span in method_spans] == [
+        ['GetMapping'], ['SuppressWarnings'], ['ExceptionHandler']
+    ]
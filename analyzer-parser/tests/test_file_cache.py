@@ -0,0 +1,34 @@
+import os
+
+from cache.file_cache import FileAnalysisCache
+
+
+def test_put_evicts_least_recently_used_entries(tmp_path):
+    cache = FileAnalysisCache(tmp_path, max_size_mb=1)
+    value = {"class_info": "x" * 200 * 1024}
+    keys = [cache.make_key(f"class A{i} {{}}", "5") for i in range(4)]
+    for age, key in enumerate(keys[:3]):
+        assert cache.put(key, value)
+        os.utime(cache._entry_path(key), (age, age))
+
+    # 가장 오래된 항목을 조회하면 최근 사용으로 갱신되어 남음
+    assert cache.get(keys[0]) == value
+    assert cache.put(keys[3], value)
+    assert cache.evict() == 0
+
+    cache.max_size_bytes = 700 * 1024
+    cache.put(cache.make_key("class B {}", "5"), value)
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == value
+    assert sum(size for _, _, size in cache._scan_entries()) <= cache.max_size_bytes
+
+
+def test_entries_of_old_extractor_versions_are_reclaimed(tmp_path):
+    cache = FileAnalysisCache(tmp_path, max_size_mb=1)
+    value = {"class_info": "x" * 300 * 1024}
+    old_key = cache.make_key("class A {}", "4")
+    cache.put(old_key, value)
+    os.utime(cache._entry_path(old_key), (0, 0))
+    for i in range(3):
+        cache.put(cache.make_key(f"class A{i} {{}}", "5"), value)
+    assert cache.get(old_key) is None
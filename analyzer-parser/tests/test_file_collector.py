@@ -0,0 +1,29 @@
+import io
+import zipfile
+
+from parser.file_collector import FileCollector
+from parser.stage_timer import content_bytes
+
+FILES = {
+    "src/main/java/com/example/Hello.java": "package com.example;\n\nimport java.util.List;\n\n// 인사\nclass Hello { }\n",
+    "src/main/resources/application.yml": "server:\n  port: 8080\n",
+    "build.gradle": "plugins { id 'java' }\n",
+}
+
+
+def test_collected_sizes_are_source_bytes(tmp_path):
+    for path, content in FILES.items():
+        target = tmp_path / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content, encoding="utf-8")
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        for path, content in FILES.items():
+            zip_file.writestr(path, content)
+
+    expected = {path: len(content.encode("utf-8")) for path, content in FILES.items()}
+    for index in (FileCollector().collect_index(str(tmp_path)), FileCollector().collect_index(archive=archive.getvalue())):
+        # Java 파일은 import가 제거된 내용이 담겨도 크기는 읽은 원본 기준
+        assert {file_info['path']: file_info['size'] for file_info in index.files()} == expected
+        assert content_bytes(index.files()) == sum(expected.values())
+        assert content_bytes(index.of_type('build')) == expected["build.gradle"]
@@ -0,0 +1,127 @@
+import base64
+import concurrent.futures
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from file.service import FileService
+from message import callback
+from message.callback import MessageProcessor
+from message.dispatcher import ReulstDispatcher
+from storage.blob_store import BlobStore, LocalBlobStore
+
+
+class FakeDispatcher:
+    """발행 결과(브로커 확인 여부)를 지정할 수 있는 결과 발행기"""
+
+    def __init__(self, delivered=True, error=None):
+        self.delivered = delivered
+        self.error = error
+        self.published = []
+
+    def publish_success(self, project_id, analysis_result):
+        return self._publish(("success", project_id))
+
+    def publish_error(self, project_id, error_message, error_code=None, details=None):
+        return self._publish(("error", project_id, error_code))
+
+    def _publish(self, entry):
+        if self.error:
+            raise self.error
+        self.published.append(entry)
+        return self.delivered
+
+
+def finish(dispatcher, result, error=None):
+    """_on_job_done을 실행하고 on_complete에 전달된 delivered 값 반환"""
+    processor = MessageProcessor(None, None, dispatcher)
+    calls = []
+    processor._on_job_done("p1", result, error, lambda delivered=True: calls.append(delivered))
+    assert len(calls) == 1
+    return calls[0]
+
+
+@pytest.mark.parametrize("result, error", [
+    ({'success': True, 'analysis_file': 'a', 'summary_file': 's', 'files_processed': 1}, None),
+    ({'success': False, 'error': "시간 초과", 'error_code': "TIMEOUT"}, None),
+    (None, "작업자 오류"),
+])
+def test_upload_is_acked_only_after_confirmed_publish(result, error):
+    assert finish(FakeDispatcher(delivered=True), result, error) is True
+    assert finish(FakeDispatcher(delivered=False), result, error) is False
+
+
+def test_publish_exception_requeues_upload():
+    dispatcher = FakeDispatcher(error=RuntimeError("발행기 오류"))
+    assert finish(dispatcher, {'success': False, 'error': "오류"}) is False
+
+
+def test_superseded_upload_is_acked_without_publishing():
+    dispatcher = FakeDispatcher(delivered=False)
+    assert finish(dispatcher, {'success': False, 'superseded': True, 'error': "대체됨"}) is True
+    assert dispatcher.published == []
+
+
+@pytest.mark.parametrize("delivered", [True, False])
+def test_referenced_upload_is_deleted_only_after_delivery(tmp_path, delivered):
+    blob_store = LocalBlobStore(tmp_path)
+    file_ref = blob_store.put(b"PK")
+    processor = MessageProcessor(FileService(tmp_path / "work", blob_store=blob_store), None,
+                                 FakeDispatcher(delivered=delivered))
+    calls = []
+    processor._on_job_done("p1", {'success': False, 'error': "오류"}, None, calls.append, file_ref)
+    assert calls == [delivered]
+    # 전달되지 않은 업로드는 다시 받은 메시지가 읽을 수 있도록 남김
+    assert blob_store._blob_path(file_ref).exists() is not delivered
+
+
+def test_blob_store_backends_must_implement_storage_methods():
+    class PartialStore(BlobStore):
+        scheme = "partial"
+
+        def put(self, data):
+            return self.make_ref("key")
+
+    with pytest.raises(TypeError):
+        PartialStore()
+
+
+def test_malformed_message_is_rejected_without_publishing():
+    dispatcher = FakeDispatcher()
+    processor = MessageProcessor(None, None, dispatcher)
+    assert processor.on_message(b"{not json", SimpleNamespace(content_type="application/json", headers={})) is False
+    assert dispatcher.published == []
+
+
+def test_submit_failure_does_not_wait_for_publish_confirm(monkeypatch):
+    """on_message는 소비자 이벤트 루프 스레드에서 실행되므로 오류 발행 확인을 기다리지 않음"""
+    class StoppedPool:
+        backend = "thread"
+
+        def create_cancel_token(self, timeout=None):
+            return None
+
+        def submit(self, *args, **kwargs):
+            raise RuntimeError("작업자 풀이 실행 중이 아닙니다")
+
+    confirm = concurrent.futures.Future()  # 이벤트 루프가 막혀 있으면 확인되지 않는 발행
+    dispatcher = ReulstDispatcher()
+    dispatcher._publisher = lambda routing_key, message: confirm
+    monkeypatch.setattr(callback, "worker_pool", StoppedPool())
+    processor = MessageProcessor(FileService("unused"), None, dispatcher)
+    body = json.dumps({"projectId": "p1", "fileContent": base64.b64encode(b"PK").decode()})
+
+    started = time.monotonic()
+    assert processor.on_message(body, SimpleNamespace(content_type="application/json", headers={})) is False
+    assert time.monotonic() - started < 1
+
+    # 이벤트 루프가 확인을 처리하면 대신 기다리던 스레드가 결과를 집계
+    confirm.set_result(True)
+    dispatcher.shutdown()
+    for _ in range(100):
+        if dispatcher.get_stats()["delivered"]:
+            break
+        time.sleep(0.01)
+    assert dispatcher.get_stats() == {"delivered": 1, "failed": 0, "timeout": 0}
@@ -0,0 +1,38 @@
+import json
+
+from cache.result_cache import ResultCache
+
+
+def store(cache, tmp_path, key):
+    analysis, summary = tmp_path / "analysis.json", tmp_path / "summary.json"
+    analysis.write_text(json.dumps({"project": key}), encoding="utf-8")
+    summary.write_text("{}", encoding="utf-8")
+    assert cache.put(key, {'analysis_file': str(analysis), 'summary_file': str(summary), 'files_processed': 3})
+
+
+def test_hit_returns_copies_that_survive_eviction(tmp_path):
+    cache = ResultCache(tmp_path / "cache")
+    store(cache, tmp_path, "a" * 64)
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+
+    result = cache.get("a" * 64, output_dir)
+    assert result['cached'] and result['files_processed'] == 3
+
+    # 발행 전에 다른 작업의 저장으로 항목이 제거되어도 복사본은 남음
+    cache.max_size_bytes = 0
+    assert cache.evict() == 1
+    with open(result['analysis_file'], encoding="utf-8") as f:
+        assert json.load(f) == {"project": "a" * 64}
+
+
+def test_entry_removed_before_copy_is_a_miss(tmp_path):
+    cache = ResultCache(tmp_path / "cache")
+    store(cache, tmp_path, "b" * 64)
+    (tmp_path / "cache" / ("b" * 64) / ResultCache.SUMMARY_FILE).unlink()
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+
+    assert cache.get("b" * 64, output_dir) is None
+    assert list(output_dir.iterdir()) == []
+    assert cache.get_stats()["misses"] == 1
@@ -0,0 +1,45 @@
+import concurrent.futures
+
+from config import Config
+from message.dispatcher import ReulstDispatcher
+
+
+def dispatcher_with(publisher):
+    dispatcher = ReulstDispatcher()
+    dispatcher._publisher = publisher
+    return dispatcher
+
+
+def confirmed(value):
+    future = concurrent.futures.Future()
+    future.set_result(value)
+    return future
+
+
+def test_publish_returns_broker_confirmation():
+    published = []
+
+    def publisher(routing_key, message):
+        published.append(routing_key)
+        return confirmed(len(published) == 1)
+
+    dispatcher = dispatcher_with(publisher)
+    assert dispatcher.publish_error("p1", "오류", "TIMEOUT") is True
+    assert dispatcher.publish_error("p1", "오류") is False
+    assert published == [Config.ROUTING_RESULT_ERROR] * 2
+    assert dispatcher.get_stats() == {"delivered": 1, "failed": 1, "timeout": 0}
+
+
+def test_publisher_errors_are_reported_as_not_delivered():
+    def broken(routing_key, message):
+        raise RuntimeError("채널 닫힘")
+
+    def failed_future(routing_key, message):
+        future = concurrent.futures.Future()
+        future.set_exception(RuntimeError("연결 끊김"))
+        return future
+
+    assert dispatcher_with(broken).publish_error("p1", "오류") is False
+    dispatcher = dispatcher_with(failed_future)
+    assert dispatcher.publish_error("p1", "오류") is False
+    assert dispatcher.get_stats()["failed"] == 1
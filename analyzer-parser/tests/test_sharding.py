@@ -0,0 +1,171 @@
+import concurrent.futures
+import json
+import threading
+
+import pytest
+
+from parser.analyzers.java_analyzer import JavaAnalyzer
+from parser.sharding import ShardCoordinator, ShardWorker
+from rabbitmq.local_broker import LocalBroker
+from worker.cancellation import CancelToken, JobCancelled
+
+TASK_KEY = "analysis.shard"
+RESULT_KEY = "analysis.shard.result"
+
+JAVA_FILES = [
+    {'path': f"src/main/java/com/example/Service{i}.java", 'content': f"""
+package com.example;
+
+@Service
+public class Service{i} {{
+    private final Repository{i} repository;
+
+    // TODO 캐시 적용
+    public int count(String query) {{
+        if (query == null) {{
+            return 0;
+        }}
+        return repository.count(query) + {i};
+    }}
+}}
+"""}
+    for i in range(4)
+]
+
+
+class ShardCluster:
+    """LocalBroker로 연결된 조정자 하나와 샤드 작업자들
+    
+    handle(cluster, task)가 False를 반환하면 샤드 메시지를 ACK만 하고 응답하지 않는다 (잃어버린 시도).
+    """
+
+    def __init__(self, handle=None, max_attempts=3, publish=None, workers=2):
+        self.broker = LocalBroker()
+        self.handle = handle or (lambda cluster, task: True)
+        self.seen = []  # 작업자에게 전달된 (shard, attempt)
+        self.lock = threading.Lock()
+        self.coordinator = ShardCoordinator(
+            "test-node", TASK_KEY, RESULT_KEY, shard_bytes=1, min_files=1,
+            timeout=0.3, max_attempts=max_attempts, publish=publish or self.broker.publish
+        )
+        self.coordinator.POLL_SECONDS = 0.05
+        self.broker.bind("shard.queue", TASK_KEY)
+        self.broker.bind("shard.result.test-node", self.coordinator.reply_to)
+        self.broker.consume("shard.result.test-node", self.coordinator.on_result, prefetch_count=100)
+        self.workers = [ShardWorker(JavaAnalyzer(), publish=self.broker.publish) for _ in range(workers)]
+        for worker in self.workers:
+            self.broker.consume("shard.queue", self._intercept(worker))
+
+    def _intercept(self, worker):
+        def on_message(body, properties=None, on_complete=None):
+            task = json.loads(body)
+            with self.lock:
+                self.seen.append((task['shard'], task['attempt']))
+            if self.handle(self, task):
+                return worker.on_message(body, properties, on_complete)
+            on_complete()
+            return True
+        return on_message
+
+    def reply(self, task, success=True, results=None):
+        """작업자 대신 task의 시도 번호로 결과 발행"""
+        message = {"jobId": task['jobId'], "shard": task['shard'], "attempt": task['attempt'], "success": success}
+        if success:
+            message['results'] = results
+        else:
+            message['error'] = "주입된 오류"
+        self.broker.publish(task['replyTo'], json.dumps(message))
+
+    def attempts(self, shard):
+        with self.lock:
+            return sorted(attempt for seen_shard, attempt in self.seen if seen_shard == shard)
+
+    def analyze(self, cancel_token=None):
+        try:
+            return self.coordinator.analyze(JAVA_FILES, JavaAnalyzer(), cancel_token)
+        finally:
+            self.broker.stop()
+            for worker in self.workers:
+                worker.shutdown()
+
+
+@pytest.fixture
+def expected():
+    return JavaAnalyzer().analyze_all(JAVA_FILES)
+
+
+def test_sharded_result_matches_local_analysis(expected):
+    cluster = ShardCluster()
+    assert cluster.analyze() == expected
+    assert all(cluster.attempts(shard) == [1] for shard in range(len(JAVA_FILES)))
+
+
+def test_lost_and_failed_shards_are_retried(expected):
+    def handle(cluster, task):
+        if task['attempt'] > 1:
+            return True
+        if task['shard'] == 1:
+            cluster.reply(task, success=False)
+            return False
+        # 샤드 0의 첫 시도는 응답 없이 사라져 기한 초과 후 다시 발행됨
+        return task['shard'] != 0
+
+    cluster = ShardCluster(handle)
+    assert cluster.analyze() == expected
+    assert cluster.attempts(0) == [1, 2]
+    assert cluster.attempts(1) == [1, 2]
+    assert cluster.attempts(2) == [1]
+
+
+def test_late_replies_from_older_attempts_are_ignored(expected):
+    stale = {}
+
+    def handle(cluster, task):
+        if task['shard'] != 0:
+            return True
+        if task['attempt'] == 1:
+            stale['task'] = task
+            return False
+        # 두 번째 시도를 처리하기 전에 첫 시도의 늦은 응답(잘못된 결과, 실패)이 도착
+        bogus = [{'class_info': {'name': "Stale"}, 'method_spans': [], 'complexity': None,
+                  'javadocs': [], 'todos': []}]
+        cluster.reply(stale['task'], results=bogus)
+        cluster.reply(stale['task'], success=False)
+        return True
+
+    cluster = ShardCluster(handle)
+    assert cluster.analyze() == expected
+    assert cluster.attempts(0) == [1, 2]
+
+
+def test_unconfirmed_shard_publish_is_retried(expected):
+    cluster = None
+    rejected = []
+
+    def publish(routing_key, message):
+        task = json.loads(message) if routing_key == TASK_KEY else None
+        if task and task['shard'] == 2 and not rejected:
+            rejected.append(task['attempt'])
+            future = concurrent.futures.Future()
+            future.set_result(False)
+            return future
+        return cluster.broker.publish(routing_key, message)
+
+    cluster = ShardCluster(publish=publish)
+    assert cluster.analyze() == expected
+    assert rejected == [1]
+    assert cluster.attempts(2) == [2]
+
+
+def test_shard_is_analyzed_locally_after_max_attempts(expected):
+    cluster = ShardCluster(lambda cluster, task: task['shard'] != 3, max_attempts=2)
+    assert cluster.analyze() == expected
+    assert cluster.attempts(3) == [1, 2]
+
+
+def test_cancel_token_stops_waiting_for_shards():
+    token = CancelToken()
+    cluster = ShardCluster(lambda cluster, task: token.cancel() or False)
+    with pytest.raises(JobCancelled):
+        cluster.analyze(token)
+    assert cluster.coordinator._jobs == {}
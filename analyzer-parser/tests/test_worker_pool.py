@@ -0,0 +1,177 @@
+import threading
+
+import pytest
+
+from worker.cancellation import JobCancelled
+from worker.worker_pool import WorkerPool
+
+
+def interruptible_job(started, cancel_token=None):
+    """취소 토큰이 취소/기한 초과될 때까지 기다린 뒤 분석 작업처럼 중단 결과를 반환"""
+    started.set()
+    while True:
+        try:
+            cancel_token.check()
+        except JobCancelled as e:
+            return {'success': False, 'error': str(e), 'error_code': e.error_code, 'error_details': e.details}
+        threading.Event().wait(0.01)
+
+
+@pytest.fixture
+def pool():
+    pool = WorkerPool(max_workers=1)
+    pool.start()
+    yield pool
+    pool.stop()
+
+
+def run(pool, timeout=None, cancel=False):
+    started, done = threading.Event(), threading.Event()
+    results = []
+
+    def callback(task_id, result, error):
+        results.append((result, error))
+        done.set()
+
+    pool.submit("p1", interruptible_job, started, callback=callback,
+                cancel_token=pool.create_cancel_token(timeout))
+    assert started.wait(5)
+    if cancel:
+        assert pool.cancel("p1")
+    assert done.wait(5)
+    return results[0]
+
+
+def test_running_job_cancelled_is_not_counted_as_completed(pool):
+    result, error = run(pool, cancel=True)
+    assert error is None and result['error_code'] == "CANCELLED"
+    assert pool.get_task_status("p1")['status'] == "cancelled"
+    stats = pool.get_stats()
+    assert (stats["completed"], stats["cancelled"], stats["failed"]) == (0, 1, 0)
+
+
+def test_running_job_timed_out_is_counted_as_failed(pool):
+    result, error = run(pool, timeout=0.05)
+    assert error is None and result['error_code'] == "TIMEOUT"
+    assert pool.get_task_status("p1")['status'] == "failed"
+    stats = pool.get_stats()
+    assert (stats["completed"], stats["cancelled"], stats["failed"]) == (0, 0, 1)
+
+
+def gated_job(label, gate, cancel_token=None):
+    """gate가 열리거나 취소될 때까지 실행 상태로 머무는 작업"""
+    while not gate.wait(0.01):
+        if cancel_token and cancel_token.cancelled:
+            return {'success': False, 'error': "작업이 취소됨", 'error_code': "CANCELLED"}
+    return {'success': True, 'label': label}
+
+
+class Recorder:
+    """작업 완료 콜백 결과를 label 순서대로 기록"""
+
+    def __init__(self):
+        self.results = {}
+        self.condition = threading.Condition()
+
+    def callback_for(self, label):
+        def callback(task_id, result, error):
+            with self.condition:
+                self.results[label] = result
+                self.condition.notify_all()
+        return callback
+
+    def wait_for(self, *labels):
+        with self.condition:
+            assert self.condition.wait_for(lambda: all(label in self.results for label in labels), 5)
+        return [self.results[label] for label in labels]
+
+
+def submit(pool, recorder, task_id, label, gate):
+    pool.submit(task_id, gated_job, label, gate, callback=recorder.callback_for(label),
+                cancel_token=pool.create_cancel_token())
+
+
+def wait_until(predicate):
+    for _ in range(500):
+        if predicate():
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError("조건을 기다리다 시간 초과")
+
+
+@pytest.fixture
+def coalescing_pool(request):
+    pool = WorkerPool(max_workers=1, coalesce=request.param)
+    pool.start()
+    yield pool
+    pool.stop()
+
+
+@pytest.mark.parametrize("coalescing_pool", ["wait"], indirect=True)
+def test_wait_supersedes_pending_and_holds_latest_upload(coalescing_pool):
+    pool, recorder = coalescing_pool, Recorder()
+    busy, gate = threading.Event(), threading.Event()
+
+    # 다른 프로젝트가 슬롯을 차지한 동안 대기 중인 p1은 새 업로드로 대체됨
+    submit(pool, recorder, "other", "other", busy)
+    wait_until(lambda: pool.get_task_status("other")['status'] == "running")
+    submit(pool, recorder, "p1", "v1", gate)
+    submit(pool, recorder, "p1", "v2", gate)
+    assert recorder.wait_for("v1")[0]['superseded'] is True
+    assert pool.get_stats()["queued"] == 1
+
+    # 실행 중인 p1 뒤에는 최신 업로드 하나만 보류되고, 그 전에 보류된 업로드는 대체됨
+    busy.set()
+    wait_until(lambda: pool.get_task_status("p1")['status'] == "running")
+    submit(pool, recorder, "p1", "v3", gate)
+    submit(pool, recorder, "p1", "v4", gate)
+    assert recorder.wait_for("v3")[0]['superseded'] is True
+    assert "v2" not in recorder.results
+
+    gate.set()
+    v2, v4 = recorder.wait_for("v2", "v4")
+    assert v2 == {'success': True, 'label': "v2"}
+    assert v4 == {'success': True, 'label': "v4"}
+    wait_until(lambda: not pool.active)
+    stats = pool.get_stats()
+    assert (stats["completed"], stats["superseded"], stats["queued"]) == (3, 2, 0)
+
+
+@pytest.mark.parametrize("coalescing_pool", ["cancel"], indirect=True)
+def test_cancel_discards_running_result_and_runs_held_upload(coalescing_pool):
+    pool, recorder = coalescing_pool, Recorder()
+    gate = threading.Event()
+
+    submit(pool, recorder, "p1", "v1", gate)
+    wait_until(lambda: pool.get_task_status("p1")['status'] == "running")
+    submit(pool, recorder, "p1", "v2", threading.Event())
+
+    # 실행 중인 v1은 취소 토큰으로 중단되고 콜백은 superseded 결과를 받음
+    v1 = recorder.wait_for("v1")[0]
+    assert v1['superseded'] is True
+    wait_until(lambda: pool.get_task_status("p1")['status'] == "running")
+
+    # 보류 없이 실행 중인 v2는 cancel()로 중단되어 cancelled 결과를 받음
+    assert pool.cancel("p1")
+    v2 = recorder.wait_for("v2")[0]
+    assert v2['error_code'] == "CANCELLED"
+    wait_until(lambda: not pool.active)
+    stats = pool.get_stats()
+    assert (stats["completed"], stats["superseded"], stats["cancelled"]) == (0, 1, 1)
+
+
+@pytest.mark.parametrize("coalescing_pool", ["wait"], indirect=True)
+def test_cancel_drops_held_upload_before_it_runs(coalescing_pool):
+    pool, recorder = coalescing_pool, Recorder()
+    gate = threading.Event()
+
+    submit(pool, recorder, "p1", "v1", gate)
+    wait_until(lambda: pool.get_task_status("p1")['status'] == "running")
+    submit(pool, recorder, "p1", "v2", gate)
+
+    assert pool.cancel("p1")
+    assert recorder.wait_for("v2")[0]['error_code'] == "CANCELLED"
+    # 실행 중인 v1에는 취소 요청만 전달되어 다음 확인 지점에서 멈춤
+    assert recorder.wait_for("v1")[0] == {'success': False, 'error': "작업이 취소됨", 'error_code': "CANCELLED"}
+    wait_until(lambda: not pool.active)
+    assert pool.get_stats()["cancelled"] == 2
@@ -2,6 +2,14 @@ from .worker_pool import WorkerPool
 from config import Config
 
 # 작업자 풀 인스턴스 생성
-worker_pool = WorkerPool(max_workers=Config.WORKER_POOL_SIZE)
+worker_pool = WorkerPool(
+    max_workers=Config.WORKER_POOL_SIZE,
+    backend=Config.WORKER_BACKEND,
+    max_tasks_per_child=Config.WORKER_MAX_TASKS_PER_CHILD,
+    queue_policy=Config.WORKER_QUEUE_POLICY,
+    aging_rate=Config.WORKER_QUEUE_AGING_MB_PER_SEC * 1024 * 1024,
+    default_cost=Config.WORKER_QUEUE_UNKNOWN_COST_MB * 1024 * 1024,
+    coalesce=Config.WORKER_COALESCE
+)
 
 __all__ = ['worker_pool']
\ No newline at end of file
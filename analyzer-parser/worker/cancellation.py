@@ -0,0 +1,56 @@
+import threading
+import time
+
+class JobCancelled(Exception):
+    """협조적 취소 지점에서 작업이 취소되었거나 기한을 넘겼을 때 발생 (reason: cancelled, timeout)"""
+    
+    def __init__(self, reason, message, details=None):
+        super().__init__(reason, message, details)
+        self.reason = reason
+        self.message = message
+        self.details = details  # 오류 메시지에 함께 담을 추가 정보
+    
+    @property
+    def error_code(self):
+        """결과/오류 메시지에 담는 오류 코드 (CANCELLED, TIMEOUT)"""
+        return self.reason.upper()
+    
+    def __str__(self):
+        return self.message
+
+
+class CancelToken:
+    """작업 하나의 취소 요청과 실행 기한 (작업 함수가 단계 사이에서 check()로 확인)
+    
+    취소 신호는 event로 전달되므로 프로세스 백엔드에서는 자식 프로세스와 공유되는 Manager Event를 쓴다.
+    기한은 실행이 시작될 때(start) 벽시계 기준으로 정해져 자식 프로세스에서도 그대로 비교할 수 있다.
+    """
+    
+    def __init__(self, timeout=None, event=None):
+        self.timeout = timeout or None  # 초 단위 (None 또는 0이면 기한 없음)
+        self.deadline = None
+        self._event = event if event is not None else threading.Event()
+    
+    def start(self):
+        """실행 시작 시각 기준으로 기한 설정 (대기열에서 기다린 시간은 포함하지 않음)"""
+        if self.timeout:
+            self.deadline = time.time() + self.timeout
+    
+    def cancel(self):
+        """취소 요청 (실행 중인 작업은 다음 확인 지점에서 멈춤)"""
+        self._event.set()
+    
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+    
+    @property
+    def expired(self):
+        return self.deadline is not None and time.time() >= self.deadline
+    
+    def check(self):
+        """취소되었거나 기한을 넘겼으면 JobCancelled 발생"""
+        if self.expired:
+            raise JobCancelled("timeout", f"작업 시간 제한 초과 ({self.timeout:g}초)", {'timeoutSeconds': self.timeout})
+        if self._event.is_set():
+            raise JobCancelled("cancelled", "작업이 취소됨")
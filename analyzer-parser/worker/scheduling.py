@@ -0,0 +1,57 @@
+import heapq
+import itertools
+import queue
+import time
+
+class TaskQueue(queue.Queue):
+    """정책에 따라 다음에 실행할 작업을 고르는 작업 대기열 (queue.Queue와 같은 put/get/qsize 인터페이스)
+    
+    fifo: 제출 순서대로 실행
+    sjf: 예상 비용(task.cost)이 작은 작업부터 실행
+    weighted: 예상 비용을 작업 가중치(task.weight)로 나눈 값이 작은 작업부터 실행
+    
+    sjf/weighted는 기다린 초마다 비용을 aging_rate만큼 깎아 큰 작업도 결국 실행되도록 한다.
+    감소량이 대기 시간에 비례하므로 (비용 + aging_rate * 제출 시각)을 고정 우선순위로 쓰면 된다.
+    """
+    
+    POLICIES = ("fifo", "sjf", "weighted")
+    
+    def __init__(self, maxsize=0, policy="fifo", aging_rate=0.0, default_cost=0.0, clock=time.monotonic):
+        if policy not in self.POLICIES:
+            raise ValueError(f"지원하지 않는 대기열 정책: {policy}")
+        self.policy = policy
+        self.aging_rate = aging_rate
+        self.default_cost = default_cost  # 비용을 알 수 없는 작업(클레임 체크 참조 등)의 비용
+        self.clock = clock
+        super().__init__(maxsize)
+    
+    def priority(self, task):
+        """작은 값이 먼저 실행됨 (같으면 제출 순서)"""
+        if task is None:
+            # 종료 신호는 바로 꺼냄
+            return float('-inf')
+        if self.policy == "fifo":
+            return 0
+        cost = task.cost if task.cost is not None else self.default_cost
+        if self.policy == "weighted":
+            cost = cost / max(task.weight, 1e-9)
+        return cost + self.aging_rate * self.clock()
+    
+    # queue.Queue가 잠금을 잡은 상태에서 호출하는 저장소 함수들
+    def _init(self, maxsize):
+        self.queue = []
+        self._sequence = itertools.count()
+    
+    def _qsize(self):
+        return len(self.queue)
+    
+    def _put(self, task):
+        heapq.heappush(self.queue, (self.priority(task), next(self._sequence), task))
+    
+    def _get(self):
+        return heapq.heappop(self.queue)[-1]
+
+
+def estimate_cost(uncompressed_bytes, java_files, java_file_cost):
+    """업로드 분석 비용 추정 (바이트 단위, Java 파일마다 java_file_cost 바이트를 더함)"""
+    return uncompressed_bytes + java_files * java_file_cost
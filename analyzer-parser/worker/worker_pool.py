@@ -1,43 +1,102 @@
 import logging
 import concurrent.futures
+import multiprocessing
 import queue
 import threading
 import time
+from concurrent.futures.process import BrokenProcessPool
+from metrics.histogram import Histogram
+from .cancellation import CancelToken
+from .scheduling import TaskQueue
 
 logger = logging.getLogger("worker.pool")
 
 class Task:
     """작업 정보를 담는 클래스"""
-    def __init__(self, task_id, func, args=None, kwargs=None):
+    def __init__(self, task_id, func, args=None, kwargs=None, callback=None, cost=None, weight=1.0,
+                 cancel_token=None):
         self.task_id = task_id
         self.func = func
         self.args = args or ()
         self.kwargs = kwargs or {}
+        self.callback = callback  # 완료 시 부모 프로세스에서 호출: callback(task_id, result, error)
+        self.cost = cost  # 대기열 정책이 사용하는 예상 비용 (None이면 알 수 없음)
+        self.weight = weight  # weighted 정책에서 비용을 나누는 가중치 (클수록 먼저 실행)
         self.result = None
         self.error = None
-        self.status = "pending"  # pending, running, completed, failed
+        self.status = "pending"  # pending, running, completed, failed, superseded, cancelled
+        self.cancel_requested = False  # 더 새로운 작업으로 대체되어 결과가 필요 없는 실행 중 작업
+        self.cancel_token = cancel_token  # 작업 함수와 공유하는 취소 요청/실행 기한 (CancelToken)
         self.start_time = None
         self.end_time = None
 
 class WorkerPool:
-    """스레드 기반 작업자 풀 구현"""
-    def __init__(self, max_workers=4, queue_size=100):
+    """작업자 풀 구현
+    
+    backend="thread"는 스레드에서, backend="process"는 자식 프로세스에서 작업을 실행한다.
+    프로세스 백엔드에서는 작업 함수와 인자, 반환값이 pickle 가능해야 하며
+    완료 콜백은 항상 부모 프로세스에서 실행된다.
+    대기 중인 작업의 실행 순서는 queue_policy(fifo, sjf, weighted)로 정한다 (TaskQueue 참고).
+    
+    coalesce가 "off"가 아니면 같은 task_id(프로젝트)는 한 번에 하나만 대기/실행한다.
+    대기 중인 작업은 새 작업으로 대체되고, 실행 중이면 새 작업은 끝날 때까지 보류된다.
+    "cancel"이면 실행 중인 이전 작업의 결과를 버린다 (대체된 작업의 콜백은 superseded 결과를 받음).
+    
+    create_cancel_token()으로 만든 토큰을 submit(cancel_token=...)에 넘기면 작업 함수가 cancel_token 인자로 받아
+    확인 지점마다 취소/기한 초과를 확인한다. cancel(task_id)는 대기 중인 작업을 바로 취소하고
+    실행 중인 작업에는 취소를 요청한다 (작업 함수가 다음 확인 지점에서 멈추고 결과를 반환해야 슬롯이 반환됨).
+    """
+    BACKENDS = ("thread", "process")
+    COALESCE_MODES = ("off", "wait", "cancel")
+    
+    def __init__(self, max_workers=4, queue_size=100, backend="thread", max_tasks_per_child=None,
+                 queue_policy="fifo", aging_rate=0.0, default_cost=0.0, coalesce="off"):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"지원하지 않는 작업자 풀 백엔드: {backend}")
+        if coalesce not in self.COALESCE_MODES:
+            raise ValueError(f"지원하지 않는 중복 작업 처리 방식: {coalesce}")
+        
         self.max_workers = max_workers
-        self.task_queue = queue.Queue(maxsize=queue_size)
+        self.backend = backend
+        self.max_tasks_per_child = max_tasks_per_child or None
+        self.task_queue = TaskQueue(
+            maxsize=queue_size, policy=queue_policy, aging_rate=aging_rate, default_cost=default_cost
+        )
         self.tasks = {}  # task_id -> Task
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        self.executor = None
+        # 완료 콜백(결과 발행 등)을 실행하는 부모 프로세스 쪽 스레드
+        self.callback_executor = None
         self.is_running = False
         self.worker_thread = None
+        # 실행 중인 작업 수를 max_workers로 제한하는 슬롯 (완료 콜백에서 반환)
+        self.slots = threading.Semaphore(max_workers)
+        # 실행기 교체와 작업 제출이 겹치지 않도록 보호
+        self.executor_lock = threading.Lock()
+        
+        # 중복 작업 병합 상태 (coalesce_lock으로 보호)
+        self.coalesce = coalesce
+        self.active = {}  # task_id -> 대기열에 있거나 실행 중인 작업
+        self.held = {}  # task_id -> 같은 작업이 실행 중이라 보류된 최신 작업
+        self.stale_queued = 0  # 대체되어 대기열에서 건너뛸 작업 수
+        self.coalesce_lock = threading.Lock()
+        
+        # 프로세스 백엔드에서 자식 프로세스와 취소 신호를 공유하는 관리자 프로세스 (start에서 생성)
+        self.cancel_manager = None
         
         # 통계 정보
         self.stats = {
             "submitted": 0,
             "completed": 0,
             "failed": 0,
+            "running": 0,
+            "superseded": 0,
+            "cancelled": 0,
             "avg_processing_time": 0,
             "total_processing_time": 0
         }
         self.stats_lock = threading.Lock()
+        # 작업 처리 시간 분포 (성공/실패 모두, 초 단위)
+        self.duration_histogram = Histogram()
     
     def start(self):
         """작업자 풀 시작"""
@@ -45,89 +104,288 @@ class WorkerPool:
             logger.warning("작업자 풀이 이미 실행 중입니다")
             return
             
+        self.executor = self._create_executor()
+        if self.backend == "process":
+            self.cancel_manager = multiprocessing.Manager()
+        self.callback_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="worker-callback"
+        )
+        
+        self.slots = threading.Semaphore(self.max_workers)
         self.is_running = True
-        self.worker_thread = threading.Thread(target=self._process_tasks, daemon=True)
+        self.worker_thread = threading.Thread(target=self._dispatch_tasks, daemon=True)
         self.worker_thread.start()
-        logger.info(f"작업자 풀 시작됨 (max_workers={self.max_workers})")
+        logger.info(f"작업자 풀 시작됨 (backend={self.backend}, max_workers={self.max_workers})")
+    
+    def _create_executor(self):
+        """백엔드에 맞는 실행기 생성"""
+        if self.backend == "process":
+            options = {}
+            if self.max_tasks_per_child:
+                # 일정 개수의 작업을 처리한 자식 프로세스는 교체하여 메모리 증가 방지
+                options['max_tasks_per_child'] = self.max_tasks_per_child
+            return concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers, **options)
+        
+        return concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers)
     
-    def _process_tasks(self):
-        """작업 대기열에서 작업을 가져와 실행"""
-        futures = {}  # future -> task_id
+    def _finish_task(self, task):
+        """완료 콜백을 부모 프로세스의 콜백 스레드에서 실행"""
+        if not task.callback:
+            return
+        
+        def run_callback():
+            try:
+                task.callback(task.task_id, task.result, task.error)
+            except Exception as e:
+                logger.error(f"Task {task.task_id} 완료 콜백 오류: {str(e)}", exc_info=True)
         
+        self.callback_executor.submit(run_callback)
+    
+    def _dispatch_tasks(self):
+        """작업자 여유가 생기면 대기열의 작업을 즉시 실행기에 제출 (폴링 없이 블로킹 대기)"""
         while self.is_running:
             try:
-                # 처리 완료된 Future 확인 및 정리
-                done_futures = [f for f in futures.keys() if f.done()]
-                for future in done_futures:
-                    task_id = futures.pop(future)
-                    task = self.tasks.get(task_id)
-                    
-                    if task:
-                        task.end_time = time.time()
-                        try:
-                            task.result = future.result()
-                            task.status = "completed"
-                            
-                            # 통계 업데이트
-                            with self.stats_lock:
-                                self.stats["completed"] += 1
-                                processing_time = task.end_time - task.start_time
-                                self.stats["total_processing_time"] += processing_time
-                                self.stats["avg_processing_time"] = (
-                                    self.stats["total_processing_time"] / self.stats["completed"]
-                                )
-                                
-                            logger.info(f"Task {task_id} 완료: {processing_time:.2f}초 소요")
-                        except Exception as e:
-                            task.error = str(e)
-                            task.status = "failed"
-                            
-                            # 통계 업데이트
-                            with self.stats_lock:
-                                self.stats["failed"] += 1
-                                
-                            logger.error(f"Task {task_id} 실패: {str(e)}")
+                # 빈 작업자 슬롯 확보 (작업 완료 콜백에서 반환됨)
+                self.slots.acquire()
+                if not self.is_running:
+                    break
                 
-                # 작업자 여유 공간 확인
-                available_workers = self.max_workers - len(futures)
+                # 새 작업이 들어올 때까지 대기
+                task = self.task_queue.get()
+                if task is None or not self.is_running:
+                    break
                 
-                # 새 작업 제출 (가능한 만큼)
-                for _ in range(min(available_workers, self.task_queue.qsize())):
-                    task = self.task_queue.get_nowait()
-                    
-                    task.start_time = time.time()
-                    task.status = "running"
-                    
-                    # 작업 제출
-                    future = self.executor.submit(
-                        task.func, *task.args, **task.kwargs
+                if not self._mark_running(task):
+                    # 대기 중에 새 작업으로 대체된 작업은 실행하지 않음
+                    self.slots.release()
+                    continue
+                
+                self._start_task(task)
+                
+            except Exception as e:
+                logger.error(f"작업 처리 중 오류 발생: {str(e)}", exc_info=True)
+    
+    def _mark_running(self, task):
+        """대기열에서 꺼낸 작업을 실행 상태로 표시 (이미 대체된 작업이면 False)"""
+        with self.coalesce_lock:
+            if task.status in ("superseded", "cancelled"):
+                self.stale_queued -= 1
+                return False
+            task.status = "running"
+            return True
+    
+    def _start_task(self, task):
+        """작업을 실행기에 제출하고 완료 콜백 등록"""
+        task.start_time = time.time()
+        task.status = "running"
+        if task.cancel_token:
+            # 실행 기한은 대기열에서 꺼낸 시점부터 계산
+            task.cancel_token.start()
+        with self.stats_lock:
+            self.stats["running"] += 1
+        
+        executor = None
+        try:
+            with self.executor_lock:
+                executor = self.executor
+                try:
+                    future = executor.submit(task.func, *task.args, **task.kwargs)
+                except BrokenProcessPool:
+                    self._replace_broken_executor()
+                    executor = self.executor
+                    future = executor.submit(task.func, *task.args, **task.kwargs)
+        except Exception as e:
+            # 제출 자체가 실패하면 작업 실패로 처리하고 슬롯 반환
+            self._complete_task(task, executor, error=e)
+            return
+        
+        logger.debug(f"Task {task.task_id} 실행 시작")
+        future.add_done_callback(
+            lambda done, task=task, executor=executor: self._on_future_done(task, executor, done)
+        )
+    
+    def _on_future_done(self, task, executor, future):
+        """Future 완료 시 호출 (실행기 내부 스레드에서 실행됨)"""
+        try:
+            result = future.result()
+        except Exception as e:
+            self._complete_task(task, executor, error=e)
+        else:
+            self._complete_task(task, executor, result=result)
+    
+    def _complete_task(self, task, executor, result=None, error=None):
+        """작업 상태와 통계를 갱신하고 슬롯을 반환한 뒤 완료 콜백 실행"""
+        try:
+            task.end_time = time.time()
+            processing_time = task.end_time - task.start_time
+            self.duration_histogram.observe(processing_time)
+            with self.stats_lock:
+                self.stats["running"] -= 1
+            interrupted = self._interrupted_code(result) if error is None else None
+            
+            if task.cancel_requested and not isinstance(error, BrokenProcessPool):
+                # 더 새로운 작업으로 대체된 실행 - 결과를 버림
+                self._supersede(task)
+                logger.info(f"Task {task.task_id} 실행 결과 폐기 (새 작업으로 대체됨): {processing_time:.2f}초 소요")
+            elif interrupted == "CANCELLED":
+                # 실행 중 취소되어 작업 함수가 중단 결과를 반환한 경우 (콜백은 결과를 받아 오류로 발행)
+                task.result = result
+                task.status = "cancelled"
+                with self.stats_lock:
+                    self.stats["cancelled"] += 1
+                logger.info(f"Task {task.task_id} 실행 중 취소됨: {processing_time:.2f}초 소요")
+            elif interrupted == "TIMEOUT":
+                # task.error는 콜백에 그대로 전달되므로 비워 두어 errorCode가 담긴 결과가 발행되도록 함
+                task.result = result
+                task.status = "failed"
+                with self.stats_lock:
+                    self.stats["failed"] += 1
+                logger.error(f"Task {task.task_id} 실행 기한 초과: {result.get('error')}")
+            elif error is None:
+                task.result = result
+                task.status = "completed"
+                
+                # 통계 업데이트
+                with self.stats_lock:
+                    self.stats["completed"] += 1
+                    self.stats["total_processing_time"] += processing_time
+                    self.stats["avg_processing_time"] = (
+                        self.stats["total_processing_time"] / self.stats["completed"]
                     )
-                    futures[future] = task.task_id
                     
-                    logger.debug(f"Task {task.task_id} 실행 시작")
-                    
-                # 잠시 대기
-                time.sleep(0.1)
+                logger.info(f"Task {task.task_id} 완료: {processing_time:.2f}초 소요")
+            else:
+                task.error = str(error) or type(error).__name__
+                task.status = "failed"
+                
+                # 통계 업데이트
+                with self.stats_lock:
+                    self.stats["failed"] += 1
                     
-            except queue.Empty:
-                # 대기열이 비어있으면 잠시 대기
-                time.sleep(0.5)
-            except Exception as e:
-                logger.error(f"작업 처리 중 오류 발생: {str(e)}", exc_info=True)
-                time.sleep(1)
+                logger.error(f"Task {task.task_id} 실패: {task.error}")
+                
+                # 자식 프로세스가 비정상 종료되면 실행기를 다시 생성
+                if isinstance(error, BrokenProcessPool):
+                    with self.executor_lock:
+                        if executor is self.executor and self.is_running:
+                            self._replace_broken_executor()
+        finally:
+            self.slots.release()
+        
+        self._finish_task(task)
+        if self.coalesce != "off":
+            self._release_held(task)
+    
+    @staticmethod
+    def _interrupted_code(result):
+        """취소 토큰으로 중단된 작업이 반환한 결과의 오류 코드 (CANCELLED, TIMEOUT, 아니면 None)"""
+        if isinstance(result, dict) and result.get('error_code') in ("CANCELLED", "TIMEOUT"):
+            return result['error_code']
+        return None
+    
+    def _replace_broken_executor(self):
+        """손상된 프로세스 풀 교체 (executor_lock을 잡은 상태에서 호출)"""
+        logger.warning("자식 프로세스가 비정상 종료되어 프로세스 풀을 다시 생성합니다")
+        broken_executor = self.executor
+        self.executor = self._create_executor()
+        broken_executor.shutdown(wait=False)
+    
+    def _supersede(self, task):
+        """대체된 작업 표시 (콜백은 superseded 결과를 받아 결과 발행 없이 메시지만 정리)"""
+        task.status = "superseded"
+        task.result = {'success': False, 'superseded': True, 'error': "새 작업으로 대체됨"}
+        task.error = None
+        with self.stats_lock:
+            self.stats["superseded"] += 1
+    
+    def _release_held(self, task):
+        """끝난 작업 대신 보류해 둔 같은 task_id의 최신 작업을 대기열에 넣음"""
+        with self.coalesce_lock:
+            if self.active.get(task.task_id) is not task:
+                return
+            held = self.held.pop(task.task_id, None)
+            if held is None:
+                del self.active[task.task_id]
+                return
+            self.active[task.task_id] = held
+            try:
+                self.task_queue.put(held, block=False)
+                logger.info(f"Task {task.task_id} 보류된 새 작업 대기열에 추가됨")
+                return
+            except queue.Full:
+                del self.active[task.task_id]
+        
+        logger.error(f"작업 대기열이 가득 찼습니다. 보류된 Task {task.task_id} 거부됨")
+        held.end_time = time.time()
+        held.error = "작업 대기열이 가득 찼습니다"
+        held.status = "failed"
+        with self.stats_lock:
+            self.stats["failed"] += 1
+        self._finish_task(held)
+    
+    def _submit_coalesced(self, task):
+        """같은 task_id의 작업이 있으면 대체하거나 보류 (대체된 작업은 호출한 쪽에서 완료 처리)"""
+        with self.coalesce_lock:
+            current = self.active.get(task.task_id)
+            if current is None:
+                self.task_queue.put(task, block=False)
+                self.active[task.task_id] = task
+                logger.info(f"Task {task.task_id} 대기열에 추가됨")
+                return None
+            
+            if current.status == "pending":
+                # 대기 중인 이전 작업은 실행하지 않고 새 작업으로 대체
+                self.task_queue.put(task, block=False)
+                self.active[task.task_id] = task
+                self.stale_queued += 1
+                self._supersede(current)
+                logger.info(f"Task {task.task_id} 대기 중인 이전 작업을 새 작업으로 대체")
+                return current
+            
+            # 실행 중이면 같은 디렉토리를 동시에 쓰지 않도록 끝날 때까지 보류 (이전 보류 작업은 대체)
+            if self.coalesce == "cancel" and not current.cancel_requested:
+                current.cancel_requested = True
+                if current.cancel_token:
+                    current.cancel_token.cancel()
+                logger.info(f"Task {task.task_id} 실행 중인 이전 작업 결과를 버리도록 표시")
+            previous = self.held.get(task.task_id)
+            self.held[task.task_id] = task
+            logger.info(f"Task {task.task_id} 이전 작업이 실행 중이라 보류됨")
+            if previous:
+                self._supersede(previous)
+            return previous
     
-    def submit(self, task_id, func, *args, **kwargs):
-        """새 작업 제출"""
+    def submit(self, task_id, func, *args, callback=None, cost=None, weight=1.0, cancel_token=None, **kwargs):
+        """새 작업 제출
+        
+        callback이 주어지면 작업 종료 후 callback(task_id, result, error) 호출,
+        cost/weight는 대기열 정책이 실행 순서를 정하는 데 사용,
+        cancel_token이 주어지면 작업 함수에 cancel_token 키워드 인자로 전달
+        """
         if not self.is_running:
             raise RuntimeError("작업자 풀이 실행 중이 아닙니다")
-            
-        task = Task(task_id, func, args, kwargs)
-        self.tasks[task_id] = task
+        
+        if cancel_token is not None:
+            kwargs['cancel_token'] = cancel_token
+        task = Task(task_id, func, args, kwargs, callback, cost, weight, cancel_token)
         
         # 통계 업데이트
         with self.stats_lock:
             self.stats["submitted"] += 1
         
+        if self.coalesce != "off":
+            try:
+                superseded = self._submit_coalesced(task)
+            except queue.Full:
+                logger.error(f"작업 대기열이 가득 찼습니다. Task {task_id} 거부됨")
+                raise RuntimeError("작업 대기열이 가득 찼습니다")
+            self.tasks[task_id] = task
+            if superseded:
+                superseded.end_time = time.time()
+                self._finish_task(superseded)
+            return task_id
+        
+        self.tasks[task_id] = task
         try:
             self.task_queue.put(task, block=False)
             logger.info(f"Task {task_id} 대기열에 추가됨")
@@ -137,6 +395,56 @@ class WorkerPool:
             self.tasks.pop(task_id)
             raise RuntimeError("작업 대기열이 가득 찼습니다")
     
+    def create_cancel_token(self, timeout=None):
+        """백엔드에 맞는 취소 토큰 생성 (timeout초가 지나면 기한 초과, None 또는 0이면 제한 없음)"""
+        if self.cancel_manager is not None:
+            return CancelToken(timeout, self.cancel_manager.Event())
+        return CancelToken(timeout)
+    
+    def cancel(self, task_id):
+        """task_id 작업 취소 (취소할 작업이 없으면 False)
+        
+        대기 중이거나 보류된 작업은 실행하지 않고 콜백에 cancelled 결과를 전달하며,
+        실행 중인 작업에는 취소 토큰으로 중단을 요청한다.
+        """
+        cancelled = []
+        requested = False
+        with self.coalesce_lock:
+            if self.coalesce != "off":
+                task = self.active.get(task_id)
+                held = self.held.pop(task_id, None)
+                if held:
+                    cancelled.append(held)
+            else:
+                task = self.tasks.get(task_id)
+            
+            if task is not None and task.status == "pending":
+                # 대기열에 남은 작업은 분배 스레드가 꺼낼 때 건너뜀
+                self.stale_queued += 1
+                if self.active.get(task_id) is task:
+                    del self.active[task_id]
+                cancelled.append(task)
+            elif task is not None and task.status == "running" and task.cancel_token:
+                task.cancel_token.cancel()
+                requested = True
+            
+            for cancelled_task in cancelled:
+                cancelled_task.status = "cancelled"
+                cancelled_task.result = {
+                    'success': False, 'cancelled': True, 'error': "작업이 취소됨", 'error_code': "CANCELLED"
+                }
+        
+        if cancelled:
+            with self.stats_lock:
+                self.stats["cancelled"] += len(cancelled)
+        for cancelled_task in cancelled:
+            cancelled_task.end_time = time.time()
+            logger.info(f"Task {task_id} 실행 전에 취소됨")
+            self._finish_task(cancelled_task)
+        if requested:
+            logger.info(f"Task {task_id} 실행 중인 작업에 취소 요청")
+        return bool(cancelled) or requested
+    
     def get_task_status(self, task_id):
         """특정 작업의 상태 확인"""
         task = self.tasks.get(task_id)
@@ -153,9 +461,11 @@ class WorkerPool:
         }
     
     def get_stats(self):
-        """작업자 풀 통계 반환"""
+        """작업자 풀 통계 반환 (대기열에 쌓인 작업 수 포함)"""
         with self.stats_lock:
-            return dict(self.stats)
+            stats = dict(self.stats)
+        stats["queued"] = self.task_queue.qsize() - self.stale_queued
+        return stats
     
     def stop(self):
         """작업자 풀 중지"""
@@ -164,11 +474,22 @@ class WorkerPool:
             
         self.is_running = False
         
+        # 슬롯 또는 대기열에서 블로킹 중인 분배 스레드 깨우기
+        self.slots.release()
+        try:
+            self.task_queue.put_nowait(None)
+        except queue.Full:
+            pass
+        
         # 스레드 종료 대기
         if self.worker_thread and self.worker_thread.is_alive():
             self.worker_thread.join(timeout=5.0)
         
         # 작업자 풀 종료
         self.executor.shutdown(wait=False)
+        self.callback_executor.shutdown(wait=False)
+        if self.cancel_manager is not None:
+            self.cancel_manager.shutdown()
+            self.cancel_manager = None
         
         logger.info("작업자 풀이 종료되었습니다")
\ No newline at end of file